@@ -1,14 +1,26 @@
+import argparse
+import json
+import math
+import sys
 import time
 
+try:
+    import tomllib
+except ModuleNotFoundError: # Python < 3.11
+    tomllib = None
+
+from flight import (
+    FIXED_ROCKET_DRY_MASS_KG, FIXED_INITIAL_FUEL_MASS_KG, MASS_PER_ASTRONAUT_KG,
+    METHODS, RESULT_FIELDS, check_inputs, flight_steps, simulate_batch,
+)
+from termframe import FrameBuffer, Timeline, write_asciicast
+
 # Define color constants using ANSI escape codes
 GREEN_ON_BLACK = '\033[1;32;40m'
 RESET = '\033[0m'
 RED_ON_BLACK = '\033[1;31;40m' # for error messages
-
-# Define fixed simulation constants
-FIXED_ROCKET_DRY_MASS_KG = 500.0 # The structural weight of the rocket
-FIXED_INITIAL_FUEL_MASS_KG = 2000.0 # The initial weight of the fuel
-MASS_PER_ASTRONAUT_KG = 80.0 # Average mass including gear
+YELLOW_ON_BLACK = '\033[1;33;40m'
+MAGENTA_ON_BLACK = '\033[1;35;40m'
 
 # Default values for user inputs
 DEFAULT_ASTRONAUTS = 3
@@ -17,6 +29,21 @@ DEFAULT_FUEL_BURN = 50.0
 DEFAULT_TIME_STEP = 0.5
 DEFAULT_SIM_DURATION = 120.0
 
+# Multiplier on every animation hold; 0 plays straight through without waiting
+ANIMATION_TIME_SCALE = 1.0
+
+# Keys of a scripted run configuration and their defaults
+CONFIG_DEFAULTS = {
+    'astronauts': DEFAULT_ASTRONAUTS,
+    'thrust': DEFAULT_THRUST,
+    'fuel_burn': DEFAULT_FUEL_BURN,
+    'time_step': DEFAULT_TIME_STEP,
+    'duration': DEFAULT_SIM_DURATION,
+    'method': 'euler',
+    'coast': False,
+}
+CONFIG_FIELDS = ('astronauts', 'thrust', 'fuel_burn', 'time_step', 'duration')
+
 def input_with_default(prompt, default, value_type=float):
     """Get user input with a default value. Press Enter to accept default."""
     user_input = input(f'{prompt} [{default}]: ').strip()
@@ -28,258 +55,278 @@ def clear_screen():
     """Clears the terminal screen using ANSI escape codes."""
     print('\033[2J\033[H', end='')
 
-def launch_animation():
-    """Plays an EPIC multi-stage space adventure animation."""
-    hide_cursor()
-    
+# Static frames, composed once and reused by every playback
+LAUNCH_ROCKET = (
+    '    /\\    ',
+    '   |==|   ',
+    '   |  |   ',
+    '   |  |   ',
+    '   |  |   ',
+    '   |  |   ',
+    '   |==|   ',
+    '   /||\\   ',
+)
+MARS_SURFACE = (
+    '🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴',
+    '🏔️    🪨      🏔️    🪨      🏔️',
+)
+MARS_LANDED = (
+    *[''] * 5,
+    '              /\\',
+    '             |==|',
+    '             |  |',
+    '             |==|',
+    '             ████',
+    *MARS_SURFACE,
+    '',
+    GREEN_ON_BLACK + '🛬 SUCCESSFUL MARS LANDING! 🛬' + RESET,
+)
+FIRST_CONTACT = (
+    '',
+    GREEN_ON_BLACK + '═══ FIRST CONTACT ═══' + RESET,
+    '',
+    '🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴',
+    '',
+    '    🧑‍🚀                            👽',
+    '   /|\\                            /|\\',
+    '   / \\                            / \\',
+    '',
+    '🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴',
+    '',
+    '   👽: "GREETINGS EARTHLING... PREPARE TO BE PROBED!"',
+)
+ALIEN_SHOT = (
+    '',
+    RED_ON_BLACK + '═══ NOT TODAY, ALIEN! ═══' + RESET,
+    '',
+    '🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴',
+    '',
+    '    🧑‍🚀 ―――――💥💥💥―――――――→  👽',
+    '   /|\\        PEW PEW!        /|\\',
+    '   / \\                        / \\',
+    '',
+    '🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴',
+    '',
+    '   🧑‍🚀: "SAY HELLO TO MY LITTLE FRIEND!"',
+)
+WORMHOLE_FRAMES = (
+    '        ○        ',
+    '       (○)       ',
+    '      ((○))      ',
+    '     (((○)))     ',
+    '    ((((○))))    ',
+    '   (((( ⭕ ))))   ',
+    '  ((((  🌀  )))) ',
+    ' (((((  🌀  )))))',
+    '((((((  🌀  ))))))',
+)
+TRIPPY = ('🌀', '🌌', '✨', '💫', '⭐', '🔮', '💜', '🟣')
+VIANNEY = (
+    '',
+    YELLOW_ON_BLACK + '════════════════════════════════════════' + RESET,
+    YELLOW_ON_BLACK + '     WELCOME TO VIANNEY HIGH SCHOOL     ' + RESET,
+    YELLOW_ON_BLACK + '════════════════════════════════════════' + RESET,
+    '',
+    '              🏫🏫🏫🏫🏫',
+    '             |  VIANNEY  |',
+    '             | HIGH SCHOOL|',
+    '             |  ▓▓  ▓▓  |',
+    '             |  ▓▓  ▓▓  |',
+    '             |    🚪    |',
+    '        🌳   ████████████   🌳',
+    '      🌳🌳  ════════════════  🌳🌳',
+    '',
+    '                 🧑‍🚀',
+    '                /|\\',
+    '                / \\',
+    '',
+    '═══════════════════════════════════════',
+)
+VIANNEY_DIALOGUE = (
+    (('', '   🧑‍🚀: "Yo... is this... VIANNEY?!"'), 1.5),
+    (('   🧑‍🚀: "I just shot an alien on Mars..."',), 1.5),
+    (('   🧑‍🚀: "Went through a WORMHOLE..."',), 1.5),
+    (('   🧑‍🚀: "And ended up at HIGH SCHOOL?!"',), 1.5),
+    (('', YELLOW_ON_BLACK + '   🔔 RING RING! Time for class! 📚' + RESET), 2),
+)
+MISSION_COMPLETE = (
+    *[''] * 4,
+    *(GREEN_ON_BLACK + line + RESET for line in (
+        '╔══════════════════════════════════════════╗',
+        '║                                          ║',
+        '║   🚀 MISSION COMPLETE 🚀                 ║',
+        '║                                          ║',
+        '║   ✅ Launched from Earth                 ║',
+        '║   ✅ Landed on Mars                      ║',
+        '║   ✅ Eliminated hostile alien            ║',
+        '║   ✅ Traversed wormhole                  ║',
+        '║   ✅ Arrived at Vianney High School      ║',
+        '║                                          ║',
+        '║        🧑‍🚀 YOU ARE A LEGEND 🧑‍🚀           ║',
+        '║                                          ║',
+        '╚══════════════════════════════════════════╝',
+    )),
+    *[''] * 3,
+)
+CRASH_FRAMES = tuple(tuple(' ' * 40 + line for line in frame) for frame in (
+    (
+        '  /\\  ',
+        ' |XX| ',
+        ' |  | ',
+        ' |  | ',
+        ' |==| ',
+        ' ||  ',
+        ' 💨  ',
+    ),
+    (
+        '  /\\  ',
+        ' |XX| ',
+        ' |  | ',
+        ' |==| ',
+        ' ||  ',
+        ' 💨💨 ',
+    ),
+    (
+        '  💥  ',
+        ' 💥💥 ',
+        ' 💨💨💨 ',
+    ),
+))
+
+def launch_frames():
+    """Yields the EPIC multi-stage space adventure as (frame lines, seconds to hold) pairs."""
     # ===== STAGE 1: LAUNCH INTO SPACE =====
     width = 40
     height = 20
-    rocket = [
-        '    /\\    ',
-        '   |==|   ',
-        '   |  |   ',
-        '   |  |   ',
-        '   |  |   ',
-        '   |  |   ',
-        '   |==|   ',
-        '   /||\\   ',
-    ]
     flame_frames = ['  🔥🔥  ', ' 🔥🔥🔥 ', '🔥🔥🔥🔥']
-    
+
     for y in range(height):
-        clear_screen()
-        for _ in range(height - y):
-            print(' ' * width + '✨')
-        for line in rocket:
-            print(' ' * (width - 5) + line)
-        print(' ' * (width - 5) + flame_frames[y % len(flame_frames)])
-        time.sleep(0.12)
-    
-    print('\n' + GREEN_ON_BLACK + '🚀 LEAVING EARTH ATMOSPHERE... 🚀' + RESET)
-    time.sleep(1.5)
-    
+        frame = [' ' * width + '✨'] * (height - y)
+        frame += [' ' * (width - 5) + line for line in LAUNCH_ROCKET]
+        frame.append(' ' * (width - 5) + flame_frames[y % len(flame_frames)])
+        yield frame, 0.12
+
+    yield frame + ['', GREEN_ON_BLACK + '🚀 LEAVING EARTH ATMOSPHERE... 🚀' + RESET], 1.5
+
     # ===== STAGE 2: SPACE TRAVEL TO MARS =====
-    space_rocket = ['    🚀']
     for i in range(15):
-        clear_screen()
-        print('\n' * 3)
-        print(GREEN_ON_BLACK + '        ═══ INTERPLANETARY TRAVEL ═══' + RESET)
-        print('\n')
         stars = ''.join(['✨' if (i + j) % 4 == 0 else '  ' if (i + j) % 3 == 0 else ' ·' for j in range(25)])
-        print('  ' + stars)
-        print('  ' + stars[::-1])
-        print('\n')
         trail = '· · · · ·' if i % 2 == 0 else ' · · · ·'
-        print(' ' * (i * 3) + trail + ' 🚀💨')
-        print('\n')
-        print('  ' + stars)
-        print('  ' + stars[::-1])
-        print('\n')
-        print(f'        Distance to Mars: {225 - (i * 15):,} million km')
-        time.sleep(0.2)
-    
-    print('\n' + RED_ON_BLACK + '🔴 MARS APPROACH DETECTED 🔴' + RESET)
-    time.sleep(1.5)
-    
+        frame = [''] * 4 + [GREEN_ON_BLACK + '        ═══ INTERPLANETARY TRAVEL ═══' + RESET]
+        frame += [''] * 2 + ['  ' + stars, '  ' + stars[::-1]]
+        frame += [''] * 2 + [' ' * (i * 3) + trail + ' 🚀💨']
+        frame += [''] * 2 + ['  ' + stars, '  ' + stars[::-1]]
+        frame += [''] * 2 + [f'        Distance to Mars: {225 - (i * 15):,} million km']
+        yield frame, 0.2
+
+    yield frame + ['', RED_ON_BLACK + '🔴 MARS APPROACH DETECTED 🔴' + RESET], 1.5
+
     # ===== STAGE 3: LANDING ON MARS =====
-    mars_surface = [
-        '🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴',
-        '🏔️    🪨      🏔️    🪨      🏔️',
-    ]
-    
     for y in range(10, 0, -1):
-        clear_screen()
-        print('\n' * y)
-        print('              /\\')
-        print('             |==|')
-        print('             |  |')
-        print('             |==|')
-        print('             🔥🔥' if y > 1 else '             💨💨')
-        print('\n' * (10 - y))
-        for line in mars_surface:
-            print(line)
-        time.sleep(0.2)
-    
-    clear_screen()
-    print('\n' * 4)
-    print('              /\\')
-    print('             |==|')
-    print('             |  |')
-    print('             |==|')
-    print('             ████')
-    for line in mars_surface:
-        print(line)
-    print('\n' + GREEN_ON_BLACK + '🛬 SUCCESSFUL MARS LANDING! 🛬' + RESET)
-    time.sleep(2)
-    
+        frame = [''] * (y + 1)
+        frame += ['              /\\', '             |==|', '             |  |', '             |==|']
+        frame.append('             🔥🔥' if y > 1 else '             💨💨')
+        frame += [''] * (11 - y)
+        frame += MARS_SURFACE
+        yield frame, 0.2
+
+    yield MARS_LANDED, 2
+
     # ===== STAGE 4: ASTRONAUT MEETS ALIEN =====
-    clear_screen()
-    print('\n' + GREEN_ON_BLACK + '═══ FIRST CONTACT ═══' + RESET + '\n')
-    print('🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴')
-    print('')
-    print('    🧑‍🚀                            👽')
-    print('   /|\\                            /|\\')
-    print('   / \\                            / \\')
-    print('')
-    print('🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴')
-    print('\n   👽: "GREETINGS EARTHLING... PREPARE TO BE PROBED!"')
-    time.sleep(2.5)
-    
+    yield FIRST_CONTACT, 2.5
+
     # ===== STAGE 5: ASTRONAUT SHOOTS ALIEN =====
-    clear_screen()
-    print('\n' + RED_ON_BLACK + '═══ NOT TODAY, ALIEN! ═══' + RESET + '\n')
-    print('🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴')
-    print('')
-    print('    🧑‍🚀 ―――――💥💥💥―――――――→  👽')
-    print('   /|\\        PEW PEW!        /|\\')
-    print('   / \\                        / \\')
-    print('')
-    print('🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴')
-    print('\n   🧑‍🚀: "SAY HELLO TO MY LITTLE FRIEND!"')
-    time.sleep(1.5)
-    
+    yield ALIEN_SHOT, 1.5
+
     # Alien explosion
+    explosions = ['💥', '🔥💥🔥', '✨💥✨']
     for i in range(3):
-        clear_screen()
-        print('\n' + RED_ON_BLACK + '═══ ALIEN ELIMINATED ═══' + RESET + '\n')
-        print('🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴')
-        print('')
-        explosions = ['💥', '🔥💥🔥', '✨💥✨']
-        print('    🧑‍🚀                        ' + explosions[i])
-        print('   /|\\                          ')
-        print('   / \\                          ')
-        print('')
-        print('🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴')
-        time.sleep(0.4)
-    
-    print('\n   🧑‍🚀: "GET REKT LMAOOO 😂"')
-    time.sleep(2)
-    
+        frame = [
+            '',
+            RED_ON_BLACK + '═══ ALIEN ELIMINATED ═══' + RESET,
+            '',
+            '🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴',
+            '',
+            '    🧑‍🚀                        ' + explosions[i],
+            '   /|\\                          ',
+            '   / \\                          ',
+            '',
+            '🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴',
+        ]
+        yield frame, 0.4
+
+    yield frame + ['', '   🧑‍🚀: "GET REKT LMAOOO 😂"'], 2
+
     # ===== STAGE 6: WORMHOLE APPEARS =====
-    clear_screen()
-    print('\n' + '\033[1;35;40m' + '═══ ANOMALY DETECTED ═══' + RESET + '\n')
-    time.sleep(1)
-    
-    wormhole_frames = [
-        ['        ○        '],
-        ['       (○)       '],
-        ['      ((○))      '],
-        ['     (((○)))     '],
-        ['    ((((○))))    '],
-        ['   (((( ⭕ ))))   '],
-        ['  ((((  🌀  )))) '],
-        [' (((((  🌀  )))))'],
-        ['((((((  🌀  ))))))'],
-    ]
-    
-    for frame in wormhole_frames:
-        clear_screen()
-        print('\n' + '\033[1;35;40m' + '═══ WORMHOLE OPENING ═══' + RESET + '\n')
-        print('\n' * 3)
-        for line in frame:
-            print('\033[1;35;40m' + '          ' + line + RESET)
-        print('\n' * 3)
-        time.sleep(0.3)
-    
-    print('\n   🧑‍🚀: "YOOO WHAT IS THAT?!"')
-    time.sleep(1.5)
-    
+    yield ['', MAGENTA_ON_BLACK + '═══ ANOMALY DETECTED ═══' + RESET], 1
+
+    for line in WORMHOLE_FRAMES:
+        frame = ['', MAGENTA_ON_BLACK + '═══ WORMHOLE OPENING ═══' + RESET, '']
+        frame += [''] * 4 + [MAGENTA_ON_BLACK + '          ' + line + RESET] + [''] * 4
+        yield frame, 0.3
+
+    yield frame + ['', '   🧑‍🚀: "YOOO WHAT IS THAT?!"'], 1.5
+
     # Astronaut enters wormhole
     for i in range(8):
-        clear_screen()
-        print('\n' + '\033[1;35;40m' + '═══ ENTERING WORMHOLE ═══' + RESET + '\n')
-        print('\n' * 2)
-        print('          ((((((  🌀  ))))))')
-        spaces = ' ' * (10 + i * 2)
-        if i < 7:
-            print(spaces + '🧑‍🚀💨')
-        else:
-            print('           🧑‍🚀 → 🌀')
-        print('\n' * 2)
-        swirl = '~*~' * (i + 1)
-        print('\033[1;35;40m' + '     ' + swirl + RESET)
-        time.sleep(0.25)
-    
+        frame = ['', MAGENTA_ON_BLACK + '═══ ENTERING WORMHOLE ═══' + RESET, '']
+        frame += [''] * 3 + ['          ((((((  🌀  ))))))']
+        frame.append(' ' * (10 + i * 2) + '🧑‍🚀💨' if i < 7 else '           🧑‍🚀 → 🌀')
+        frame += [''] * 3 + [MAGENTA_ON_BLACK + '     ' + '~*~' * (i + 1) + RESET]
+        yield frame, 0.25
+
     # Trippy wormhole travel
-    trippy = ['🌀', '🌌', '✨', '💫', '⭐', '🔮', '💜', '🟣']
     for i in range(12):
-        clear_screen()
-        print('\n' + '\033[1;35;40m' + '═══ INTERDIMENSIONAL TRAVEL ═══' + RESET + '\n')
+        frame = ['', MAGENTA_ON_BLACK + '═══ INTERDIMENSIONAL TRAVEL ═══' + RESET, '']
         for j in range(8):
-            row = ''.join([trippy[(i + j + k) % len(trippy)] + ' ' for k in range(15)])
-            print('  ' + row)
-        print('\n        🧑‍🚀 AAAAAAHHHHH!!!')
-        time.sleep(0.15)
-    
-    time.sleep(1)
-    
+            frame.append('  ' + ''.join([TRIPPY[(i + j + k) % len(TRIPPY)] + ' ' for k in range(15)]))
+        frame += ['', '        🧑‍🚀 AAAAAAHHHHH!!!']
+        yield frame, 0.15
+
+    yield frame, 1
+
     # ===== STAGE 7: ARRIVAL AT VIANNEY HIGH SCHOOL =====
-    clear_screen()
-    print('\n' + '\033[1;33;40m' + '═══ EXITING WORMHOLE ═══' + RESET + '\n')
-    time.sleep(1)
-    
+    yield ['', YELLOW_ON_BLACK + '═══ EXITING WORMHOLE ═══' + RESET], 1
+
     # Falling from sky
     for y in range(8):
-        clear_screen()
-        print('\n' * y)
-        print('                    🧑‍🚀')
-        print('                   💨💨')
-        print('\n' * (8 - y))
-        time.sleep(0.2)
-    
+        yield [''] * (y + 1) + ['                    🧑‍🚀', '                   💨💨'] + [''] * (9 - y), 0.2
+
     # Landing at Vianney
-    clear_screen()
-    print('\n' + '\033[1;33;40m' + '════════════════════════════════════════' + RESET)
-    print('\033[1;33;40m' + '     WELCOME TO VIANNEY HIGH SCHOOL     ' + RESET)
-    print('\033[1;33;40m' + '════════════════════════════════════════' + RESET)
-    print('')
-    print('              🏫🏫🏫🏫🏫')
-    print('             |  VIANNEY  |')
-    print('             | HIGH SCHOOL|')
-    print('             |  ▓▓  ▓▓  |')
-    print('             |  ▓▓  ▓▓  |')
-    print('             |    🚪    |')
-    print('        🌳   ████████████   🌳')
-    print('      🌳🌳  ════════════════  🌳🌳')
-    print('')
-    print('                 🧑‍🚀')
-    print('                /|\\')
-    print('                / \\')
-    print('')
-    print('═══════════════════════════════════════')
-    time.sleep(2)
-    
-    print('\n   🧑‍🚀: "Yo... is this... VIANNEY?!"')
-    time.sleep(1.5)
-    print('   🧑‍🚀: "I just shot an alien on Mars..."')
-    time.sleep(1.5)
-    print('   🧑‍🚀: "Went through a WORMHOLE..."')
-    time.sleep(1.5)
-    print('   🧑‍🚀: "And ended up at HIGH SCHOOL?!"')
-    time.sleep(1.5)
-    print('\n' + '\033[1;33;40m' + '   🔔 RING RING! Time for class! 📚' + RESET)
-    time.sleep(2)
-    
+    frame = list(VIANNEY)
+    yield frame, 2
+    for lines, seconds in VIANNEY_DIALOGUE:
+        frame = frame + list(lines)
+        yield frame, seconds
+
     # Final screen
-    clear_screen()
-    print('\n' * 3)
-    print('\033[1;32;40m' + '╔══════════════════════════════════════════╗' + RESET)
-    print('\033[1;32;40m' + '║                                          ║' + RESET)
-    print('\033[1;32;40m' + '║   🚀 MISSION COMPLETE 🚀                 ║' + RESET)
-    print('\033[1;32;40m' + '║                                          ║' + RESET)
-    print('\033[1;32;40m' + '║   ✅ Launched from Earth                 ║' + RESET)
-    print('\033[1;32;40m' + '║   ✅ Landed on Mars                      ║' + RESET)
-    print('\033[1;32;40m' + '║   ✅ Eliminated hostile alien            ║' + RESET)
-    print('\033[1;32;40m' + '║   ✅ Traversed wormhole                  ║' + RESET)
-    print('\033[1;32;40m' + '║   ✅ Arrived at Vianney High School      ║' + RESET)
-    print('\033[1;32;40m' + '║                                          ║' + RESET)
-    print('\033[1;32;40m' + '║        🧑‍🚀 YOU ARE A LEGEND 🧑‍🚀           ║' + RESET)
-    print('\033[1;32;40m' + '║                                          ║' + RESET)
-    print('\033[1;32;40m' + '╚══════════════════════════════════════════╝' + RESET)
-    print('\n' * 2)
-    time.sleep(3)
-    show_cursor()
+    yield MISSION_COMPLETE, 3
+
+def crash_frames():
+    """Yields the text-based crash animation as (frame lines, seconds to hold) pairs."""
+    for frame in CRASH_FRAMES:
+        yield frame, 0.4  # Slow down the crash animation
+    yield frame + ('', RED_ON_BLACK + '💥 VEHICLE LOST 💥' + RESET), 1.0
+
+def play_animation(frames, time_scale=None):
+    """Plays (frame, seconds) pairs on a timeline, redrawing only the cells that change."""
+    hide_cursor()
+    screen = FrameBuffer()
+    try:
+        for lines in Timeline(frames, ANIMATION_TIME_SCALE if time_scale is None else time_scale):
+            screen.render(lines)
+    finally:
+        show_cursor()
+
+def launch_animation(time_scale=None):
+    """Plays an EPIC multi-stage space adventure animation."""
+    play_animation(launch_frames(), time_scale)
+
+def record_animation(path, success):
+    """Writes the launch or crash animation to an asciicast v2 file instead of playing it."""
+    if success:
+        return write_asciicast(path, launch_frames(), title='Rocket Simulation: launch')
+    return write_asciicast(path, crash_frames(), title='Rocket Simulation: crash')
 
 def hide_cursor():
     """Hides the terminal cursor."""
@@ -289,44 +336,11 @@ def show_cursor():
     """Shows the terminal cursor."""
     print('\033[?25h', end='')
 
-def crash_animation():
+def crash_animation(time_scale=None):
     """Plays a simple text-based crash animation."""
-    hide_cursor()
-    width = 40
-    crash_frames = [
-        [
-            '  /\\  ',
-            ' |XX| ',
-            ' |  | ',
-            ' |  | ',
-            ' |==| ',
-            ' ||  ',
-            ' 💨  ',
-        ],
-        [
-            '  /\\  ',
-            ' |XX| ',
-            ' |  | ',
-            ' |==| ',
-            ' ||  ',
-            ' 💨💨 ',
-        ],
-        [
-            '  💥  ',
-            ' 💥💥 ',
-            ' 💨💨💨 ',
-        ],
-    ]
-    for frame in crash_frames:
-        clear_screen()
-        for line in frame:
-            print(' ' * width + line)
-        time.sleep(0.4)  # Slow down the crash animation
-    print('\n' + RED_ON_BLACK + '💥 VEHICLE LOST 💥' + RESET)
-    time.sleep(1.0)
-    show_cursor()
-
-def run_simulation():
+    play_animation(crash_frames(), time_scale)
+
+def run_simulation(animate=True):
     """Runs a simple Rocket Simulation where a craft lifts off based on user inputs."""
     print(f'{GREEN_ON_BLACK}Welcome to my Rocket Simulation!{RESET}')
 
@@ -357,84 +371,197 @@ def run_simulation():
         if thrust_in <= 0 or fuel_burn <= 0 or time_step <= 0 or sim_dur <= 0:
             print(f'{RED_ON_BLACK}All input values must be positive. Exiting the simulation!{RESET}')
             return
+        check_inputs(astronaut_count_in, thrust_in, fuel_burn, time_step, sim_dur)
             
     except ValueError:
         # Handle non-numeric inputs
         print(f'{RED_ON_BLACK}Your input was invalid. Try Again!{RESET}')
         return
 
+    print(f'{GREEN_ON_BLACK}Starting Simulation...{RESET}')
+    result = fly(astronaut_count_in, thrust_in, fuel_burn, time_step, sim_dur)
+    report_result(result, animate)
+
+def fly(astronauts, thrust, fuel_burn, time_step, sim_dur, coast=False, verbose=True):
+    """Flies one rocket step by step, printing liftoff and status lines if verbose, and returns its final state."""
     # Initialize simulation variables
-    gravity = 9.81 # m/s^2
-    drag_coefficient = 0.05 # a simple constant for basic drag modeling
-    takeoff_threshold_altitude = 10.0 # meters
-    velocity = 0.0 # m/s
-    altitude = 0.0 # meters
-    current_mass = initial_total_mass # Start with total mass
-    thrust = thrust_in
-    sim_time = 0.0
+    record = {
+        'step': 0,
+        'time': 0.0,
+        'altitude': 0.0,
+        'velocity': 0.0,
+        'mass': FIXED_ROCKET_DRY_MASS_KG + FIXED_INITIAL_FUEL_MASS_KG + astronauts * MASS_PER_ASTRONAUT_KG,
+        'fuel': FIXED_INITIAL_FUEL_MASS_KG,
+        'liftoff': False,
+        'liftoff_time': float('nan'),
+    }
     liftoff_achieved = False
-    initial_fuel = FIXED_INITIAL_FUEL_MASS_KG # Track fuel separately to stop burn
 
-    print(f'{GREEN_ON_BLACK}Starting Simulation...{RESET}')
+    # Main simulation loop, one telemetry record per step
+    for record in flight_steps(astronauts, thrust, fuel_burn, time_step, sim_dur, coast=coast):
+        if not verbose:
+            continue
+        sim_time = record['time']
 
-    # Main simulation loop
-    # Continue as long as time hasn't run out AND we still have *some* fuel (arbitrary low threshold for dry mass)
-    while sim_time < sim_dur and current_mass > (FIXED_ROCKET_DRY_MASS_KG + astronaut_mass):
-        # Calculate forces
-        force_of_gravity = current_mass * gravity
-        force_of_drag = drag_coefficient * velocity**2
-        net_force = thrust - force_of_gravity - force_of_drag
-
-        if current_mass <= 0:
-            break # Should not happen with dry mass threshold but good practice
-
-        acceleration = net_force / current_mass
-        velocity += acceleration * time_step
-
-        if velocity < 0:
-            velocity = 0 # Prevent velocity from becoming negative
-        
-        altitude += velocity * time_step
-
-        # Simulate fuel burn and corresponding changes in mass/thrust
-        fuel_burned_in_step = fuel_burn * time_step
-        if initial_fuel >= fuel_burned_in_step:
-            current_mass -= fuel_burned_in_step
-            initial_fuel -= fuel_burned_in_step
-            # A simple thrust reduction model as fuel density changes or tanks empty
-            thrust *= (1 - (fuel_burned_in_step / FIXED_INITIAL_FUEL_MASS_KG) * 0.1)
-        else:
-            # Out of fuel, stop burning/reducing mass/thrust
-            fuel_burned_in_step = initial_fuel
-            current_mass -= fuel_burned_in_step
-            initial_fuel = 0
-            thrust = 0 # Engine cut off
-
-        if altitude >= takeoff_threshold_altitude and not liftoff_achieved:
+        if record['liftoff'] and not liftoff_achieved:
             liftoff_achieved = True
-            print(f'\n*** LIFTOFF ACHIEVED at T+{sim_time:.2f} seconds! ***\n')
-
-        # Increment time
-        sim_time += time_step
+            print(f'\n*** LIFTOFF ACHIEVED at T+{record["liftoff_time"]:.2f} seconds! ***\n')
 
         # Print status every 10 seconds of simulation time
         if int(sim_time / time_step) % (10 / time_step) == 0:
-            print(f'T+{sim_time:.2f}s | Alt: {altitude:.2f}m | Vel: {velocity:.2f} m/s | Mass: {current_mass:.2f}kg | Fuel Left: {initial_fuel:.2f}kg')
+            print(f'T+{sim_time:.2f}s | Alt: {record["altitude"]:.2f}m | Vel: {record["velocity"]:.2f} m/s | Mass: {record["mass"]:.2f}kg | Fuel Left: {record["fuel"]:.2f}kg')
 
-    # Output Results
+    result = {name: record[name] for name in ('time', 'altitude', 'velocity', 'mass', 'fuel', 'liftoff', 'liftoff_time')}
+    result['steps'] = record['step']
+    result['success'] = record['liftoff'] and record['altitude'] > 0
+    return result
+
+def report_result(result, animate=True, time_scale=None):
+    """Prints the simulation summary, playing the success or crash animation unless animate is off."""
+    time_scale = ANIMATION_TIME_SCALE if time_scale is None else time_scale
     print('\n--- Simulation Summary ---')
-    if liftoff_achieved and altitude > 0:
+    if result['success']:
         print('Result: SUCCESS - The rocket successfully lifted off.')
-        time.sleep(2)
-        launch_animation()
+        if animate:
+            time.sleep(2 * time_scale)
+            launch_animation(time_scale)
     else:
         print('Result: FAILURE - The rocket did not achieve sustained liftoff.')
-        time.sleep(2)
-        crash_animation()
-    print(f'Final Time: {sim_time:.2f} seconds')
-    print(f'Final Altitude: {altitude:.2f} meters')
-    print(f'Final Velocity: {velocity:.2f} m/s')
-    print(f'Final Mass (dry mass + crew): {current_mass:.2f} kg')
+        if animate:
+            time.sleep(2 * time_scale)
+            crash_animation(time_scale)
+    print(f'Final Time: {result["time"]:.2f} seconds')
+    print(f'Final Altitude: {result["altitude"]:.2f} meters')
+    print(f'Final Velocity: {result["velocity"]:.2f} m/s')
+    print(f'Final Mass (dry mass + crew): {result["mass"]:.2f} kg')
+
+def load_configs(path):
+    """Loads run configurations from a JSON, NDJSON or TOML file.
+
+    A file holds either one configuration object or many: a JSON list, one
+    object per NDJSON line, or a top-level "runs" list in JSON or TOML.
+    """
+    with open(path, 'rb') as handle:
+        content = handle.read()
+    if path.endswith('.toml'):
+        if tomllib is None:
+            raise ValueError('Reading TOML configs needs Python 3.11 or newer.')
+        data = tomllib.loads(content.decode('utf-8'))
+    elif path.endswith(('.ndjson', '.jsonl')):
+        data = [json.loads(line) for line in content.decode('utf-8').splitlines() if line.strip()]
+    else:
+        data = json.loads(content)
+    return parse_configs(data, path)
+
+def parse_configs(data, source='the request'):
+    """Turns decoded config data (one object, a list, or a "runs" list) into a list of configs."""
+    if isinstance(data, dict) and 'runs' in data:
+        if not isinstance(data['runs'], list) or not all(isinstance(run, dict) for run in data['runs']):
+            raise ValueError(f'"runs" in {source} must be a list of objects.')
+        defaults = {key: value for key, value in data.items() if key != 'runs'}
+        data = [{**defaults, **run} for run in data['runs']]
+    configs = data if isinstance(data, list) else [data]
+    for config in configs:
+        if not isinstance(config, dict):
+            raise ValueError(f'Every configuration in {source} must be an object.')
+        unknown = set(config) - set(CONFIG_DEFAULTS)
+        if unknown:
+            raise ValueError(f'Unknown configuration keys in {source}: {", ".join(sorted(unknown))}')
+    return configs
+
+def check_configs(configs):
+    """Raises ValueError for any complete configuration the engine would reject."""
+    for config in configs:
+        if config['method'] not in METHODS:
+            raise ValueError(f'Unknown integration method {config["method"]!r}; expected one of {", ".join(METHODS)}.')
+    check_inputs(*([config[name] for config in configs] for name in CONFIG_FIELDS))
+
+def run_batch(configs):
+    """Runs many configurations through the vectorized engine; returns one result dict per config."""
+    results = [None] * len(configs)
+    groups = {}
+    for index, config in enumerate(configs):
+        groups.setdefault((config['method'], config['coast']), []).append(index)
+    for (method, coast), indices in groups.items():
+        columns = {name: [configs[index][name] for index in indices] for name in CONFIG_FIELDS}
+        batch = simulate_batch(columns['astronauts'], columns['thrust'], columns['fuel_burn'],
+                               columns['time_step'], columns['duration'], method=method, coast=coast)
+        for position, index in enumerate(indices):
+            result = {name: batch[name][position].item() for name in RESULT_FIELDS}
+            result['thrust_final'] = result.pop('thrust')
+            results[index] = {**configs[index], **result}
+    return results
+
+def json_safe(result):
+    """Replaces NaN values with None so results serialize as strict JSON."""
+    return {key: None if isinstance(value, float) and math.isnan(value) else value for key, value in result.items()}
+
+def main(argv=None):
+    """Entry point: interactive prompts with no arguments, otherwise a scriptable run."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        run_simulation()
+        return
+
+    parser = argparse.ArgumentParser(description='Rocket Simulation. Run without arguments for interactive prompts.')
+    parser.add_argument('--astronauts', type=int, help=f'number of astronauts (default {DEFAULT_ASTRONAUTS})')
+    parser.add_argument('--thrust', type=float, help=f'thrust in Newtons (default {DEFAULT_THRUST})')
+    parser.add_argument('--fuel-burn', type=float, help=f'fuel burn rate in kg/s (default {DEFAULT_FUEL_BURN})')
+    parser.add_argument('--time-step', type=float, help=f'time step in seconds (default {DEFAULT_TIME_STEP})')
+    parser.add_argument('--duration', type=float, help=f'max simulation duration in seconds (default {DEFAULT_SIM_DURATION})')
+    parser.add_argument('--method', choices=METHODS, help='integration method (default euler)')
+    parser.add_argument('--coast', action='store_true', default=None, help='keep flying after burnout until the duration')
+    parser.add_argument('--config', help='JSON, NDJSON or TOML file with one or many configurations')
+    parser.add_argument('--no-animation', action='store_true', help='skip the launch and crash animations')
+    parser.add_argument('--time-scale', type=float, default=ANIMATION_TIME_SCALE,
+                        help='animation speed multiplier on hold times; 0 plays them instantly')
+    parser.add_argument('--cast', metavar='PATH', help='also write the animation to an asciinema .cast file')
+    parser.add_argument('--json', action='store_true', help='print one JSON result per line instead of the summary')
+    args = parser.parse_args(argv)
+
+    # Command-line flags override the config file, which overrides the defaults
+    if args.time_scale < 0:
+        parser.error('--time-scale must not be negative')
+    overrides = {name: getattr(args, name) for name in CONFIG_DEFAULTS if getattr(args, name) is not None}
+    try:
+        configs = load_configs(args.config) if args.config else [{}]
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    if args.cast and len(configs) != 1:
+        parser.error('--cast records a single run, but the config holds several')
+
+    try:
+        # Reject bad values before announcing anything
+        configs = parse_configs([{**CONFIG_DEFAULTS, **config, **overrides} for config in configs],
+                                source='the configuration')
+        check_configs(configs)
+        if len(configs) == 1 and configs[0]['method'] == 'euler' and not args.json:
+            config = configs[0]
+            print(f'{GREEN_ON_BLACK}Starting Simulation...{RESET}')
+            result = fly(config['astronauts'], config['thrust'], config['fuel_burn'], config['time_step'],
+                         config['duration'], config['coast'])
+            report_result(result, not args.no_animation, args.time_scale)
+            if args.cast:
+                record_animation(args.cast, result['success'])
+            return
+        results = run_batch(configs)
+    except (TypeError, ValueError) as error:
+        print(f'{RED_ON_BLACK}{error}{RESET}', file=sys.stderr)
+        sys.exit(2)
+
+    if args.json:
+        for result in results:
+            print(json.dumps(json_safe(result)))
+    elif len(results) == 1:
+        report_result(results[0], not args.no_animation, args.time_scale)
+    else:
+        for result in results:
+            outcome = 'SUCCESS' if result['success'] else 'FAILURE'
+            print(f'{outcome} | Astronauts: {result["astronauts"]} | Thrust: {result["thrust"]:.1f}N | '
+                  f'Burn: {result["fuel_burn"]:.1f}kg/s | Alt: {result["altitude"]:.2f}m | '
+                  f'Vel: {result["velocity"]:.2f} m/s | T+{result["time"]:.2f}s')
+    if args.cast:
+        record_animation(args.cast, results[0]['success'])
 
 if __name__ == '__main__' :
-    run_simulation()
\ No newline at end of file
+    main()
@@ -0,0 +1,190 @@
+import hashlib
+import io
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import pygame
+
+from effects import SurfaceCache
+
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                                 "python-rocket", "assets")
+DEFAULT_WORKERS = 4 # prefetch threads, and pooled connections per host
+DEFAULT_TIMEOUT = 10 # seconds
+MEMORY_CACHE_BYTES = 64 * 1024 * 1024 # decoded surfaces kept in memory
+
+class AssetLoader:
+    """Loads images from http(s) URLs, file:// URLs or paths into pygame surfaces.
+
+    Downloads share one pooled requests session, and prefetch() queues them on a
+    thread pool so they overlap with whatever the game is doing. Each image is
+    decoded (and resized) once: the RGBA pixels are kept in a disk cache keyed by
+    URL plus size, next to the ETag/Last-Modified validators (or file mtime) used
+    to revalidate them, and surfaces wrap the pixel bytes with frombuffer instead
+    of copying them. Decoded surfaces stay in a bounded in-memory LRU.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT,
+                 memory_bytes=MEMORY_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.timeout = timeout
+        self.memory = SurfaceCache(memory_bytes)
+        self.pending = {}
+        self.counters = {"downloads": 0, "revalidated": 0, "disk_hits": 0, "decodes": 0}
+        self._session = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """The pooled requests session, created on first download; prefetch threads may race to it."""
+        with self._lock:
+            if self._session is None:
+                import requests
+
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def prefetch(self, urls, size=None):
+        """Start fetching and decoding urls in the background; load() picks the results up."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="assets")
+        for url in urls:
+            key = (url, tuple(size) if size else None)
+            if key not in self.pending and key not in self.memory.entries:
+                self.pending[key] = self._executor.submit(self.fetch, url, key[1])
+
+    def load(self, url, size=None):
+        """Return url's image as a surface, optionally resized; None (with a message) if it cannot be loaded."""
+        key = (url, tuple(size) if size else None)
+        try:
+            return self.memory.get(key, lambda: self._surface(key))
+        except Exception as e:
+            print(f"Could not load image from {url}: {e}")
+            return None
+
+    def _surface(self, key):
+        """Wraps the fetched pixels in a surface without copying them."""
+        future = self.pending.pop(key, None)
+        pixels, dimensions = future.result() if future else self.fetch(*key)
+        return pygame.image.frombuffer(pixels, dimensions, "RGBA")
+
+    def fetch(self, url, size=None):
+        """Return (RGBA pixel bytes, (width, height)) for url, from the disk cache when still valid."""
+        size = tuple(size) if size else None
+        path = self._cache_path(url, size)
+        meta = self._read_meta(path)
+        parsed = urlparse(url)
+        if parsed.scheme in ("http", "https"):
+            headers = {}
+            if meta:
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except Exception:
+                if meta:
+                    # Offline: a stale copy beats no image
+                    return self._read_pixels(path, meta)
+                raise
+            if response.status_code == 304 and meta:
+                self._count("revalidated")
+                return self._read_pixels(path, meta)
+            response.raise_for_status()
+            self._count("downloads")
+            validators = {"etag": response.headers.get("ETag"),
+                          "last_modified": response.headers.get("Last-Modified")}
+            content = response.content
+        else:
+            file_path = url2pathname(parsed.path) if parsed.scheme == "file" else url
+            stat = os.stat(file_path)
+            validators = {"mtime_ns": stat.st_mtime_ns, "bytes": stat.st_size}
+            if meta and all(meta.get(name) == value for name, value in validators.items()):
+                return self._read_pixels(path, meta)
+            with open(file_path, "rb") as handle:
+                content = handle.read()
+
+        pixels, dimensions = self._decode(content, size)
+        self._write(path, pixels, {"url": url, "size": size, "width": dimensions[0], "height": dimensions[1],
+                                   **validators})
+        return pixels, dimensions
+
+    def _decode(self, content, size):
+        """Decodes image bytes to RGBA pixels, resized to size if given."""
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(content)).convert("RGBA")
+        if size:
+            image = image.resize(size, Image.Resampling.LANCZOS)
+        self._count("decodes")
+        return image.tobytes(), image.size
+
+    def _cache_path(self, url, size):
+        """Disk cache path (without extension) for url at size."""
+        digest = hashlib.sha256(f"{url}\0{size}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest)
+
+    def _read_meta(self, path):
+        """The cached entry's metadata, or None if there is no usable entry."""
+        try:
+            with open(path + ".json") as handle:
+                meta = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        return meta if os.path.exists(path + ".rgba") else None
+
+    def _read_pixels(self, path, meta):
+        """Reads cached pixels straight into the buffer the surface will wrap."""
+        dimensions = (meta["width"], meta["height"])
+        pixels = bytearray(dimensions[0] * dimensions[1] * 4)
+        with open(path + ".rgba", "rb") as handle:
+            if handle.readinto(pixels) != len(pixels) or handle.read(1):
+                raise ValueError(f"Corrupt cache entry {path}.rgba")
+        self._count("disk_hits")
+        return pixels, dimensions
+
+    def _write(self, path, pixels, meta):
+        """Stores pixels and metadata, each replaced atomically so readers never see a partial entry."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        for extension, data in ((".rgba", pixels), (".json", json.dumps(meta).encode("utf-8"))):
+            with open(path + extension + suffix, "wb") as handle:
+                handle.write(data)
+            os.replace(path + extension + suffix, path + extension)
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def stats(self):
+        """Fetch counters plus the memory cache's counters."""
+        return {**self.counters, "pending": len(self.pending), "memory": self.memory.stats()}
+
+    def close(self):
+        """Waits for outstanding prefetches and releases the threads and connections."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+_loader = None
+
+def default_loader():
+    """The shared loader behind rocket_game.load_image_from_url, created on first use."""
+    global _loader
+    if _loader is None:
+        _loader = AssetLoader()
+    return _loader
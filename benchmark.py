@@ -0,0 +1,192 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from app import DEFAULT_ASTRONAUTS, DEFAULT_THRUST, DEFAULT_FUEL_BURN, DEFAULT_SIM_DURATION, fly
+from sweep import build_grid, run_sweep
+
+DEFAULT_TIME_STEPS = (0.5, 0.1, 0.01)
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.10 # relative slowdown flagged as a regression
+SWEEP_AXES = {
+    'astronauts': np.arange(0, 10),
+    'thrust': np.linspace(20000.0, 100000.0, 40),
+    'fuel_burn': np.linspace(20.0, 100.0, 25),
+}
+
+def best_time(function, repeat):
+    """Runs function repeat times; returns (fastest seconds, its return value)."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best[0]:
+            best = (elapsed, value)
+    return best
+
+def bench_physics(time_steps=DEFAULT_TIME_STEPS, repeat=DEFAULT_REPEAT):
+    """Measures single-flight steps per second and sweep runs per second at each time step."""
+    results = {}
+    for time_step in time_steps:
+        elapsed, flight = best_time(lambda: fly(DEFAULT_ASTRONAUTS, DEFAULT_THRUST, DEFAULT_FUEL_BURN, time_step,
+                                                DEFAULT_SIM_DURATION, verbose=False), repeat)
+        results[f'physics.flight.dt={time_step:g}'] = {
+            'value': flight['steps'] / elapsed, 'unit': 'steps/s', 'higher_is_better': True}
+
+        configs = build_grid(*SWEEP_AXES.values(), time_step)
+        elapsed, (table, _) = best_time(lambda: run_sweep(configs, workers=1), repeat)
+        results[f'physics.sweep.dt={time_step:g}'] = {
+            'value': len(table['time']) / elapsed, 'unit': 'runs/s', 'higher_is_better': True}
+    return results
+
+def bench_render(stages=None, repeat=1):
+    """Measures milliseconds per frame of rocket_game stages (default all, in playing order), headless and unpaced."""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import rocket_game
+
+    if stages is None:
+        stages = [name for _, name in rocket_game.STAGES]
+    rocket_game.init()
+    rocket_game.FPS = None
+    rocket_game.warm_sprites()
+    present = rocket_game.present
+    frame_times = []
+
+    def timed_present():
+        present()
+        now = time.perf_counter()
+        frame_times.append(now - timed_present.last)
+        timed_present.last = now
+
+    rocket_game.present = timed_present
+    results = {}
+    try:
+        for name in stages:
+            best = None
+            for _ in range(repeat):
+                random.seed(0)
+                frame_times.clear()
+                timed_present.last = time.perf_counter()
+                getattr(rocket_game, name)()
+                times = np.array(frame_times) * 1000
+                if best is None or times.mean() < best.mean():
+                    best = times
+            results[f'render.{name}'] = {
+                'value': float(best.mean()), 'unit': 'ms/frame', 'higher_is_better': False,
+                'p95': float(np.percentile(best, 95)), 'max': float(best.max()), 'frames': int(best.size)}
+    finally:
+        rocket_game.present = present
+    return results
+
+def bench_startup(repeat=DEFAULT_REPEAT):
+    """Measures a cold import of rocket_game, and its init(), in fresh interpreters."""
+    script = ('import time; start = time.perf_counter(); import rocket_game; imported = time.perf_counter(); '
+              'rocket_game.init(); print(imported - start, time.perf_counter() - imported)')
+    env = {**os.environ, 'SDL_VIDEODRIVER': 'dummy', 'SDL_AUDIODRIVER': 'dummy', 'PYGAME_HIDE_SUPPORT_PROMPT': '1'}
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', script], env=env, cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True).stdout
+        runs.append([float(value) * 1000 for value in output.split()])
+    imported, initialised = np.min(runs, axis=0)
+    return {'startup.import_rocket_game': {'value': float(imported), 'unit': 'ms', 'higher_is_better': False},
+            'startup.init': {'value': float(initialised), 'unit': 'ms', 'higher_is_better': False}}
+
+def environment():
+    """Describes the machine and library versions a result file was measured with."""
+    info = {'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform(),
+            'processor': platform.processor(), 'cpus': os.cpu_count()}
+    if 'pygame' in sys.modules:
+        info['pygame'] = sys.modules['pygame'].version.ver
+    return info
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Returns (name, baseline value, current value, relative change, regressed) for shared benchmarks.
+
+    The change is signed so positive is always an improvement; a benchmark has
+    regressed when it got worse by more than threshold.
+    """
+    rows = []
+    for name, base in baseline['results'].items():
+        if name not in current['results']:
+            continue
+        value = current['results'][name]['value']
+        change = (value - base['value']) / base['value']
+        if not base['higher_is_better']:
+            change = -change
+        rows.append((name, base['value'], value, change, change < -threshold))
+    return rows
+
+def print_comparison(rows, units):
+    """Prints a comparison table; returns the number of regressions."""
+    for name, base, value, change, regressed in rows:
+        flag = '  REGRESSION' if regressed else ''
+        print(f'{name:36} {base:14,.2f} -> {value:14,.2f} {units[name]:9} {change:+8.1%}{flag}')
+    regressions = sum(row[4] for row in rows)
+    print(f'{regressions} regression(s) in {len(rows)} benchmarks')
+    return regressions
+
+def main():
+    """Command-line entry point to run benchmarks or compare two result files."""
+    parser = argparse.ArgumentParser(description='Physics throughput and render cost benchmarks.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run the suite and save the results as JSON')
+    run.add_argument('--output', default='benchmark.json', help='result file to write')
+    run.add_argument('--time-steps', default=','.join(f'{step:g}' for step in DEFAULT_TIME_STEPS),
+                     help='comma-separated time steps for the physics benchmarks')
+    run.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='repeats per benchmark; the best counts')
+    run.add_argument('--skip-physics', action='store_true')
+    run.add_argument('--skip-render', action='store_true')
+    run.add_argument('--skip-startup', action='store_true')
+    run.add_argument('--stages', help='comma-separated rocket_game stages to render (default: all, in playing order)')
+    run.add_argument('--baseline', help='compare against this result file and exit 1 on regressions')
+    run.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    check = commands.add_parser('compare', help='flag regressions of a result file against a baseline')
+    check.add_argument('baseline')
+    check.add_argument('current')
+    check.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='relative slowdown to flag')
+    args = parser.parse_args()
+
+    if args.command == 'compare':
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        with open(args.current) as handle:
+            current = json.load(handle)
+    else:
+        results = {}
+        if not args.skip_physics:
+            time_steps = [float(step) for step in args.time_steps.split(',')]
+            results.update(bench_physics(time_steps, args.repeat))
+        if not args.skip_startup:
+            results.update(bench_startup(args.repeat))
+        if not args.skip_render:
+            results.update(bench_render(args.stages.split(',') if args.stages else None, args.repeat))
+        current = {'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'environment': environment(), 'results': results}
+        with open(args.output, 'w') as handle:
+            json.dump(current, handle, indent=2)
+        units = {name: result['unit'] for name, result in results.items()}
+        for name, result in results.items():
+            print(f'{name:36} {result["value"]:14,.2f} {units[name]}')
+        print(f'Saved {len(results)} results to {args.output}')
+        if not args.baseline:
+            return
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+
+    units = {name: result['unit'] for name, result in current['results'].items()}
+    if print_comparison(compare(baseline, current, args.threshold), units):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
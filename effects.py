@@ -0,0 +1,337 @@
+import random
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+# Twinkle swings brightness this far either side of the base level
+STAR_BASE_BRIGHTNESS = 150
+STAR_TWINKLE = 50
+STAR_SIZES = (1, 1, 1, 2, 2, 3)
+
+class SurfaceCache:
+    """Bounded LRU cache of rendered surfaces with hit and miss counters."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build):
+        """Return the surface cached under key, calling build() to render it on a miss."""
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = build()
+        self.entries[key] = surface
+        self.bytes += surface_bytes(surface)
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= surface_bytes(evicted)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drop every cached surface, keeping the counters."""
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """Return the cache counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+def surface_bytes(surface):
+    """Approximate memory held by a surface's pixels."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+def blit_batch(surface, sprites, positions):
+    """Blit many (sprite, position) pairs in one call."""
+    if hasattr(surface, "fblits"):
+        surface.fblits(zip(sprites, positions))
+    else:
+        surface.blits(list(zip(sprites, positions)), doreturn=False)
+
+class TrackedCanvas(pygame.Surface):
+    """Off-screen frame that records where each frame drew, for dirty-rectangle display updates.
+
+    Blits and fills report their own rects, and pygame.draw calls report theirs
+    through shape(). Whole-frame fills and blits issued before anything else in a
+    frame are its backdrop: while the backdrop repeats the previous frame's, it is
+    only repainted where that frame drew, so an unchanged background costs
+    nothing. end_frame() returns the rects the display needs, this frame's
+    drawing plus the last one's, or the whole frame when the backdrop changed.
+    Frames scattered over more than max_rects rects (a twinkling starfield), or
+    covering more than max_coverage of the frame, are cheaper to repaint and
+    update whole than piece by piece.
+    """
+
+    max_rects = 256
+    max_coverage = 0.5 # fraction of the frame's area
+
+    def __init__(self, size, like=None):
+        super().__init__(size, 0, like) if like is not None else super().__init__(size)
+        self.full = self.get_rect()
+        self.previous_backdrop = []
+        self.previous_drawn = []
+        self.redraw_all = True
+        self._start_frame()
+
+    def _start_frame(self):
+        self.backdrop = [] # (key, paint) pairs of this frame's backdrop ops
+        self.drawn = []
+        self.in_backdrop = True
+
+    def _backdrop(self, key, paint):
+        """Applies a whole-frame op, restricted to last frame's drawing while the backdrop is unchanged."""
+        self.backdrop.append((key, paint))
+        index = len(self.backdrop) - 1
+        if self.redraw_all:
+            paint(None)
+        elif index >= len(self.previous_backdrop) or self.previous_backdrop[index] != key:
+            self._repaint_backdrop()
+        elif self._too_scattered(self.previous_drawn):
+            paint(None)
+        else:
+            for rect in self.previous_drawn:
+                paint(rect)
+        return self.full
+
+    def _repaint_backdrop(self):
+        """Falls back to painting this frame's whole backdrop and updating the whole frame."""
+        self.redraw_all = True
+        for _, paint in self.backdrop:
+            paint(None)
+
+    def _too_scattered(self, rects):
+        """Whether rects are better handled as one whole-frame rect."""
+        if len(rects) > self.max_rects:
+            return True
+        area = sum(rect.width * rect.height for rect in rects)
+        return area > self.max_coverage * self.full.width * self.full.height
+
+    def _draw(self):
+        """Closes the backdrop before the frame's first ordinary draw."""
+        if self.in_backdrop:
+            self.in_backdrop = False
+            if not self.redraw_all and len(self.backdrop) != len(self.previous_backdrop):
+                self._repaint_backdrop()
+
+    def touched(self, rect):
+        """Records a rect drawn by other means; None (nothing drawn) is ignored."""
+        if rect is not None:
+            rect = pygame.Rect(rect).clip(self.full)
+            if rect:
+                self.drawn.append(rect)
+        return rect
+
+    def fill(self, color, rect=None, special_flags=0):
+        if self.in_backdrop and not special_flags and (rect is None or pygame.Rect(rect).contains(self.full)):
+            return self._backdrop(("fill", self.map_rgb(color)),
+                                  lambda clip: pygame.Surface.fill(self, color, clip))
+        self._draw()
+        return self.touched(super().fill(color, rect, special_flags))
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if (self.in_backdrop and area is None and not special_flags and source.get_size() == self.full.size
+                and tuple(dest) == (0, 0)):
+            return self._backdrop(("blit", source),
+                                  lambda clip: pygame.Surface.blit(self, source, clip or (0, 0), clip))
+        self._draw()
+        return self.touched(super().blit(source, dest, area, special_flags))
+
+    def blits(self, blit_sequence, doreturn=1):
+        self._draw()
+        rects = super().blits(blit_sequence, doreturn=1)
+        self.drawn.extend(rects) # already clipped to the canvas
+        return rects if doreturn else None
+
+    def fblits(self, blit_sequence, special_flags=0):
+        # pygame-ce's fblits reports no rects, so route it through blits, which does
+        if special_flags:
+            blit_sequence = [(source, dest, None, special_flags) for source, dest in blit_sequence]
+        self.blits(list(blit_sequence), doreturn=0)
+
+    def end_frame(self):
+        """Finishes the frame; returns the rects whose pixels changed since the previous one."""
+        self._draw()
+        rects = self.previous_drawn + self.drawn
+        if self.redraw_all or self._too_scattered(rects):
+            rects = [self.full]
+        self.previous_backdrop = [key for key, _ in self.backdrop]
+        self.previous_drawn = self.drawn
+        self.redraw_all = False
+        self._start_frame()
+        return rects
+
+    def invalidate(self):
+        """Makes the next frame paint and update in full."""
+        self.redraw_all = True
+
+def shape(draw, surface, *args, **kwargs):
+    """Calls draw(surface, ...), a pygame.draw function or similar that returns the rect it touched.
+
+    On a TrackedCanvas the rect is recorded for the dirty-rectangle update;
+    drawing directly with pygame.draw would go unnoticed.
+    """
+    if isinstance(surface, TrackedCanvas):
+        surface._draw()
+        return surface.touched(draw(surface, *args, **kwargs))
+    return draw(surface, *args, **kwargs)
+
+def circle_sprite(color, radius):
+    """Pre-render a filled circle; blit it at (x - radius - 1, y - radius - 1) to match pygame.draw.circle."""
+    sprite = pygame.Surface((2 * radius + 3, 2 * radius + 3))
+    key = (255, 255, 255) if tuple(color) == (0, 0, 0) else (0, 0, 0)
+    sprite.fill(key)
+    sprite.set_colorkey(key, pygame.RLEACCEL)
+    pygame.draw.circle(sprite, color, (radius + 1, radius + 1), radius)
+    return sprite
+
+class Starfield:
+    """Stars generated once into arrays, then twinkled and scrolled with vectorized updates.
+
+    Positions and sizes come from random.Random(seed) in the same order the old
+    per-frame random.seed(42) loop drew them, so the sky looks the same, without
+    touching the global RNG. Each star belongs to one of len(layers) parallax
+    layers that scroll at the given relative speeds. Stars are blitted from
+    sprites pre-rendered for every brightness and size in a single batched call.
+    """
+
+    def __init__(self, width, height, count, seed=42, layers=(1.0,), sizes=STAR_SIZES):
+        rng = random.Random(seed)
+        stars = [(rng.randint(0, width), rng.randint(0, height), rng.choice(sizes)) for _ in range(count)]
+        x, y, size = np.array(stars, dtype=np.int64).reshape(-1, 3).T
+        self.width = width
+        self.index = np.arange(count)
+        self.x = x
+        self.y = y
+        self.speed = np.asarray(layers, dtype=np.float64)[self.index % len(layers)]
+
+        radii = sorted(set(sizes))
+        self.radius = size
+        self.size_index = np.searchsorted(radii, size)
+        levels = range(STAR_BASE_BRIGHTNESS - STAR_TWINKLE, STAR_BASE_BRIGHTNESS + STAR_TWINKLE + 1)
+        self.sprites = np.empty((len(levels), len(radii)), dtype=object)
+        for level, brightness in enumerate(levels):
+            for column, radius in enumerate(radii):
+                self.sprites[level, column] = circle_sprite((brightness, brightness, brightness), radius)
+        self.static_positions = list(zip((x - self.radius - 1).tolist(), (y - self.radius - 1).tolist()))
+
+    def draw(self, surface, offset=0, scroll=0):
+        """Draw every star with twinkle phase offset, with each layer scrolled left by scroll * speed."""
+        brightness = STAR_BASE_BRIGHTNESS + (STAR_TWINKLE * np.sin((offset + self.index) * 0.1)).astype(np.int64)
+        sprites = self.sprites[brightness - (STAR_BASE_BRIGHTNESS - STAR_TWINKLE), self.size_index]
+        if scroll:
+            x = (self.x - scroll * self.speed) % (self.width + 1)
+            positions = zip((x.astype(np.int64) - self.radius - 1).tolist(), (self.y - self.radius - 1).tolist())
+        else:
+            positions = self.static_positions
+        blit_batch(surface, sprites.tolist(), positions)
+
+class ParticleSystem:
+    """Fixed-capacity particle pool backed by preallocated NumPy arrays.
+
+    Live particles occupy the first `count` slots. spawn() writes new ones into
+    the free tail, update() moves and ages every particle in one vectorized step
+    and compacts the survivors in place, and draw() blits cached circle sprites
+    in one batched call. Spawns beyond the capacity are dropped.
+    """
+
+    def __init__(self, capacity, sprite_limit=4096):
+        self.capacity = capacity
+        self.count = 0
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.age = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.radius = np.zeros(capacity)
+        self.shrink = np.zeros(capacity)
+        self.color = np.zeros((capacity, 3), dtype=np.int64)
+        self.sprite_limit = sprite_limit
+        self.sprites = OrderedDict()
+        self.seen = OrderedDict()
+
+    def spawn(self, position, velocity=(0.0, 0.0), life=1.0, radius=1.0, color=(255, 255, 255), shrink=0.0):
+        """Add particles; position is (2,) or (n, 2) and the other arguments broadcast over n."""
+        position = np.atleast_2d(position)
+        count = min(len(position), self.capacity - self.count)
+        if count <= 0:
+            return 0
+        slots = slice(self.count, self.count + count)
+        self.position[slots] = position[:count]
+        self.velocity[slots] = np.broadcast_to(velocity, position.shape)[:count]
+        self.age[slots] = 0.0
+        self.life[slots] = np.broadcast_to(life, len(position))[:count]
+        self.radius[slots] = np.broadcast_to(radius, len(position))[:count]
+        self.shrink[slots] = np.broadcast_to(shrink, len(position))[:count]
+        self.color[slots] = np.broadcast_to(color, position.shape[:1] + (3,))[:count]
+        self.count += count
+        return count
+
+    def update(self, dt=1.0):
+        """Advance every particle by dt and retire those past their lifetime."""
+        live = slice(0, self.count)
+        self.position[live] += self.velocity[live] * dt
+        self.age[live] += dt
+        alive = self.age[live] < self.life[live]
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for values in (self.position, self.velocity, self.age, self.life, self.radius, self.shrink, self.color):
+                values[:len(keep)] = values[keep]
+            self.count = len(keep)
+
+    def clear(self):
+        """Retire every particle."""
+        self.count = 0
+
+    def draw(self, surface):
+        """Blit every live particle, shrunk by its age, in one batched call.
+
+        A color and radius get a cached sprite only on their second sighting;
+        one-off particles (colors that change every frame) are drawn directly,
+        since rendering a sprite costs far more than a single circle. Both the
+        sprites and the sightings are LRUs capped at sprite_limit entries.
+        Returns the rect bounding every particle, or None when there are none.
+        """
+        live = slice(0, self.count)
+        radius = np.maximum(self.radius[live] - self.shrink[live] * self.age[live], 1).astype(np.int64)
+        center = self.position[live].astype(np.int64)
+        sprites = []
+        corners = []
+        for color, size, (x, y) in zip(map(tuple, self.color[live].tolist()), radius.tolist(), center.tolist()):
+            key = (color, size)
+            sprite = self.sprites.get(key)
+            if sprite is not None:
+                self.sprites.move_to_end(key)
+            elif self.seen.pop(key, False):
+                sprite = self.sprites[key] = circle_sprite(color, size)
+                if len(self.sprites) > self.sprite_limit:
+                    self.sprites.popitem(last=False)
+            if sprite is None:
+                self.seen[key] = True
+                if len(self.seen) > self.sprite_limit:
+                    self.seen.popitem(last=False)
+                pygame.draw.circle(surface, color, (x, y), size)
+            else:
+                sprites.append(sprite)
+                corners.append((x - size - 1, y - size - 1))
+        blit_batch(surface, sprites, corners)
+        if not self.count:
+            return None
+        left, top = (center - radius[:, None] - 1).min(axis=0).tolist()
+        right, bottom = (center + radius[:, None] + 2).max(axis=0).tolist()
+        return pygame.Rect(left, top, right - left, bottom - top)
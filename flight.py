@@ -0,0 +1,432 @@
+import numpy as np
+
+# Define fixed simulation constants
+FIXED_ROCKET_DRY_MASS_KG = 500.0 # The structural weight of the rocket
+FIXED_INITIAL_FUEL_MASS_KG = 2000.0 # The initial weight of the fuel
+MASS_PER_ASTRONAUT_KG = 80.0 # Average mass including gear
+
+# Define physical constants shared by every flight model
+GRAVITY = 9.81 # m/s^2
+DRAG_COEFFICIENT = 0.05 # a simple constant for basic drag modeling
+TAKEOFF_THRESHOLD_ALTITUDE = 10.0 # meters
+THRUST_DECAY = 0.1 # fraction of thrust lost over a full tank of fuel
+
+# Fields returned for every rocket by simulate_batch
+RESULT_FIELDS = ('time', 'altitude', 'velocity', 'mass', 'fuel', 'thrust',
+                 'liftoff', 'liftoff_time', 'success', 'steps')
+
+# Fields of every record yielded by flight_steps
+TELEMETRY_FIELDS = ('step', 'time', 'altitude', 'velocity', 'mass', 'fuel', 'thrust',
+                    'liftoff', 'liftoff_time')
+
+# Integration methods accepted by simulate_batch
+METHODS = ('euler', 'rk4', 'rk45')
+
+# Butcher tableaus: classic RK4 and Dormand-Prince 5(4) with its embedded 4th order weights
+RK4_TABLEAU = {
+    'c': (0.0, 0.5, 0.5, 1.0),
+    'a': ((), (0.5,), (0.0, 0.5), (0.0, 0.0, 1.0)),
+    'b': (1/6, 1/3, 1/3, 1/6),
+}
+DOPRI5_TABLEAU = {
+    'c': (0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0),
+    'a': (
+        (),
+        (1/5,),
+        (3/40, 9/40),
+        (44/45, -56/15, 32/9),
+        (19372/6561, -25360/2187, 64448/6561, -212/729),
+        (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+        (35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84),
+    ),
+    'b': (35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84, 0.0),
+    'b_low': (5179/57600, 0.0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40),
+}
+
+def _as_config_arrays(astronauts, thrust, fuel_burn, time_step, duration,
+                      dry_mass=FIXED_ROCKET_DRY_MASS_KG, astronaut_mass=MASS_PER_ASTRONAUT_KG,
+                      drag_coefficient=DRAG_COEFFICIENT):
+    """Broadcasts the configuration and vehicle inputs to flat float arrays and validates them."""
+    arrays = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64)
+                                   for value in (astronauts, thrust, fuel_burn, time_step, duration,
+                                                 dry_mass, astronaut_mass, drag_coefficient)))
+    shape = arrays[0].shape
+    arrays = [np.array(a).ravel() for a in arrays]
+    astronauts, thrust, fuel_burn, time_step, duration, dry_mass, astronaut_mass, drag_coefficient = arrays
+
+    if not all(np.all(np.isfinite(a)) for a in arrays):
+        raise ValueError('All input values must be finite numbers.')
+    if np.any(astronauts < 0):
+        raise ValueError('Astronaut count cannot be negative.')
+    if np.any(thrust <= 0) or np.any(fuel_burn <= 0) or np.any(time_step <= 0) or np.any(duration <= 0):
+        raise ValueError('All input values must be positive.')
+    if np.any(dry_mass <= 0) or np.any(astronaut_mass < 0) or np.any(drag_coefficient <= 0):
+        raise ValueError('Dry mass and drag coefficient must be positive and astronaut mass not negative.')
+
+    return shape, *arrays
+
+def check_inputs(astronauts, thrust, fuel_burn, time_step, duration):
+    """Raises ValueError if simulate_batch or flight_steps would reject these configuration values."""
+    _as_config_arrays(astronauts, thrust, fuel_burn, time_step, duration)
+
+def _retire(state, results, active):
+    """Copies finished rockets into the results and compacts the working state to the rest."""
+    finished = ~active
+    for name in results:
+        results[name][state['index'][finished]] = state[name][finished]
+    return {name: values[active] for name, values in state.items()}
+
+def coast_state(altitude, velocity, mass, elapsed, drag_coefficient=DRAG_COEFFICIENT):
+    """Advances engine-off rockets by elapsed seconds in closed form; returns (altitude, velocity).
+
+    With no thrust and constant mass the climb under gravity and quadratic drag is
+    v(t) = vt * tan(atan(v0 / vt) - g t / vt) with terminal speed vt = sqrt(m g / c).
+    Velocity never goes negative in this model, so a rocket that reaches apogee
+    within elapsed simply holds that altitude for the rest of the interval.
+    """
+    terminal = np.sqrt(mass * GRAVITY / drag_coefficient)
+    phase0 = np.arctan(np.maximum(velocity, 0.0) / terminal)
+    coast_time = np.minimum(elapsed, phase0 * terminal / GRAVITY) # stop at apogee
+    phase = phase0 - GRAVITY * coast_time / terminal
+    altitude = altitude + mass / drag_coefficient * np.log(np.cos(phase) / np.cos(phase0))
+    return altitude, np.maximum(terminal * np.tan(phase), 0.0)
+
+def _coast_time_to(altitude, velocity, mass, target, drag_coefficient=DRAG_COEFFICIENT):
+    """Seconds an engine-off rocket needs to climb to target altitude, inf if it never gets there."""
+    terminal = np.sqrt(mass * GRAVITY / drag_coefficient)
+    phase0 = np.arctan(np.maximum(velocity, 0.0) / terminal)
+    ratio = np.cos(phase0) * np.exp(drag_coefficient / mass * np.maximum(target - altitude, 0.0))
+    reachable = ratio <= 1.0
+    phase = np.arccos(np.where(reachable, ratio, 1.0))
+    return np.where(reachable, (phase0 - phase) * terminal / GRAVITY, np.inf)
+
+def _coast_out(state, mask):
+    """Fast-forwards burned-out rockets in mask from their current time to their duration."""
+    mask = mask & (state['time'] < state['duration'])
+    if not mask.any():
+        return
+    altitude = state['altitude'][mask]
+    velocity = state['velocity'][mask]
+    mass = state['cutoff_mass'][mask]
+    drag = state['drag'][mask]
+    elapsed = state['duration'][mask] - state['time'][mask]
+
+    climb_time = _coast_time_to(altitude, velocity, mass, TAKEOFF_THRESHOLD_ALTITUDE, drag)
+    lifted = ~state['liftoff'][mask] & (climb_time <= elapsed)
+    liftoff_time = state['liftoff_time'][mask]
+    liftoff_time[lifted] = state['time'][mask][lifted] + climb_time[lifted]
+    state['liftoff_time'][mask] = liftoff_time
+    state['liftoff'][mask] |= lifted
+
+    state['altitude'][mask], state['velocity'][mask] = coast_state(altitude, velocity, mass, elapsed, drag)
+    state['thrust'][mask] = 0.0 # Engine cut off
+    state['time'][mask] = state['duration'][mask]
+
+def simulate_batch(astronauts, thrust, fuel_burn, time_step, duration, method='euler', rtol=1e-6, atol=1e-6,
+                   coast=False, dry_mass=FIXED_ROCKET_DRY_MASS_KG, astronaut_mass=MASS_PER_ASTRONAUT_KG,
+                   drag_coefficient=DRAG_COEFFICIENT):
+    """Steps a whole fleet of rockets at once and returns their final states as arrays.
+
+    Every configuration argument may be a scalar or an array; they are broadcast
+    against each other and each element is one rocket. Rockets that run out of fuel
+    or time drop out of the working set, so the cost of a step shrinks as the fleet
+    finishes.
+
+    method 'euler' reproduces app.run_simulation step for step. 'rk4' integrates the
+    continuous flight model with classic Runge-Kutta at a fixed time_step, and 'rk45'
+    uses adaptive Dormand-Prince steps (starting from time_step) held to rtol/atol.
+    Both Runge-Kutta methods land exactly on fuel exhaustion and report the exact
+    moment the rocket crosses the liftoff altitude.
+
+    By default a flight ends when its fuel runs out. With coast=True a rocket that
+    burns out early keeps flying until duration; the engine-off phase is solved in
+    closed form by coast_state instead of being stepped.
+
+    dry_mass, astronaut_mass and drag_coefficient default to the fixed vehicle
+    constants and broadcast like the configuration, so dispersion studies can give
+    every rocket its own vehicle.
+    """
+    shape, astronauts, thrust, fuel_burn, time_step, duration, *vehicle = _as_config_arrays(
+        astronauts, thrust, fuel_burn, time_step, duration, dry_mass, astronaut_mass, drag_coefficient)
+    state = _new_state(astronauts, thrust, *vehicle)
+
+    if method not in METHODS:
+        raise ValueError(f'Unknown integration method {method!r}; expected one of {", ".join(METHODS)}.')
+    if state['index'].size == 0:
+        results = _empty_results(state)
+    elif method == 'euler':
+        results = _simulate_euler(state, fuel_burn, time_step, duration, coast)
+    else:
+        results = _simulate_rk(state, thrust, fuel_burn, time_step, duration, method == 'rk45', rtol, atol, coast)
+
+    results['success'] = results['liftoff'] & (results['altitude'] > 0)
+    return {name: results[name].reshape(shape) for name in RESULT_FIELDS}
+
+def flight_steps(astronauts, thrust, fuel_burn, time_step, duration, every=1, interval=None, coast=False):
+    """Steps one rocket with the Euler model and yields a record of its state after each step.
+
+    Records are dicts keyed by TELEMETRY_FIELDS. every=n keeps only every n-th
+    step and interval keeps at most one record per interval seconds of flight;
+    the step where liftoff happens and the final state are always yielded. With
+    coast=True a burned-out rocket jumps to duration in one closed-form record.
+    """
+    _, *config = _as_config_arrays(astronauts, thrust, fuel_burn, time_step, duration)
+    if every < 1 or (interval is not None and not interval > 0):
+        raise ValueError('every must be a positive step count and interval a positive number of seconds.')
+    astronauts, thrust, fuel_burn, time_step, duration = (float(values[0]) for values in config[:5])
+
+    astronaut_mass = astronauts * MASS_PER_ASTRONAUT_KG
+    cutoff_mass = FIXED_ROCKET_DRY_MASS_KG + astronaut_mass
+    mass = FIXED_ROCKET_DRY_MASS_KG + FIXED_INITIAL_FUEL_MASS_KG + astronaut_mass
+    fuel = FIXED_INITIAL_FUEL_MASS_KG
+    velocity = 0.0
+    altitude = 0.0
+    sim_time = 0.0
+    step = 0
+    liftoff_achieved = False
+    liftoff_time = float('nan')
+    next_record_time = interval or 0.0
+
+    running = sim_time < duration and mass > cutoff_mass
+    while running:
+        # Calculate forces
+        net_force = thrust - mass * GRAVITY - DRAG_COEFFICIENT * velocity**2
+        velocity += net_force / mass * time_step
+        if velocity < 0:
+            velocity = 0.0 # Prevent velocity from becoming negative
+        altitude += velocity * time_step
+
+        # Burn fuel; a rocket that cannot cover a full step burns what is left and cuts off
+        burned = fuel_burn * time_step
+        if fuel >= burned:
+            mass -= burned
+            fuel -= burned
+            thrust *= (1 - (burned / FIXED_INITIAL_FUEL_MASS_KG) * THRUST_DECAY)
+        else:
+            mass -= fuel
+            fuel = 0.0
+            thrust = 0.0 # Engine cut off
+
+        lifted = altitude >= TAKEOFF_THRESHOLD_ALTITUDE and not liftoff_achieved
+        if lifted:
+            liftoff_achieved = True
+            liftoff_time = sim_time
+
+        sim_time += time_step
+        step += 1
+        running = sim_time < duration and mass > cutoff_mass
+
+        if coast and sim_time < duration and (fuel <= 0 or mass <= cutoff_mass):
+            if not liftoff_achieved:
+                climb_time = float(_coast_time_to(altitude, velocity, cutoff_mass, TAKEOFF_THRESHOLD_ALTITUDE))
+                if climb_time <= duration - sim_time:
+                    liftoff_achieved = lifted = True
+                    liftoff_time = sim_time + climb_time
+            altitude, velocity = (float(value) for value in
+                                  coast_state(altitude, velocity, cutoff_mass, duration - sim_time))
+            thrust = 0.0
+            sim_time = duration
+            running = False
+
+        if lifted or not running or (step % every == 0 and (interval is None or sim_time >= next_record_time)):
+            if interval is not None:
+                next_record_time = (sim_time // interval + 1) * interval
+            yield {
+                'step': step,
+                'time': sim_time,
+                'altitude': altitude,
+                'velocity': velocity,
+                'mass': mass,
+                'fuel': fuel,
+                'thrust': thrust,
+                'liftoff': liftoff_achieved,
+                'liftoff_time': liftoff_time,
+            }
+
+def _new_state(astronauts, thrust, dry_mass, astronaut_mass, drag_coefficient):
+    """Builds the initial working state shared by every integrator."""
+    count = astronauts.size
+    crew_mass = astronauts * astronaut_mass
+    return {
+        'index': np.arange(count),
+        'time': np.zeros(count),
+        'altitude': np.zeros(count),
+        'velocity': np.zeros(count),
+        'mass': dry_mass + FIXED_INITIAL_FUEL_MASS_KG + crew_mass,
+        'fuel': np.full(count, FIXED_INITIAL_FUEL_MASS_KG),
+        'thrust': thrust.copy(),
+        'liftoff': np.zeros(count, dtype=bool),
+        'liftoff_time': np.full(count, np.nan),
+        'steps': np.zeros(count, dtype=np.int64),
+        'cutoff_mass': dry_mass + crew_mass,
+        'drag': drag_coefficient,
+    }
+
+def _empty_results(state):
+    """Allocates the per-rocket result arrays filled in as rockets retire."""
+    return {name: np.empty(state['index'].size, dtype=state[name].dtype)
+            for name in RESULT_FIELDS if name != 'success'}
+
+def _simulate_euler(state, fuel_burn, time_step, duration, coast):
+    """Explicit Euler stepping, identical to the app.run_simulation loop."""
+    state.update(fuel_burn=fuel_burn, time_step=time_step, duration=duration)
+    results = _empty_results(state)
+
+    active = (state['time'] < duration) & (state['mass'] > state['cutoff_mass'])
+    while True:
+        if not active.all():
+            state = _retire(state, results, active)
+        if state['index'].size == 0:
+            break
+
+        dt = state['time_step']
+        velocity = state['velocity']
+        mass = state['mass']
+
+        # Calculate forces
+        net_force = state['thrust'] - mass * GRAVITY - state['drag'] * velocity**2
+        velocity += net_force / mass * dt
+        np.maximum(velocity, 0.0, out=velocity) # Prevent velocity from becoming negative
+        state['altitude'] += velocity * dt
+
+        # Burn fuel; a rocket that cannot cover a full step burns what is left and cuts off
+        burned = state['fuel_burn'] * dt
+        has_fuel = state['fuel'] >= burned
+        burned = np.where(has_fuel, burned, state['fuel'])
+        mass -= burned
+        state['fuel'] = np.where(has_fuel, state['fuel'] - burned, 0.0)
+        state['thrust'] = np.where(
+            has_fuel, state['thrust'] * (1 - (burned / FIXED_INITIAL_FUEL_MASS_KG) * THRUST_DECAY), 0.0)
+
+        lifted = ~state['liftoff'] & (state['altitude'] >= TAKEOFF_THRESHOLD_ALTITUDE)
+        state['liftoff'] |= lifted
+        state['liftoff_time'][lifted] = state['time'][lifted]
+
+        state['time'] += dt
+        state['steps'] += 1
+        active = (state['time'] < state['duration']) & (mass > state['cutoff_mass'])
+        if coast:
+            burned_out = (state['fuel'] <= 0) | (mass <= state['cutoff_mass'])
+            _coast_out(state, burned_out)
+            active &= ~burned_out
+
+    return results
+
+def _rates(time, velocity, thrust, fuel_burn, mass, drag_coefficient):
+    """Returns (climb rate, acceleration) of the continuous model at elapsed time.
+
+    thrust and mass are the launch values; the engine burns fuel at a constant rate
+    and loses THRUST_DECAY of its thrust per full tank, which is the limit of the
+    per-step decay in the Euler loop as time_step shrinks.
+    """
+    mass = mass - fuel_burn * time
+    thrust = thrust * np.exp(-(THRUST_DECAY / FIXED_INITIAL_FUEL_MASS_KG) * fuel_burn * time)
+    climb = np.maximum(velocity, 0.0)
+    acceleration = (thrust - mass * GRAVITY - drag_coefficient * climb**2) / mass
+    # A rocket resting on the pad cannot be pulled below it
+    acceleration = np.where((velocity <= 0) & (acceleration < 0), 0.0, acceleration)
+    return climb, acceleration
+
+def _rk_step(time, velocity, h, params, tableau):
+    """Takes one explicit Runge-Kutta step; returns altitude/velocity increments and stages."""
+    stages = []
+    for c, a in zip(tableau['c'], tableau['a']):
+        stage_velocity = velocity
+        for weight, (_, k_velocity) in zip(a, stages):
+            if weight:
+                stage_velocity = stage_velocity + h * weight * k_velocity
+        stages.append(_rates(time + c * h, stage_velocity, *params))
+    d_altitude = h * sum(weight * k_altitude for weight, (k_altitude, _) in zip(tableau['b'], stages) if weight)
+    d_velocity = h * sum(weight * k_velocity for weight, (_, k_velocity) in zip(tableau['b'], stages) if weight)
+    return d_altitude, d_velocity, stages
+
+def _locate_crossing(altitude0, climb0, altitude1, climb1, h, target, iterations=60):
+    """Finds the fraction of a step where the cubic Hermite altitude curve reaches target."""
+    low = np.zeros_like(h)
+    high = np.ones_like(h)
+    for _ in range(iterations):
+        s = 0.5 * (low + high)
+        s2 = s * s
+        s3 = s2 * s
+        altitude = ((2 * s3 - 3 * s2 + 1) * altitude0 + (s3 - 2 * s2 + s) * h * climb0
+                    + (-2 * s3 + 3 * s2) * altitude1 + (s3 - s2) * h * climb1)
+        below = altitude < target
+        low = np.where(below, s, low)
+        high = np.where(below, high, s)
+    return high
+
+def _simulate_rk(state, thrust, fuel_burn, time_step, duration, adaptive, rtol, atol, coast):
+    """Runge-Kutta integration of the continuous model, fixed-step RK4 or adaptive RK45."""
+    tableau = DOPRI5_TABLEAU if adaptive else RK4_TABLEAU
+    cutoff_mass = state['cutoff_mass']
+    burnout_time = FIXED_INITIAL_FUEL_MASS_KG / fuel_burn
+    state.update(
+        launch_thrust=thrust,
+        launch_mass=state['mass'].copy(),
+        fuel_burn=fuel_burn,
+        h=time_step.copy(),
+        stop_time=np.minimum(duration, burnout_time),
+        duration=duration,
+    )
+    results = _empty_results(state)
+
+    active = np.ones(state['index'].size, dtype=bool)
+    while True:
+        if not active.all():
+            state = _retire(state, results, active)
+        if state['index'].size == 0:
+            break
+
+        time = state['time']
+        velocity = state['velocity']
+        altitude = state['altitude']
+        remaining = state['stop_time'] - time
+        last = state['h'] >= remaining
+        h = np.where(last, remaining, state['h'])
+        params = (state['launch_thrust'], state['fuel_burn'], state['launch_mass'], state['drag'])
+
+        d_altitude, d_velocity, stages = _rk_step(time, velocity, h, params, tableau)
+        new_altitude = altitude + d_altitude
+        new_velocity = np.maximum(velocity + d_velocity, 0.0)
+
+        if adaptive:
+            # Embedded 4th order solution gives the local error estimate
+            e = [high - low for high, low in zip(tableau['b'], tableau['b_low'])]
+            err_altitude = h * sum(w * k_altitude for w, (k_altitude, _) in zip(e, stages) if w)
+            err_velocity = h * sum(w * k_velocity for w, (_, k_velocity) in zip(e, stages) if w)
+            scale_altitude = atol + rtol * np.maximum(np.abs(altitude), np.abs(new_altitude))
+            scale_velocity = atol + rtol * np.maximum(np.abs(velocity), np.abs(new_velocity))
+            error = np.maximum(np.abs(err_altitude) / scale_altitude, np.abs(err_velocity) / scale_velocity)
+            accept = (error <= 1.0) | (h <= 1e-12 * (1.0 + time))
+            factor = np.clip(0.9 * np.where(error > 0, error, 1e-10) ** -0.2, 0.2, 5.0)
+            state['h'] = h * factor
+            last &= accept
+        else:
+            accept = np.ones(h.size, dtype=bool)
+
+        new_time = np.where(last, state['stop_time'], time + h)
+
+        # Locate the exact liftoff moment inside any step that crossed the threshold
+        lifted = accept & ~state['liftoff'] & (new_altitude >= TAKEOFF_THRESHOLD_ALTITUDE)
+        if lifted.any():
+            fraction = _locate_crossing(
+                altitude[lifted], np.maximum(velocity[lifted], 0.0),
+                new_altitude[lifted], new_velocity[lifted], h[lifted], TAKEOFF_THRESHOLD_ALTITUDE)
+            state['liftoff_time'][lifted] = time[lifted] + fraction * h[lifted]
+            state['liftoff'] |= lifted
+
+        state['time'] = np.where(accept, new_time, time)
+        state['altitude'] = np.where(accept, new_altitude, altitude)
+        state['velocity'] = np.where(accept, new_velocity, velocity)
+        state['steps'] += accept
+        active = ~last
+        if coast:
+            _coast_out(state, last)
+
+    # Rebuild mass, fuel and thrust at the stop time; burnout cuts the engine off exactly
+    burned_out = results['time'] >= FIXED_INITIAL_FUEL_MASS_KG / fuel_burn
+    results['fuel'] = np.where(burned_out, 0.0, FIXED_INITIAL_FUEL_MASS_KG - fuel_burn * results['time'])
+    results['mass'] = cutoff_mass + results['fuel']
+    results['thrust'] = np.where(burned_out, 0.0, thrust * np.exp(
+        -(THRUST_DECAY / FIXED_INITIAL_FUEL_MASS_KG) * fuel_burn * results['time']))
+    return results
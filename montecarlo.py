@@ -0,0 +1,169 @@
+import argparse
+import math
+import time
+
+import numpy as np
+
+from app import (
+    DEFAULT_ASTRONAUTS, DEFAULT_THRUST, DEFAULT_FUEL_BURN,
+    DEFAULT_TIME_STEP, DEFAULT_SIM_DURATION,
+)
+from flight import (
+    FIXED_ROCKET_DRY_MASS_KG, MASS_PER_ASTRONAUT_KG, DRAG_COEFFICIENT,
+    METHODS, simulate_batch,
+)
+from telemetry import positive
+
+# Parameters that can be dispersed, with their default spreads as 'kind:a:b' specs
+DEFAULT_DISPERSIONS = {
+    'astronaut_mass': f'normal:{MASS_PER_ASTRONAUT_KG}:8',
+    'dry_mass': f'normal:{FIXED_ROCKET_DRY_MASS_KG}:10',
+    'thrust': f'normal:{DEFAULT_THRUST}:{DEFAULT_THRUST * 0.02}',
+    'fuel_burn': f'normal:{DEFAULT_FUEL_BURN}:{DEFAULT_FUEL_BURN * 0.02}',
+    'drag_coefficient': f'normal:{DRAG_COEFFICIENT}:{DRAG_COEFFICIENT * 0.1}',
+}
+REPORT_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+DEFAULT_BATCH_SIZE = 65536
+HISTOGRAM_BINS = 8192
+
+def parse_distribution(spec):
+    """Parses 'normal:mean:sd', 'uniform:low:high', 'lognormal:median:sigma' or 'fixed:value'."""
+    kind, *args = spec.split(':')
+    args = [float(arg) for arg in args]
+    expected = {'normal': 2, 'uniform': 2, 'lognormal': 2, 'fixed': 1}
+    if kind not in expected or len(args) != expected[kind]:
+        raise ValueError(f'Invalid distribution {spec!r}; expected e.g. normal:80:8, uniform:70:90 or fixed:80.')
+    return kind, args
+
+def sample(rng, distribution, count):
+    """Draws count values from a parsed distribution, kept strictly positive."""
+    kind, args = distribution
+    if kind == 'normal':
+        values = rng.normal(args[0], args[1], count)
+    elif kind == 'uniform':
+        values = rng.uniform(args[0], args[1], count)
+    elif kind == 'lognormal':
+        values = args[0] * np.exp(rng.normal(0.0, args[1], count))
+    else:
+        values = np.full(count, args[0])
+    # Resample-free truncation keeps the physics valid for extreme draws
+    return np.maximum(values, 1e-9)
+
+class StreamingHistogram:
+    """Fixed-size histogram for streaming quantile estimates in constant memory.
+
+    Values land in `bins` equal-width bins over [0, upper). When a value falls past
+    the top, adjacent bins are merged pairwise and the range doubles, so the
+    resolution is always upper / bins of the largest value seen so far.
+    """
+
+    def __init__(self, bins=HISTOGRAM_BINS, upper=1.0):
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.upper = float(upper)
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, values):
+        """Adds a batch of non-negative values; NaNs are skipped."""
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        while self.maximum >= self.upper:
+            self.counts = np.concatenate([self.counts[0::2] + self.counts[1::2], np.zeros_like(self.counts[::2])])
+            self.upper *= 2
+        bins = self.counts.size
+        index = np.minimum((np.maximum(values, 0.0) * (bins / self.upper)).astype(np.int64), bins - 1)
+        self.counts += np.bincount(index, minlength=bins)
+        self.count += values.size
+
+    def quantile(self, q):
+        """Estimates the q-th quantile by interpolating inside the bin that holds it."""
+        if self.count == 0:
+            return math.nan
+        cumulative = np.cumsum(self.counts)
+        target = q * self.count
+        index = int(np.searchsorted(cumulative, target, side='left'))
+        below = cumulative[index - 1] if index else 0
+        fraction = (target - below) / self.counts[index] if self.counts[index] else 0.0
+        width = self.upper / self.counts.size
+        return float(np.clip((index + fraction) * width, self.minimum, self.maximum))
+
+def run_dispersion(samples, astronauts=DEFAULT_ASTRONAUTS, time_step=DEFAULT_TIME_STEP,
+                   duration=DEFAULT_SIM_DURATION, dispersions=None, seed=None, batch_size=DEFAULT_BATCH_SIZE,
+                   method='euler', coast=False):
+    """Runs a Monte Carlo dispersion study in vectorized batches with constant memory.
+
+    dispersions maps parameter names from DEFAULT_DISPERSIONS to distribution
+    specs and overrides those defaults. Returns a dict with the sample and success
+    counts, the success probability and its standard error, and the streaming
+    histograms of final altitude and liftoff time.
+    """
+    if samples < 0 or batch_size < 1:
+        raise ValueError('samples must not be negative and batch_size must be a positive count.')
+    specs = dict(DEFAULT_DISPERSIONS)
+    for name, spec in (dispersions or {}).items():
+        if name not in specs:
+            raise ValueError(f'Cannot disperse {name!r}; expected one of {", ".join(specs)}.')
+        specs[name] = spec
+    distributions = {name: parse_distribution(spec) for name, spec in specs.items()}
+
+    rng = np.random.default_rng(seed)
+    altitude = StreamingHistogram()
+    liftoff_time = StreamingHistogram()
+    successes = 0
+    done = 0
+    while done < samples:
+        count = min(batch_size, samples - done)
+        drawn = {name: sample(rng, distribution, count) for name, distribution in distributions.items()}
+        result = simulate_batch(astronauts, drawn['thrust'], drawn['fuel_burn'], time_step, duration,
+                                method=method, coast=coast, dry_mass=drawn['dry_mass'],
+                                astronaut_mass=drawn['astronaut_mass'],
+                                drag_coefficient=drawn['drag_coefficient'])
+        successes += int(result['success'].sum())
+        altitude.add(result['altitude'])
+        liftoff_time.add(result['liftoff_time'])
+        done += count
+
+    probability = successes / samples if samples else math.nan
+    return {
+        'samples': samples,
+        'successes': successes,
+        'success_probability': probability,
+        'standard_error': math.sqrt(probability * (1 - probability) / samples) if samples else math.nan,
+        'altitude': altitude,
+        'liftoff_time': liftoff_time,
+    }
+
+def main():
+    """Command-line entry point for Monte Carlo dispersion runs."""
+    parser = argparse.ArgumentParser(description='Monte Carlo dispersion of vehicle and engine parameters.')
+    parser.add_argument('--samples', type=positive(int), default=1_000_000)
+    parser.add_argument('--astronauts', type=int, default=DEFAULT_ASTRONAUTS)
+    parser.add_argument('--time-step', type=float, default=DEFAULT_TIME_STEP)
+    parser.add_argument('--duration', type=float, default=DEFAULT_SIM_DURATION)
+    parser.add_argument('--batch-size', type=positive(int), default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--method', default='euler', choices=METHODS, help='integration method (default euler)')
+    parser.add_argument('--coast', action='store_true', help='keep flying after burnout until the duration')
+    for name, spec in DEFAULT_DISPERSIONS.items():
+        parser.add_argument(f'--{name.replace("_", "-")}', dest=name, default=spec, help=f'distribution (default {spec})')
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    report = run_dispersion(args.samples, args.astronauts, args.time_step, args.duration,
+                            {name: getattr(args, name) for name in DEFAULT_DISPERSIONS}, args.seed,
+                            args.batch_size, args.method, args.coast)
+    elapsed = time.perf_counter() - start_time
+
+    print(f'{report["samples"]:,} samples in {elapsed:.2f} s ({report["samples"] / elapsed:,.0f} samples/s)')
+    print(f'Success probability: {report["success_probability"]:.4%} +/- {report["standard_error"]:.4%}')
+    for name, unit in (('altitude', 'm'), ('liftoff_time', 's')):
+        histogram = report[name]
+        quantiles = ', '.join(f'p{q * 100:g}={histogram.quantile(q):.2f}' for q in REPORT_QUANTILES)
+        print(f'{name} ({unit}, {histogram.count:,} values): {quantiles}')
+
+if __name__ == '__main__':
+    main()
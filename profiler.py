@@ -0,0 +1,204 @@
+import argparse
+import collections
+import functools
+import json
+import time
+
+import numpy as np
+
+# Helpers timed on every call; names are rocket_game globals, while pygame.display.flip
+# and pygame.display.update are patched on pygame itself
+PROFILED_HELPERS = ('draw_stars', 'draw_mars', 'draw_school', 'draw_wormhole', 'draw_laser', 'show_text',
+                    'create_gradient_surface')
+HUD_WINDOW = 120 # frames the live percentiles are computed over
+HUD_COLOR = (0, 255, 0)
+HUD_BACKGROUND = (0, 0, 0, 170)
+
+class FrameProfiler:
+    """Opt-in per-draw-call timing for rocket_game.
+
+    install() swaps timing wrappers into rocket_game's globals (and pygame's
+    display.flip and display.update); stages look helpers up by global name, so every call is timed.
+    Nothing is patched until install() runs, which keeps the cost at zero when
+    profiling is off. Helper times are inclusive: draw_mars includes the
+    create_gradient_surface call it makes.
+    """
+
+    def __init__(self, game, hud=True):
+        self.game = game
+        self.hud = hud
+        self.originals = {}
+        self.stage = None
+        self.stages = {}
+        self.frame = collections.defaultdict(float)
+        self.recent = collections.deque(maxlen=HUD_WINDOW)
+        self.frame_start = time.perf_counter()
+        self.hud_font = None
+
+    def _timed(self, name, function):
+        """Wraps function so every call adds its duration to the current frame."""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.frame[name] += elapsed
+                self.frame[name + '#calls'] += 1
+        return wrapper
+
+    def _staged(self, name, function):
+        """Wraps a stage function so frames are attributed to it."""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.stage = name
+            self.stages.setdefault(name, {'frames': [], 'helpers': collections.defaultdict(lambda: [0, 0.0])})
+            self.frame.clear()
+            self.frame_start = time.perf_counter()
+            return function(*args, **kwargs)
+        return wrapper
+
+    def _present(self, function):
+        """Wraps present() to draw the HUD and close the frame once it is shown.
+
+        present() runs unpaced and the clock tick follows the timestamp, so the
+        frame's work time never includes the wait for the next frame slot.
+        """
+        @functools.wraps(function)
+        def wrapper():
+            game = self.game
+            if self.hud:
+                self.draw_hud()
+            fps, game.FPS = game.FPS, None
+            try:
+                function()
+            finally:
+                game.FPS = fps
+            self.end_frame(time.perf_counter() - self.frame_start)
+            if fps:
+                game.clock.tick(fps)
+            self.frame_start = time.perf_counter()
+        return wrapper
+
+    def install(self):
+        """Patches the timing wrappers into rocket_game."""
+        game = self.game
+        for name in PROFILED_HELPERS:
+            self.originals[name] = getattr(game, name)
+            setattr(game, name, self._timed(name, self.originals[name]))
+        for name in dir(game):
+            if name.startswith('stage_'):
+                self.originals[name] = getattr(game, name)
+                setattr(game, name, self._staged(name, self.originals[name]))
+        self.originals['present'] = game.present
+        game.present = self._present(game.present)
+        for name in ('flip', 'update'):
+            self.originals['pygame.display.' + name] = getattr(game.pygame.display, name)
+            setattr(game.pygame.display, name, self._timed('pygame.display.' + name, getattr(game.pygame.display, name)))
+        self.hud_font = game.pygame.font.Font(None, 22)
+
+    def uninstall(self):
+        """Restores everything install() replaced."""
+        game = self.game
+        for name in ('flip', 'update'):
+            setattr(game.pygame.display, name, self.originals.pop('pygame.display.' + name))
+        for name, function in self.originals.items():
+            setattr(game, name, function)
+        self.originals.clear()
+
+    def end_frame(self, work):
+        """Files the finished frame's work time and helper times under the current stage."""
+        self.recent.append(work)
+        if self.stage is not None:
+            stage = self.stages[self.stage]
+            stage['frames'].append(work)
+            for name, value in self.frame.items():
+                if not name.endswith('#calls'):
+                    stage['helpers'][name][0] += int(self.frame[name + '#calls'])
+                    stage['helpers'][name][1] += value
+        self.frame.clear()
+
+    def draw_hud(self):
+        """Draws frame-time percentiles over the last HUD_WINDOW frames in the top-left corner."""
+        if not self.recent:
+            return
+        game = self.game
+        times = np.array(self.recent) * 1000
+        p50, p95, p99 = np.percentile(times, (50, 95, 99))
+        slowest = sorted(((value, name) for name, value in self.frame.items() if not name.endswith('#calls')),
+                         reverse=True)[:3]
+        lines = [f'{self.stage or "-"}  frame p50 {p50:.2f}  p95 {p95:.2f}  p99 {p99:.2f} ms  '
+                 f'({1000 / p50:.0f} fps)' if p50 else f'{self.stage or "-"}']
+        lines += [f'{name}: {value * 1000:.2f} ms' for value, name in slowest]
+        rendered = [self.hud_font.render(line, True, HUD_COLOR) for line in lines]
+        width = max(surface.get_width() for surface in rendered) + 12
+        panel = game.pygame.Surface((width, 18 * len(rendered) + 8), game.pygame.SRCALPHA)
+        panel.fill(HUD_BACKGROUND)
+        for row, surface in enumerate(rendered):
+            panel.blit(surface, (6, 4 + row * 18))
+        game.screen.blit(panel, (8, 8))
+
+    def report(self):
+        """Per-stage frame-time percentiles and per-helper cost, as a JSON-ready dict."""
+        report = {}
+        for name, stage in self.stages.items():
+            frames = np.array(stage['frames']) * 1000
+            if not frames.size:
+                continue
+            total = frames.sum()
+            p50, p95, p99 = np.percentile(frames, (50, 95, 99))
+            report[name] = {
+                'frames': int(frames.size),
+                'mean_ms': float(frames.mean()),
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99),
+                'max_ms': float(frames.max()),
+                'over_budget': int((frames > 1000 / 60).sum()),
+                'helpers': {helper: {'calls': calls, 'ms_per_frame': seconds * 1000 / frames.size,
+                                     'share': seconds * 1000 / total}
+                            for helper, (calls, seconds) in sorted(stage['helpers'].items(),
+                                                                   key=lambda item: -item[1][1])},
+            }
+        return report
+
+def print_report(report):
+    """Prints the per-stage report as a readable table."""
+    for name, stage in report.items():
+        print(f'{name}: {stage["frames"]} frames, p50 {stage["p50_ms"]:.2f} ms, p95 {stage["p95_ms"]:.2f} ms, '
+              f'p99 {stage["p99_ms"]:.2f} ms, max {stage["max_ms"]:.2f} ms, '
+              f'{stage["over_budget"]} over the 60 fps budget')
+        for helper, cost in stage['helpers'].items():
+            print(f'    {helper:26} {cost["ms_per_frame"]:8.3f} ms/frame {cost["share"]:7.1%} '
+                  f'({cost["calls"]:,} calls)')
+
+def main():
+    """Command-line entry point that plays rocket_game with profiling switched on."""
+    parser = argparse.ArgumentParser(description='Play rocket_game with per-draw-call profiling.')
+    parser.add_argument('--report', default='profile.json', help='per-stage report written at exit')
+    parser.add_argument('--no-hud', action='store_true', help='collect timings without the on-screen overlay')
+    parser.add_argument('--unthrottled', action='store_true', help='render as fast as possible, skipping holds')
+    parser.add_argument('--dirty-rects', action='store_true', help='profile the dirty-rectangle display mode')
+    args = parser.parse_args()
+
+    import rocket_game
+
+    if args.unthrottled:
+        rocket_game.FPS = None
+    rocket_game.DIRTY_RECTS = args.dirty_rects
+    rocket_game.init()
+    profiler = FrameProfiler(rocket_game, hud=not args.no_hud)
+    profiler.install()
+    try:
+        rocket_game.main([])
+    finally:
+        profiler.uninstall()
+        report = profiler.report()
+        with open(args.report, 'w') as handle:
+            json.dump(report, handle, indent=2)
+        print_report(report)
+        print(f'Saved the frame-time report to {args.report}')
+
+if __name__ == '__main__':
+    main()
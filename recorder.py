@@ -0,0 +1,180 @@
+import argparse
+import math
+import os
+import struct
+
+import numpy as np
+
+from app import (
+    DEFAULT_ASTRONAUTS, DEFAULT_THRUST, DEFAULT_FUEL_BURN,
+    DEFAULT_TIME_STEP, DEFAULT_SIM_DURATION,
+)
+from flight import check_inputs, flight_steps
+from telemetry import positive
+
+# Columns stored for every trajectory sample, each a contiguous little-endian float64 array
+TRAJECTORY_COLUMNS = ('time', 'altitude', 'velocity', 'mass', 'fuel', 'thrust')
+
+# File layout: magic, then (version, column count, capacity, sample count), then
+# 16-byte column names, padded to HEADER_ALIGN; column c occupies capacity float64
+# values starting at header + c * capacity * 8
+TRAJECTORY_MAGIC = b'RKTRAJ\0\0'
+TRAJECTORY_VERSION = 1
+HEADER_STRUCT = struct.Struct('<IIQQ')
+NAME_SIZE = 16
+HEADER_ALIGN = 64
+DEFAULT_CHUNK_SIZE = 65536
+
+def _header_size(column_count):
+    """Bytes taken by the header for a file with column_count columns."""
+    size = len(TRAJECTORY_MAGIC) + HEADER_STRUCT.size + column_count * NAME_SIZE
+    return -(-size // HEADER_ALIGN) * HEADER_ALIGN
+
+def _read_header(handle):
+    """Parses a trajectory header; returns (columns, capacity, count, header size)."""
+    if handle.read(len(TRAJECTORY_MAGIC)) != TRAJECTORY_MAGIC:
+        raise ValueError('Not a trajectory file.')
+    version, column_count, capacity, count = HEADER_STRUCT.unpack(handle.read(HEADER_STRUCT.size))
+    if version != TRAJECTORY_VERSION:
+        raise ValueError(f'Unsupported trajectory file version {version}.')
+    columns = tuple(handle.read(NAME_SIZE).rstrip(b'\0').decode('ascii') for _ in range(column_count))
+    return columns, capacity, count, _header_size(column_count)
+
+class TrajectoryRecorder:
+    """Appends samples to a struct-of-arrays trajectory file that readers memory-map.
+
+    Samples collect in a fixed NumPy chunk and each full chunk is written straight
+    to its column offsets, so resident memory stays at one chunk no matter how long
+    the flight. The file grows (doubling its capacity) if a run outlives the
+    capacity it was created with.
+    """
+
+    def __init__(self, path, capacity, columns=TRAJECTORY_COLUMNS, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.columns = tuple(columns)
+        self.capacity = max(1, int(capacity))
+        self.count = 0
+        self.header_size = _header_size(len(self.columns))
+        self.chunk = np.empty((len(self.columns), chunk_size), dtype='<f8')
+        self.pending = 0
+
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.ftruncate(self.fd, self._file_size(self.capacity))
+        self._write_header()
+
+    def _file_size(self, capacity):
+        """Total file size for the given per-column capacity."""
+        return self.header_size + len(self.columns) * capacity * 8
+
+    def _column_offset(self, column, capacity=None):
+        """Byte offset of the first sample of a column."""
+        return self.header_size + column * (capacity or self.capacity) * 8
+
+    def _write_header(self):
+        """Writes the header block with the current capacity and sample count."""
+        names = b''.join(name.encode('ascii')[:NAME_SIZE].ljust(NAME_SIZE, b'\0') for name in self.columns)
+        header = TRAJECTORY_MAGIC + HEADER_STRUCT.pack(TRAJECTORY_VERSION, len(self.columns), self.capacity,
+                                                       self.count) + names
+        os.pwrite(self.fd, header.ljust(self.header_size, b'\0'), 0)
+
+    def _grow(self, needed):
+        """Doubles the capacity until needed samples fit, sliding columns to their new offsets."""
+        new_capacity = self.capacity
+        while new_capacity < needed:
+            new_capacity *= 2
+        os.ftruncate(self.fd, self._file_size(new_capacity))
+        # Move the last column first, back to front, so no chunk overwrites data not yet moved
+        step = self.chunk.shape[1] * 8
+        for column in range(len(self.columns) - 1, 0, -1):
+            source = self._column_offset(column)
+            target = self._column_offset(column, new_capacity)
+            for end in range(self.count * 8, 0, -step):
+                start = max(0, end - step)
+                os.pwrite(self.fd, os.pread(self.fd, end - start, source + start), target + start)
+        self.capacity = new_capacity
+
+    def append(self, record):
+        """Adds one sample; record maps column names to values."""
+        chunk = self.chunk
+        for column, name in enumerate(self.columns):
+            chunk[column, self.pending] = record[name]
+        self.pending += 1
+        if self.pending == chunk.shape[1]:
+            self.flush()
+
+    def flush(self):
+        """Writes the pending chunk into its columns and updates the header count."""
+        if self.pending:
+            if self.count + self.pending > self.capacity:
+                self._grow(self.count + self.pending)
+            for column in range(len(self.columns)):
+                os.pwrite(self.fd, self.chunk[column, :self.pending].tobytes(),
+                          self._column_offset(column) + self.count * 8)
+            self.count += self.pending
+            self.pending = 0
+        self._write_header()
+
+    def close(self):
+        """Writes the remaining samples and closes the file."""
+        if self.fd is not None:
+            self.flush()
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def open_trajectory(path, mode='r'):
+    """Maps a trajectory file and returns {column: array} views of its samples without copying."""
+    with open(path, 'rb') as handle:
+        columns, capacity, count, header_size = _read_header(handle)
+    data = np.memmap(path, dtype='<f8', mode=mode, offset=header_size, shape=(len(columns), capacity))
+    return {name: data[column, :count] for column, name in enumerate(columns)}
+
+def record_flight(path, astronauts, thrust, fuel_burn, time_step, duration, every=1, coast=False,
+                  chunk_size=DEFAULT_CHUNK_SIZE):
+    """Streams one flight from flight_steps into a trajectory file; returns the sample count."""
+    check_inputs(astronauts, thrust, fuel_burn, time_step, duration)
+    if every < 1:
+        raise ValueError('every must be a positive step count.')
+    capacity = math.ceil(duration / time_step / every) + 2
+    with TrajectoryRecorder(path, capacity, chunk_size=chunk_size) as recorder:
+        for record in flight_steps(astronauts, thrust, fuel_burn, time_step, duration, every=every, coast=coast):
+            recorder.append(record)
+    return recorder.count
+
+def main():
+    """Command-line entry point to record a flight or summarize a recording."""
+    parser = argparse.ArgumentParser(description='Record a flight trajectory to a memory-mapped column file.')
+    parser.add_argument('--astronauts', type=int, default=DEFAULT_ASTRONAUTS)
+    parser.add_argument('--thrust', type=float, default=DEFAULT_THRUST)
+    parser.add_argument('--fuel-burn', type=float, default=DEFAULT_FUEL_BURN)
+    parser.add_argument('--time-step', type=float, default=DEFAULT_TIME_STEP)
+    parser.add_argument('--duration', type=float, default=DEFAULT_SIM_DURATION)
+    parser.add_argument('--every', type=positive(int), default=1, help='keep every n-th step')
+    parser.add_argument('--coast', action='store_true', help='keep flying after burnout until the duration')
+    parser.add_argument('--output', default='trajectory.trj', help='trajectory file to write')
+    parser.add_argument('--info', metavar='PATH', help='summarize an existing trajectory file instead')
+    args = parser.parse_args()
+
+    if args.info:
+        trajectory = open_trajectory(args.info)
+        samples = len(trajectory['time'])
+        print(f'{args.info}: {samples:,} samples, {os.path.getsize(args.info):,} bytes')
+        for name, values in trajectory.items():
+            if samples:
+                print(f'- {name}: {values[0]:.2f} .. {values[-1]:.2f} (max {values.max():.2f})')
+        return
+
+    try:
+        samples = record_flight(args.output, args.astronauts, args.thrust, args.fuel_burn, args.time_step,
+                                args.duration, args.every, args.coast)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f'Recorded {samples:,} samples to {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Headless rendering: no window and no audio device, set before pygame is first imported
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+VIDEO_FPS = 60 # the stages are written for 60 frames per second
+DEFAULT_SEED = 0
+
+class FrameSink:
+    """Collects one stage's frames as numbered PNG files or raw RGB24 bytes.
+
+    Raw frames go to stream when one is given, otherwise to the stage's own .rgb
+    file. PNG frames are numbered from start. Holds (wait_or_skip pauses) become
+    repeats of the last frame: a PNG is copied rather than encoded again and raw
+    bytes are written again.
+    """
+
+    def __init__(self, directory, prefix, raw=False, stream=None, start=0):
+        self.directory = directory
+        self.prefix = prefix
+        self.raw = raw
+        self.start = start
+        self.count = 0
+        self.last = None
+        self.handle = stream or (open(os.path.join(directory, prefix + '.rgb'), 'wb') if raw else None)
+        self.owned = raw and stream is None
+
+    def path(self, number):
+        """File name of frame number of this stage."""
+        return os.path.join(self.directory, f'{self.prefix}_{self.start + number:06d}.png')
+
+    def add(self, surface):
+        """Stores the surface's current pixels as the next frame."""
+        import pygame
+
+        if self.raw:
+            self.last = pygame.image.tobytes(surface, 'RGB')
+            self.handle.write(self.last)
+        else:
+            self.last = self.path(self.count)
+            pygame.image.save(surface, self.last)
+        self.count += 1
+
+    def repeat(self, frames):
+        """Holds the last frame for this many more frames."""
+        if self.last is None:
+            return
+        for _ in range(frames):
+            if self.raw:
+                self.handle.write(self.last)
+            else:
+                shutil.copyfile(self.last, self.path(self.count))
+            self.count += 1
+
+    def close(self):
+        if self.owned:
+            self.handle.close()
+
+def render_stage(job, sink=None):
+    """Renders one rocket_game stage into sink, or its own files in directory; returns (index, stage name, frame count).
+
+    The global and particle RNGs are seeded from seed and the stage index, so a
+    stage draws the same frames whichever process renders it.
+    """
+    index, name, directory, raw, seed = job
+    import rocket_game
+
+    rocket_game.init()
+    random.seed(seed + index)
+    rocket_game.particle_rng = np.random.default_rng(seed + index)
+    sink = sink or FrameSink(directory, f'stage{index:02d}', raw)
+    patched = {'FPS': None,
+               'present': lambda: sink.add(rocket_game.screen),
+               'wait_or_skip': lambda duration: sink.repeat(round(duration * VIDEO_FPS)) or True}
+    originals = {key: getattr(rocket_game, key) for key in patched}
+    for key, value in patched.items():
+        setattr(rocket_game, key, value)
+    try:
+        getattr(rocket_game, name)()
+    finally:
+        for key, value in originals.items():
+            setattr(rocket_game, key, value)
+        sink.close()
+    return index, name, sink.count
+
+# Stages taken so far, shared between render() and its pool: one flag per stage
+_claims = None
+
+def _share_claims(claims):
+    global _claims
+    _claims = claims
+
+def claim(claims, index):
+    """Marks stage index as taken; False if another process took it first."""
+    with claims.get_lock():
+        if claims[index]:
+            return False
+        claims[index] = 1
+        return True
+
+def render_claimed(job):
+    """Pool entry point: renders the stage unless render() already took it, returning a None count then."""
+    if not claim(_claims, job[0]):
+        return job[0], job[1], None
+    return render_stage(job)
+
+def render(stages, output, raw=False, workers=1, seed=DEFAULT_SEED, log=sys.stderr):
+    """Renders stages as fast as possible and stitches their frames together in order.
+
+    PNG frames are numbered frame_000000.png onwards in the output directory. Raw
+    RGB24 frames are appended to output, a binary stream. This process renders
+    the stage at the head of the line straight into the output, so a raw stream
+    starts flowing at once; with workers > 1, a pool of workers - 1 processes
+    renders the stages after it into their own files, which are joined in
+    playing order once the head reaches them. Returns the total frame count.
+    """
+    if not raw:
+        os.makedirs(output, exist_ok=True)
+    jobs = [(index, name, None, raw, seed) for index, name in enumerate(stages)]
+
+    pool = staging = None
+    if workers > 1 and len(jobs) > 1:
+        staging = tempfile.TemporaryDirectory(prefix='render-') if raw else None
+        directory = staging.name if raw else output
+        jobs = [(index, name, directory, raw, seed) for index, name, _, _, _ in jobs]
+        # Spawned, not forked, so no worker inherits an initialised SDL
+        context = multiprocessing.get_context('spawn')
+        claims = context.Array('b', len(jobs))
+        pool = context.Pool(min(workers - 1, len(jobs) - 1), initializer=_share_claims, initargs=(claims,))
+        finished = pool.imap_unordered(render_claimed, jobs)
+    done = {} # frame counts of stages the pool finished before the head reached them
+
+    total = 0
+    start = time.perf_counter()
+    try:
+        for job in jobs:
+            index, name, directory = job[:3]
+            if pool is None or claim(claims, index):
+                sink = FrameSink(None if raw else output, 'frame', raw, output if raw else None, total)
+                count = render_stage(job, sink)[2]
+            else:
+                while index not in done:
+                    finished_index, _, finished_count = next(finished)
+                    done[finished_index] = finished_count
+                count = done.pop(index)
+                prefix = os.path.join(directory, f'stage{index:02d}')
+                if raw:
+                    with open(prefix + '.rgb', 'rb') as handle:
+                        shutil.copyfileobj(handle, output)
+                    os.remove(prefix + '.rgb')
+                else:
+                    for number in range(count):
+                        os.replace(f'{prefix}_{number:06d}.png',
+                                   os.path.join(output, f'frame_{total + number:06d}.png'))
+            total += count
+            print(f'{name}: {count} frames ({total} total, {time.perf_counter() - start:.1f} s)', file=log)
+    finally:
+        if pool:
+            pool.terminate()
+        if staging:
+            staging.cleanup()
+    return total
+
+def main():
+    """Command-line entry point that renders the adventure without a window."""
+    import rocket_game
+
+    names = [name for _, name in rocket_game.STAGES]
+    parser = argparse.ArgumentParser(
+        description='Render rocket_game headless at full speed to a PNG sequence or raw RGB video.',
+        epilog=f'Raw output pipes into an encoder, for example: python render.py --raw | ffmpeg -f rawvideo '
+               f'-pix_fmt rgb24 -s {rocket_game.WIDTH}x{rocket_game.HEIGHT} -r {VIDEO_FPS} -i - cutscene.mp4')
+    parser.add_argument('--output', help='directory for the PNG sequence (default: frames), '
+                                         'or file for the raw video (default: stdout)')
+    parser.add_argument('--raw', action='store_true', help='write raw RGB24 frames instead of PNG files')
+    parser.add_argument('--stages', default=','.join(names), help='comma-separated stages to render, in order')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='processes rendering stages in parallel')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='base seed for the random effects')
+    args = parser.parse_args()
+
+    stages = args.stages.split(',')
+    unknown = [name for name in stages if name not in names]
+    if unknown:
+        parser.error(f'unknown stage(s) {", ".join(unknown)}; choose from {", ".join(names)}')
+
+    start = time.perf_counter()
+    if args.raw and args.output in (None, '-'):
+        total = render(stages, sys.stdout.buffer, True, args.workers, args.seed)
+        sys.stdout.buffer.flush()
+    elif args.raw:
+        with open(args.output, 'wb') as handle:
+            total = render(stages, handle, True, args.workers, args.seed)
+    else:
+        total = render(stages, args.output or 'frames', False, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    print(f'Rendered {total} frames in {elapsed:.1f} s ({total / elapsed:.0f} fps)', file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -1,22 +1,45 @@
-import pygame
-import requests
-import io
+import argparse
 import math
 import random
+import re
 import time
-from PIL import Image
-
-# Initialize Pygame
-pygame.init()
-pygame.mixer.init()
+import numpy as np
+import pygame
+from effects import ParticleSystem, Starfield, SurfaceCache, TrackedCanvas, blit_batch, circle_sprite, shape
 
-# Screen settings
+# Screen settings; the window is only opened by init()
 WIDTH = 1200
 HEIGHT = 800
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("🚀 Epic Space Adventure - Python Rocket 🚀")
+CAPTION = "🚀 Epic Space Adventure - Python Rocket 🚀"
+screen = None
 clock = pygame.time.Clock()
 
+def init():
+    """Open the game window, once; the draw helpers work on any surface without it.
+
+    screen is the window itself, or with DIRTY_RECTS the off-screen canvas the
+    stages draw on. Only the display and font modules start; the game plays no
+    sound, so no audio device is opened.
+    """
+    global screen
+    if screen is None or not pygame.display.get_init():
+        pygame.display.init()
+        pygame.font.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption(CAPTION)
+        if DIRTY_RECTS:
+            screen = TrackedCanvas((WIDTH, HEIGHT), screen)
+    return screen
+
+# Frame rate the stages are paced at; None renders as fast as possible and skips holds
+FPS = 60
+
+# Dirty-rectangle mode: stages draw on a TrackedCanvas and only the regions they
+# drew (this frame and last) are sent to the window; set before init(). Off by
+# default: tracking and the extra canvas copy cost more than a flip wherever
+# display updates are cheap, so it only pays off on slow (remote, software) displays
+DIRTY_RECTS = False
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -28,53 +51,125 @@ YELLOW = (255, 255, 0)
 GREEN = (50, 205, 50)
 BLUE = (30, 144, 255)
 
+# Seed for the Mars mountain range, so the skyline stays put between frames
+MOUNTAIN_SEED = 42
+
+# Relative scroll speeds of the starfield's parallax layers, far to near
+STAR_LAYERS = (0.25, 0.5, 1.0)
+
+# Particle pool shared by the stages, and the flame trail and sparkle settings
+PARTICLE_CAPACITY = 4096
+FLAME_TRAIL_LIFE = 5 # frames
+FLAME_TRAIL_SPEED = 16 # pixels per frame, backward relative to the screen
+WORMHOLE_SPARKLES = 10 # spawned per frame
+
+# Memory cap for cached text surfaces
+TEXT_CACHE_BYTES = 8 * 1024 * 1024
+
+# Character sprites are cached per scale rounded to this step, within a memory cap
+SPRITE_SCALE_STEP = 0.01
+SPRITE_CACHE_BYTES = 16 * 1024 * 1024
+SPRITE_COLORKEY = (255, 0, 255) # transparent color, unused by any character
+
+class LazyFont:
+    """Stand-in for pygame.font.Font that loads the font on first use."""
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size_points = size
+        self.font = None
+
+    def __getattr__(self, attribute):
+        if self.font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.font = pygame.font.Font(self.name, self.size_points)
+        return getattr(self.font, attribute)
+
 # Fonts
-title_font = pygame.font.Font(None, 72)
-large_font = pygame.font.Font(None, 48)
-medium_font = pygame.font.Font(None, 36)
-small_font = pygame.font.Font(None, 28)
+title_font = LazyFont(None, 72)
+large_font = LazyFont(None, 48)
+medium_font = LazyFont(None, 36)
+small_font = LazyFont(None, 28)
+
+text_cache = SurfaceCache(TEXT_CACHE_BYTES)
+sprite_cache = SurfaceCache(SPRITE_CACHE_BYTES)
+
+def character_sprite(render, scale, *args):
+    """Return render's drawing at a quantized scale as a cropped alpha sprite centered on its anchor."""
+    scale = round(round(scale / SPRITE_SCALE_STEP) * SPRITE_SCALE_STEP, 6)
+
+    def build():
+        anchor = int(200 * scale) + 20
+        canvas = pygame.Surface((2 * anchor, 2 * anchor), pygame.SRCALPHA)
+        render(canvas, anchor, anchor, scale, *args)
+        rect = canvas.get_bounding_rect()
+        half_width = max(anchor - rect.left, rect.right - anchor, 1)
+        half_height = max(anchor - rect.top, rect.bottom - anchor, 1)
+        # Coverage is all or nothing, so an RLE colorkey blits much faster than per-pixel alpha
+        sprite = pygame.Surface((2 * half_width, 2 * half_height))
+        sprite.fill(SPRITE_COLORKEY)
+        sprite.blit(canvas, (half_width - anchor, half_height - anchor))
+        sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        return sprite
+
+    return sprite_cache.get((render.__name__, scale) + args, build)
+
+def blit_centered(surface, sprite, x, y):
+    """Blit a sprite from character_sprite so its anchor lands on (x, y)."""
+    surface.blit(sprite, (int(x) - sprite.get_width()//2, int(y) - sprite.get_height()//2))
 
 def load_image_from_url(url, size=None):
-    """Load an image from URL and optionally resize it."""
-    try:
-        response = requests.get(url, timeout=10)
-        image = Image.open(io.BytesIO(response.content))
-        image = image.convert("RGBA")
-        if size:
-            image = image.resize(size, Image.Resampling.LANCZOS)
-        mode = image.mode
-        data = image.tobytes()
-        return pygame.image.fromstring(data, image.size, mode)
-    except Exception as e:
-        print(f"Could not load image from {url}: {e}")
-        return None
+    """Load an image from URL (or file:// URL or path) and optionally resize it, through the shared asset cache."""
+    from assets import default_loader
+
+    return default_loader().load(url, size)
 
 def create_gradient_surface(width, height, color1, color2, vertical=True):
     """Create a gradient surface."""
-    surface = pygame.Surface((width, height))
-    for i in range(height if vertical else width):
-        ratio = i / (height if vertical else width)
-        r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-        g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-        b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-        if vertical:
-            pygame.draw.line(surface, (r, g, b), (0, i), (width, i))
-        else:
-            pygame.draw.line(surface, (r, g, b), (i, 0), (i, height))
-    return surface
+    # Build a one-pixel strip in bulk, then stretch it across the other axis
+    length = height if vertical else width
+    ratio = np.arange(length)[:, None] / length
+    colors = (np.array(color1[:3]) + (np.array(color2[:3]) - np.array(color1[:3])) * ratio).astype(np.int64)
+    strip = pygame.Surface((1, length) if vertical else (length, 1))
+    pygame.surfarray.blit_array(strip, colors[None, :, :] if vertical else colors[:, None, :])
+    return pygame.transform.scale(strip, (width, height))
 
-def draw_stars(surface, num_stars=100, offset=0):
-    """Draw twinkling stars."""
-    random.seed(42)  # Consistent star positions
-    for i in range(num_stars):
-        x = random.randint(0, WIDTH)
-        y = random.randint(0, HEIGHT)
-        brightness = 150 + int(50 * math.sin((offset + i) * 0.1))
-        size = random.choice([1, 1, 1, 2, 2, 3])
-        pygame.draw.circle(surface, (brightness, brightness, brightness), (x, y), size)
+# Pre-rendered static backgrounds, keyed by layer and offset; cleared when the resolution changes
+_layer_cache = {}
+_layer_cache_size = None
 
-def draw_rocket(surface, x, y, scale=1.0, with_flame=True):
-    """Draw a detailed rocket."""
+def cached_layer(key, build):
+    """Return the pre-rendered layer for key, building it once per resolution."""
+    global _layer_cache_size
+    if _layer_cache_size != (WIDTH, HEIGHT):
+        _layer_cache.clear()
+        _layer_cache_size = (WIDTH, HEIGHT)
+    layer = _layer_cache.get(key)
+    if layer is None:
+        layer = pygame.Surface((WIDTH, HEIGHT))
+        build(layer)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        _layer_cache[key] = layer
+    return layer
+
+particles = ParticleSystem(PARTICLE_CAPACITY)
+particle_rng = np.random.default_rng()
+
+# Starfields built once per star count and resolution
+_starfields = {}
+
+def draw_stars(surface, num_stars=100, offset=0, scroll=0):
+    """Draw twinkling stars, scrolled by scroll pixels at the nearest layer's speed."""
+    key = (num_stars, WIDTH, HEIGHT)
+    starfield = _starfields.get(key)
+    if starfield is None:
+        starfield = _starfields[key] = Starfield(WIDTH, HEIGHT, num_stars, layers=STAR_LAYERS)
+    starfield.draw(surface, offset, scroll)
+
+def render_rocket(surface, x, y, scale=1.0):
+    """Draw the rocket without its flame, for the sprite cache."""
     # Rocket body
     body_width = int(60 * scale)
     body_height = int(150 * scale)
@@ -115,6 +210,11 @@ def draw_rocket(surface, x, y, scale=1.0, with_flame=True):
         (x + body_width//2, y + body_height//2)
     ]
     pygame.draw.polygon(surface, (200, 30, 30), right_fin)
+
+def draw_rocket(surface, x, y, scale=1.0, with_flame=True):
+    """Draw a detailed rocket."""
+    blit_centered(surface, character_sprite(render_rocket, scale), x, y)
+    body_height = int(150 * scale)
     
     # Flame
     if with_flame:
@@ -126,26 +226,30 @@ def draw_rocket(surface, x, y, scale=1.0, with_flame=True):
             (x + flame_offset, y + body_height//2 + flame_height)
         ]
         # Outer flame (orange)
-        pygame.draw.polygon(surface, ORANGE, flame_points)
+        shape(pygame.draw.polygon, surface, ORANGE, flame_points)
         # Inner flame (yellow)
         inner_points = [
             (x - int(15 * scale), y + body_height//2),
             (x + int(15 * scale), y + body_height//2),
             (x + flame_offset//2, y + body_height//2 + flame_height * 0.7)
         ]
-        pygame.draw.polygon(surface, YELLOW, inner_points)
+        shape(pygame.draw.polygon, surface, YELLOW, inner_points)
 
 def draw_earth(surface, x, y, radius):
     """Draw Earth."""
-    pygame.draw.circle(surface, (30, 100, 200), (x, y), radius)
+    shape(pygame.draw.circle, surface, (30, 100, 200), (x, y), radius)
     # Continents (simplified)
-    pygame.draw.ellipse(surface, (50, 150, 50), (x - radius//2, y - radius//3, radius, radius//2))
-    pygame.draw.circle(surface, (50, 150, 50), (x + radius//3, y + radius//3), radius//4)
+    shape(pygame.draw.ellipse, surface, (50, 150, 50), (x - radius//2, y - radius//3, radius, radius//2))
+    shape(pygame.draw.circle, surface, (50, 150, 50), (x + radius//3, y + radius//3), radius//4)
     # Atmosphere glow
-    pygame.draw.circle(surface, (100, 150, 255), (x, y), radius + 5, 3)
+    shape(pygame.draw.circle, surface, (100, 150, 255), (x, y), radius + 5, 3)
 
 def draw_mars(surface, y_offset=0):
     """Draw Mars surface."""
+    surface.blit(cached_layer(("mars", y_offset), lambda layer: render_mars(layer, y_offset)), (0, 0))
+
+def render_mars(surface, y_offset=0):
+    """Render the Mars backdrop that draw_mars caches."""
     # Mars sky gradient
     sky = create_gradient_surface(WIDTH, HEIGHT//2, (80, 30, 10), (150, 60, 20))
     surface.blit(sky, (0, 0))
@@ -162,9 +266,10 @@ def draw_mars(surface, y_offset=0):
         pygame.draw.ellipse(surface, (130, 40, 8), (cx + 5, cy + 5, crater_size - 10, crater_size//2 - 5))
     
     # Mountains
+    mountains = random.Random(MOUNTAIN_SEED)
     mountain_points = [(0, HEIGHT//2 + y_offset)]
     for i in range(12):
-        peak = HEIGHT//2 + y_offset - random.randint(30, 100)
+        peak = HEIGHT//2 + y_offset - mountains.randint(30, 100)
         mountain_points.append((i * 100 + 50, peak))
         mountain_points.append((i * 100 + 100, HEIGHT//2 + y_offset))
     mountain_points.append((WIDTH, HEIGHT//2 + y_offset))
@@ -174,7 +279,10 @@ def draw_alien(surface, x, y, scale=1.0, alive=True):
     """Draw an alien."""
     if not alive:
         return
-    
+    blit_centered(surface, character_sprite(render_alien, scale), x, y)
+
+def render_alien(surface, x, y, scale=1.0):
+    """Draw the alien, for the sprite cache."""
     # Body (green)
     body_color = (100, 200, 100)
     head_size = int(40 * scale)
@@ -205,6 +313,10 @@ def draw_alien(surface, x, y, scale=1.0, alive=True):
 
 def draw_astronaut(surface, x, y, scale=1.0, facing_right=True):
     """Draw an astronaut."""
+    blit_centered(surface, character_sprite(render_astronaut, scale, facing_right), x, y)
+
+def render_astronaut(surface, x, y, scale=1.0, facing_right=True):
+    """Draw the astronaut, for the sprite cache."""
     # Helmet
     helmet_size = int(35 * scale)
     pygame.draw.circle(surface, WHITE, (x, y - int(20 * scale)), helmet_size)
@@ -235,8 +347,8 @@ def draw_astronaut(surface, x, y, scale=1.0, facing_right=True):
 
 def draw_laser(surface, start_x, end_x, y):
     """Draw a laser beam."""
-    pygame.draw.line(surface, RED, (start_x, y), (end_x, y), 6)
-    pygame.draw.line(surface, YELLOW, (start_x, y), (end_x, y), 2)
+    shape(pygame.draw.line, surface, RED, (start_x, y), (end_x, y), 6)
+    shape(pygame.draw.line, surface, YELLOW, (start_x, y), (end_x, y), 2)
     # Glow effect
     for i in range(3):
         alpha = 100 - i * 30
@@ -260,14 +372,18 @@ def draw_wormhole(surface, x, y, radius, rotation):
                 py = y + (r + wobble) * 0.4 * math.sin(a)  # Elliptical
                 points.append((px, py))
             if len(points) > 2:
-                pygame.draw.polygon(surface, color, points, 3)
+                shape(pygame.draw.polygon, surface, color, points, 3)
     
     # Center glow
-    pygame.draw.circle(surface, (200, 100, 255), (x, y), 30)
-    pygame.draw.circle(surface, WHITE, (x, y), 15)
+    shape(pygame.draw.circle, surface, (200, 100, 255), (x, y), 30)
+    shape(pygame.draw.circle, surface, WHITE, (x, y), 15)
 
 def draw_school(surface):
     """Draw Vianney High School."""
+    surface.blit(cached_layer("school", render_school), (0, 0))
+
+def render_school(surface):
+    """Render the school scene that draw_school caches."""
     # Sky
     sky = create_gradient_surface(WIDTH, HEIGHT, (135, 206, 235), (70, 130, 180))
     surface.blit(sky, (0, 0))
@@ -339,33 +455,82 @@ def draw_school(surface):
         pygame.draw.circle(surface, (40, 120, 40), (tx - 20, HEIGHT - 200), 30)
         pygame.draw.circle(surface, (40, 120, 40), (tx + 20, HEIGHT - 200), 30)
 
+# Unit vectors of the explosion's particle ring, one particle every 30 degrees
+EXPLOSION_RING = np.stack([np.cos(np.arange(12) * 30 * math.pi / 180), np.sin(np.arange(12) * 30 * math.pi / 180)], axis=1)
+_explosion_sprite = circle_sprite(ORANGE, 5)
+
 def draw_explosion(surface, x, y, frame):
     """Draw an explosion."""
     colors = [YELLOW, ORANGE, RED, (200, 100, 50)]
     for i in range(4):
         radius = (frame + 1) * 15 - i * 10
         if radius > 0:
-            pygame.draw.circle(surface, colors[i], (x, y), radius)
+            shape(pygame.draw.circle, surface, colors[i], (x, y), radius)
     
     # Particles
-    for i in range(12):
-        angle = i * 30 * math.pi / 180
-        dist = frame * 20
-        px = x + dist * math.cos(angle)
-        py = y + dist * math.sin(angle)
-        pygame.draw.circle(surface, ORANGE, (int(px), int(py)), 5)
+    ring = (np.array([x, y]) + EXPLOSION_RING * (frame * 20)).astype(np.int64) - 6
+    blit_batch(surface, [_explosion_sprite] * len(ring), map(tuple, ring.tolist()))
+
+def render_text(text, font=large_font, color=WHITE, antialias=True):
+    """Render text through the cache; returns the cached surface."""
+    return text_cache.get((text, font, color, antialias), lambda: font.render(text, antialias, color))
+
+def tinted_text(text, font=large_font, color=WHITE):
+    """Text in a color that changes every frame: a copy of the cached white render, tinted.
+
+    Caching each color would fill text_cache with one-frame surfaces and evict
+    the static strings; multiplying white by the color gives the same pixels.
+    """
+    surface = render_text(text, font).copy()
+    surface.fill(color, special_flags=pygame.BLEND_RGB_MULT)
+    return surface
+
+def text_pieces(text, font=large_font, color=WHITE):
+    """Cached surfaces that spell out text: single glyphs for digits, whole runs for the rest."""
+    # Counters change every frame, so compose them from ten cached digits instead
+    return [render_text(piece, font, color) for piece in re.findall(r"\d|\D+", text)]
 
 def show_text(surface, text, y, font=large_font, color=WHITE, center=True):
     """Display text on screen."""
-    rendered = font.render(text, True, color)
+    pieces = text_pieces(text, font, color)
     if center:
-        x = WIDTH//2 - rendered.get_width()//2
+        x = WIDTH//2 - sum(piece.get_width() for piece in pieces)//2
     else:
         x = 50
-    surface.blit(rendered, (x, y))
+    for piece in pieces:
+        surface.blit(piece, (x, y))
+        x += piece.get_width()
+
+# How much of the screen dirty-rectangle mode sent to the display
+dirty_stats = {"frames": 0, "pixels_updated": 0, "pixels_total": 0}
+
+def update_dirty():
+    """Copy the regions the frame changed from the canvas to the window and update only those."""
+    rects = screen.end_frame()
+    window = pygame.display.get_surface()
+    if rects == [screen.full]:
+        window.blit(screen, (0, 0))
+        pygame.display.flip()
+    elif rects:
+        window.blits([(screen, rect, rect) for rect in rects], doreturn=False)
+        pygame.display.update(rects)
+    dirty_stats["frames"] += 1
+    dirty_stats["pixels_updated"] += sum(rect.width * rect.height for rect in rects)
+    dirty_stats["pixels_total"] += screen.get_width() * screen.get_height()
+
+def present():
+    """Show the finished frame, then wait for the next frame slot."""
+    if isinstance(screen, TrackedCanvas):
+        update_dirty()
+    else:
+        pygame.display.flip()
+    if FPS:
+        clock.tick(FPS)
 
 def wait_or_skip(duration):
     """Wait for duration but allow skipping with any key."""
+    if not FPS:
+        return True
     start = time.time()
     while time.time() - start < duration:
         for event in pygame.event.get():
@@ -373,7 +538,7 @@ def wait_or_skip(duration):
                 return False
             if event.type == pygame.KEYDOWN:
                 return True
-        clock.tick(60)
+        clock.tick(FPS)
     return True
 
 def stage_launch():
@@ -403,55 +568,55 @@ def stage_launch():
         elif frame > 120:
             show_text(screen, "LEAVING ATMOSPHERE...", 50, large_font, YELLOW)
         
-        pygame.display.flip()
-        clock.tick(60)
+        present()
     
     return True
 
 def stage_space_travel():
     """Stage 2: Travel through space to Mars."""
+    particles.clear()
     for frame in range(240):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
         
         screen.fill(BLACK)
-        draw_stars(screen, 200, frame * 2)
+        draw_stars(screen, 200, frame * 2, frame * 4)
         
         # Rocket moving across screen
         rocket_x = 100 + frame * 4
         rocket_y = HEIGHT//2 + math.sin(frame * 0.05) * 30
         
         # Draw rocket (rotated to face right - simplified)
-        pygame.draw.polygon(screen, (200, 200, 210), [
+        shape(pygame.draw.polygon, screen, (200, 200, 210), [
             (rocket_x + 60, rocket_y),
             (rocket_x - 40, rocket_y - 25),
             (rocket_x - 40, rocket_y + 25)
         ])
-        pygame.draw.polygon(screen, (200, 30, 30), [
+        shape(pygame.draw.polygon, screen, (200, 30, 30), [
             (rocket_x + 60, rocket_y),
             (rocket_x + 80, rocket_y),
             (rocket_x + 60, rocket_y - 15),
             (rocket_x + 60, rocket_y + 15)
         ])
-        # Flame trail
-        for i in range(5):
-            fx = rocket_x - 50 - i * 20
-            pygame.draw.circle(screen, ORANGE if i % 2 == 0 else YELLOW, 
-                             (fx + random.randint(-5, 5), rocket_y + random.randint(-5, 5)), 10 - i)
+        # Flame trail: one puff per frame that drifts back and shrinks
+        particles.update()
+        particles.spawn((rocket_x - 50 + random.randint(-5, 5), rocket_y + random.randint(-5, 5)),
+                        (-FLAME_TRAIL_SPEED, random.uniform(-1, 1)), FLAME_TRAIL_LIFE, 10,
+                        ORANGE if frame % 2 == 0 else YELLOW, shrink=1)
+        shape(particles.draw, screen)
         
         # Mars appearing
         mars_size = min(frame // 2, 80)
         if mars_size > 0:
-            pygame.draw.circle(screen, MARS_RED, (WIDTH - 100, HEIGHT//2), mars_size)
+            shape(pygame.draw.circle, screen, MARS_RED, (WIDTH - 100, HEIGHT//2), mars_size)
         
         # Distance counter
         distance = max(0, 225 - frame)
         show_text(screen, f"DISTANCE TO MARS: {distance} MILLION KM", 50, medium_font)
         show_text(screen, "INTERPLANETARY TRAVEL", HEIGHT - 80, large_font, BLUE)
         
-        pygame.display.flip()
-        clock.tick(60)
+        present()
     
     return True
 
@@ -479,8 +644,7 @@ def stage_mars_landing():
         if frame > 150:
             show_text(screen, "TOUCHDOWN!", HEIGHT - 100, title_font, GREEN)
         
-        pygame.display.flip()
-        clock.tick(60)
+        present()
     
     return wait_or_skip(1.5)
 
@@ -513,8 +677,7 @@ def stage_alien_encounter():
         
         show_text(screen, "FIRST CONTACT", 50, title_font, YELLOW)
         
-        pygame.display.flip()
-        clock.tick(60)
+        present()
     
     return wait_or_skip(1.0)
 
@@ -566,13 +729,13 @@ def stage_alien_fight():
             show_text(screen, "ALIEN ELIMINATED", 50, title_font, GREEN)
             show_text(screen, '"GET REKT LMAOOO"', HEIGHT - 80, medium_font, YELLOW)
         
-        pygame.display.flip()
-        clock.tick(60)
+        present()
     
     return wait_or_skip(1.0)
 
 def stage_wormhole():
     """Stage 6: Enter the wormhole."""
+    particles.clear()
     wormhole_size = 0
     astro_x = 350
     
@@ -598,12 +761,13 @@ def stage_wormhole():
             draw_astronaut(screen, astro_x, HEIGHT//2 + 50, 1.0)
         
         # Trippy effects when entering
+        particles.update()
         if frame > 150:
-            for i in range(10):
-                color = ((frame * 10 + i * 25) % 255, 0, (frame * 5 + i * 50) % 255)
-                pygame.draw.circle(screen, color, 
-                                 (random.randint(0, WIDTH), random.randint(0, HEIGHT)), 
-                                 random.randint(5, 20))
+            i = np.arange(WORMHOLE_SPARKLES)
+            colors = np.stack([(frame * 10 + i * 25) % 255, np.zeros_like(i), (frame * 5 + i * 50) % 255], axis=1)
+            positions = particle_rng.integers(0, [WIDTH + 1, HEIGHT + 1], size=(WORMHOLE_SPARKLES, 2))
+            particles.spawn(positions, life=1, radius=particle_rng.integers(5, 21, WORMHOLE_SPARKLES), color=colors)
+            shape(particles.draw, screen)
         
         # Text
         if frame < 60:
@@ -615,8 +779,7 @@ def stage_wormhole():
             show_text(screen, "ENTERING WORMHOLE", 50, title_font, WHITE)
             show_text(screen, "AAAAAAHHHHH!!!", HEIGHT - 80, large_font, YELLOW)
         
-        pygame.display.flip()
-        clock.tick(60)
+        present()
     
     return True
 
@@ -641,13 +804,13 @@ def stage_vianney():
             draw_astronaut(screen, WIDTH//2, astro_y, 1.0)
             # Parachute when falling
             if frame < 100:
-                pygame.draw.polygon(screen, (255, 100, 100), [
+                shape(pygame.draw.polygon, screen, (255, 100, 100), [
                     (WIDTH//2, astro_y - 80),
                     (WIDTH//2 - 60, astro_y - 150),
                     (WIDTH//2 + 60, astro_y - 150)
                 ])
-                pygame.draw.line(screen, BLACK, (WIDTH//2, astro_y - 40), (WIDTH//2 - 60, astro_y - 150), 2)
-                pygame.draw.line(screen, BLACK, (WIDTH//2, astro_y - 40), (WIDTH//2 + 60, astro_y - 150), 2)
+                shape(pygame.draw.line, screen, BLACK, (WIDTH//2, astro_y - 40), (WIDTH//2 - 60, astro_y - 150), 2)
+                shape(pygame.draw.line, screen, BLACK, (WIDTH//2, astro_y - 40), (WIDTH//2 + 60, astro_y - 150), 2)
         else:
             draw_astronaut(screen, WIDTH//2, HEIGHT - 220, 1.0)
         
@@ -670,8 +833,7 @@ def stage_vianney():
             dialog_idx = min((frame - 180) // 30, len(dialog) - 1)
             show_text(screen, dialog[dialog_idx], 100, medium_font, WHITE)
         
-        pygame.display.flip()
-        clock.tick(60)
+        present()
     
     return wait_or_skip(2.0)
 
@@ -690,8 +852,8 @@ def stage_victory():
         
         # Victory box
         box_rect = pygame.Rect(WIDTH//2 - 300, HEIGHT//2 - 200, 600, 400)
-        pygame.draw.rect(screen, (0, 50, 0), box_rect)
-        pygame.draw.rect(screen, GREEN, box_rect, 4)
+        shape(pygame.draw.rect, screen, (0, 50, 0), box_rect)
+        shape(pygame.draw.rect, screen, GREEN, box_rect, 4)
         
         # Title
         show_text(screen, "MISSION COMPLETE", HEIGHT//2 - 170, title_font, GREEN)
@@ -708,43 +870,64 @@ def stage_victory():
         for i, item in enumerate(items):
             y = HEIGHT//2 - 80 + i * 45
             if frame > i * 20:
-                pygame.draw.circle(screen, GREEN, (WIDTH//2 - 250, y + 10), 12)
+                shape(pygame.draw.circle, screen, GREEN, (WIDTH//2 - 250, y + 10), 12)
                 show_text(screen, item, y, medium_font, WHITE)
         
         # Final message
         if frame > 150:
             pulse = abs(math.sin(frame * 0.1)) * 0.3 + 0.7
             color = (int(255 * pulse), int(255 * pulse), 0)
-            show_text(screen, "YOU ARE A LEGEND", HEIGHT//2 + 160, title_font, color)
+            banner = tinted_text("YOU ARE A LEGEND", title_font, color)
+            screen.blit(banner, (WIDTH//2 - banner.get_width()//2, HEIGHT//2 + 160))
         
-        pygame.display.flip()
-        clock.tick(60)
+        present()
     
     return True
 
-def main():
+# The adventure's stages in playing order, as (caption, stage function name)
+STAGES = [
+    ("Launching...", "stage_launch"),
+    ("Space Travel...", "stage_space_travel"),
+    ("Mars Landing...", "stage_mars_landing"),
+    ("First Contact...", "stage_alien_encounter"),
+    ("Combat...", "stage_alien_fight"),
+    ("Wormhole...", "stage_wormhole"),
+    ("Arrival...", "stage_vianney"),
+    ("Victory!", "stage_victory"),
+]
+
+def warm_sprites():
+    """Rasterize every character sprite the stages use, so no frame pays for it."""
+    for scale in (1.0, 0.8, 0.6):
+        character_sprite(render_rocket, scale)
+    character_sprite(render_alien, 1.2)
+    for frame in range(60, 200):
+        character_sprite(render_astronaut, 1.0 - (frame - 60) * 0.003, True)
+
+def main(argv=None):
     """Run the epic space adventure!"""
+    global DIRTY_RECTS
+    parser = argparse.ArgumentParser(description="Epic Space Adventure - Python Rocket")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="update only the parts of the screen drawn each frame; "
+                             "helps only where display updates are slow")
+    args = parser.parse_args(argv)
+    DIRTY_RECTS = DIRTY_RECTS or args.dirty_rects
+
     print("Starting Epic Space Adventure...")
+    init()
+    warm_sprites()
     print("Press any key to skip animations, or just enjoy the show!")
     
-    # Run all stages
-    stages = [
-        ("Launching...", stage_launch),
-        ("Space Travel...", stage_space_travel),
-        ("Mars Landing...", stage_mars_landing),
-        ("First Contact...", stage_alien_encounter),
-        ("Combat...", stage_alien_fight),
-        ("Wormhole...", stage_wormhole),
-        ("Arrival...", stage_vianney),
-        ("Victory!", stage_victory)
-    ]
-    
-    for name, stage_func in stages:
+    # Run all stages, looked up by name so wrapped stages are the ones played
+    for name, stage_name in STAGES:
         print(f"Stage: {name}")
-        if not stage_func():
+        if not globals()[stage_name]():
             break
     
     pygame.quit()
+    if DIRTY_RECTS and dirty_stats["pixels_total"]:
+        print(f"Dirty rects updated {dirty_stats['pixels_updated'] / dirty_stats['pixels_total']:.0%} of the screen")
     print("\nThanks for playing Python Rocket!")
 
 if __name__ == "__main__":
@@ -0,0 +1,232 @@
+import argparse
+import asyncio
+import collections
+import json
+import time
+
+import numpy as np
+
+from app import CONFIG_DEFAULTS, check_configs, json_safe, parse_configs, run_batch
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_WINDOW = 0.005 # seconds a batch stays open for more requests
+DEFAULT_MAX_BATCH = 65536
+LATENCY_SAMPLES = 4096 # most recent per-config latencies kept for the metrics
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large'}
+
+class BatchingSimulator:
+    """Gathers configs submitted within a short window and runs them as one vectorized batch.
+
+    Callers await submit(); a single background task drains the queue, holding each
+    batch open for `window` seconds so concurrent requests share one simulate_batch
+    call, which runs on a worker thread to keep the event loop responsive.
+    """
+
+    def __init__(self, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH):
+        self.window = window
+        self.max_batch = max_batch
+        self.queue = collections.deque()
+        self.wakeup = asyncio.Event()
+        self.latencies = collections.deque(maxlen=LATENCY_SAMPLES)
+        self.started = time.monotonic()
+        self.in_flight = 0
+        self.requests = 0
+        self.configs = 0
+        self.batches = 0
+        self.errors = 0
+
+    async def submit(self, configs):
+        """Queues configs and waits for their results; failed configs come back as exceptions."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for config in configs:
+            future = loop.create_future()
+            self.queue.append((config, future, time.perf_counter()))
+            futures.append(future)
+        self.requests += 1
+        self.wakeup.set()
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    async def run(self):
+        """Background task that turns the queue into batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self.wakeup.wait()
+            if len(self.queue) < self.max_batch:
+                await asyncio.sleep(self.window)
+            batch = [self.queue.popleft() for _ in range(min(len(self.queue), self.max_batch))]
+            if not self.queue:
+                self.wakeup.clear()
+
+            self.in_flight = len(batch)
+            try:
+                results = await loop.run_in_executor(None, _run_configs, [config for config, _, _ in batch])
+            except Exception as error:
+                # Fail this batch, never the batcher: later requests must still be served
+                results = [error] * len(batch)
+            self.in_flight = 0
+            self.batches += 1
+            self.configs += len(batch)
+
+            finished = time.perf_counter()
+            for (_, future, submitted), result in zip(batch, results):
+                self.latencies.append(finished - submitted)
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    self.errors += 1
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def metrics(self):
+        """Queue depth, throughput counters and latency percentiles in milliseconds."""
+        latencies = np.array(self.latencies) * 1000
+        percentiles = {}
+        if latencies.size:
+            percentiles = {f'p{q}': float(np.percentile(latencies, q)) for q in (50, 95, 99)}
+            percentiles['max'] = float(latencies.max())
+        return {
+            'queue_depth': len(self.queue),
+            'in_flight': self.in_flight,
+            'requests': self.requests,
+            'configs': self.configs,
+            'batches': self.batches,
+            'errors': self.errors,
+            'mean_batch_size': self.configs / self.batches if self.batches else 0.0,
+            'latency_ms': percentiles,
+            'uptime_s': time.monotonic() - self.started,
+        }
+
+def _validate(configs, indices, results):
+    """Returns the indices whose configs pass validation, storing the others' errors in results.
+
+    The whole group is checked in one vectorized call and split in half only when
+    it fails, so a few bad configs cost a handful of checks rather than one each.
+    """
+    try:
+        check_configs([configs[index] for index in indices])
+        return list(indices)
+    except Exception as error:
+        if len(indices) == 1:
+            results[indices[0]] = error
+            return []
+    middle = len(indices) // 2
+    return _validate(configs, indices[:middle], results) + _validate(configs, indices[middle:], results)
+
+def _run_configs(configs):
+    """Runs a batch on a worker thread; configs that fail validation come back as their errors.
+
+    Only the valid configs reach run_batch, all in a single call, so a bad config
+    never slows its neighbours down.
+    """
+    results = [None] * len(configs)
+    valid = _validate(configs, range(len(configs)), results) if configs else []
+    try:
+        for index, result in zip(valid, run_batch([configs[index] for index in valid])):
+            results[index] = result
+    except Exception as error:
+        for index in valid:
+            results[index] = error
+    return results
+
+async def route(simulator, method, path, body):
+    """Dispatches one HTTP request; returns (status, JSON payload)."""
+    if path == '/metrics':
+        return (200, simulator.metrics()) if method == 'GET' else (405, {'error': 'Use GET.'})
+    if path == '/health':
+        return 200, {'status': 'ok'}
+    if path != '/simulate':
+        return 404, {'error': f'No route {path}; try POST /simulate or GET /metrics.'}
+    if method != 'POST':
+        return 405, {'error': 'Use POST with a JSON config, a list of configs or {"runs": [...]}.'}
+
+    try:
+        configs = parse_configs(json.loads(body or b'{}'))
+    except (TypeError, ValueError) as error:
+        return 400, {'error': str(error)}
+    configs = [{**CONFIG_DEFAULTS, **config} for config in configs]
+    results = await simulator.submit(configs)
+    return 200, {'results': [{'error': str(result)} if isinstance(result, Exception) else json_safe(result)
+                             for result in results]}
+
+async def handle_connection(reader, writer, simulator):
+    """Serves HTTP/1.1 requests on one connection, keeping it alive between requests."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            method, target, version = request_line.decode('latin-1').split()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            length = int(headers.get('content-length', 0))
+            if length > MAX_BODY_BYTES:
+                status, payload = 413, {'error': f'Request bodies are limited to {MAX_BODY_BYTES} bytes.'}
+                keep_alive = False
+            else:
+                body = await reader.readexactly(length) if length else b''
+                status, payload = await route(simulator, method, target.split('?')[0], body)
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+
+            content = json.dumps(payload).encode('utf-8')
+            writer.write(f'HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n'
+                         f'Content-Type: application/json\r\n'
+                         f'Content-Length: {len(content)}\r\n'
+                         f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode('latin-1') + content)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None, window=DEFAULT_WINDOW,
+                max_batch=DEFAULT_MAX_BATCH):
+    """Runs the simulation service until cancelled, on TCP or a Unix socket."""
+    simulator = BatchingSimulator(window, max_batch)
+    batcher = asyncio.create_task(simulator.run())
+
+    def handler(reader, writer):
+        return handle_connection(reader, writer, simulator)
+
+    if unix_path:
+        server = await asyncio.start_unix_server(handler, path=unix_path)
+        print(f'Serving on unix:{unix_path}')
+    else:
+        server = await asyncio.start_server(handler, host, port)
+        print(f'Serving on http://{host}:{server.sockets[0].getsockname()[1]}')
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batcher.cancel()
+
+def main():
+    """Command-line entry point for the local simulation service."""
+    parser = argparse.ArgumentParser(description='Local HTTP service that micro-batches simulation requests.')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', metavar='PATH', help='listen on a Unix socket instead of TCP')
+    parser.add_argument('--window', type=float, default=DEFAULT_WINDOW, help='batching window in seconds')
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH, help='most configs per batch')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.window, args.max_batch))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+import argparse
+
+import numpy as np
+
+from app import (
+    DEFAULT_ASTRONAUTS, DEFAULT_THRUST, DEFAULT_FUEL_BURN,
+    DEFAULT_TIME_STEP, DEFAULT_SIM_DURATION,
+)
+from flight import METHODS, simulate_batch
+from sweep import parse_values
+
+# Parameters the solver can search over, with the bracket searched by default
+SEARCH_BRACKETS = {
+    'thrust': (1.0, 1e7),
+    'fuel_burn': (1e-3, 1e5),
+    'astronauts': (0, 10000),
+}
+DEFAULT_CANDIDATES = 32
+
+def find_liftoff_boundary(parameter, astronauts=DEFAULT_ASTRONAUTS, thrust=DEFAULT_THRUST,
+                          fuel_burn=DEFAULT_FUEL_BURN, time_step=DEFAULT_TIME_STEP, duration=DEFAULT_SIM_DURATION,
+                          low=None, high=None, tolerance=1e-3, candidates=DEFAULT_CANDIDATES, method='euler',
+                          coast=False):
+    """Finds where liftoff success flips as one parameter varies, for one or many configurations.
+
+    parameter is 'thrust', 'fuel_burn' or 'astronauts'; the other configuration
+    arguments may be arrays, giving one search per element. Each round places
+    `candidates` evenly inside every open bracket and runs them all in a single
+    simulate_batch call, so the bracket shrinks by candidates + 1 per round.
+    Success is assumed monotonic in the parameter over [low, high].
+
+    Returns a dict of arrays: 'value' is the succeeding end of the final bracket
+    (the minimum thrust, say, when more thrust helps) and 'failing' the other end;
+    configurations whose bracket has no success/failure flip get NaN and a false
+    'bracketed'. 'rounds' and 'evaluations' count the work done.
+    """
+    if parameter not in SEARCH_BRACKETS:
+        raise ValueError(f'Cannot search over {parameter!r}; expected one of {", ".join(SEARCH_BRACKETS)}.')
+    integer = parameter == 'astronauts'
+    if integer:
+        tolerance = max(tolerance, 1)
+
+    config = {'astronauts': astronauts, 'thrust': thrust, 'fuel_burn': fuel_burn,
+              'time_step': time_step, 'duration': duration}
+    default_low, default_high = SEARCH_BRACKETS[parameter]
+    config[parameter] = 0.0
+    fixed = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in config.values()),
+                                np.asarray(default_low if low is None else low, dtype=np.float64),
+                                np.asarray(default_high if high is None else high, dtype=np.float64))
+    shape = fixed[0].shape
+    fixed = dict(zip(list(config) + ['low', 'high'], (np.array(values).ravel() for values in fixed)))
+
+    def succeeds(rows, values):
+        """Runs the configurations in rows with the searched parameter set to values."""
+        batch = {name: np.broadcast_to(fixed[name][rows, None], values.shape) for name in config}
+        batch[parameter] = values
+        return simulate_batch(batch['astronauts'], batch['thrust'], batch['fuel_burn'], batch['time_step'],
+                              batch['duration'], method=method, coast=coast)['success']
+
+    count = fixed['low'].size
+    rows = np.arange(count)
+    ends = np.stack([fixed['low'], fixed['high']], axis=1)
+    end_success = succeeds(rows, ends)
+    bracketed = end_success[:, 0] != end_success[:, 1]
+    succeed = np.where(end_success[:, 1], ends[:, 1], ends[:, 0])
+    fail = np.where(end_success[:, 1], ends[:, 0], ends[:, 1])
+    evaluations = 2 * count
+    rounds = 0
+
+    fractions = np.arange(1, candidates + 1) / (candidates + 1)
+    active = bracketed & (np.abs(succeed - fail) > tolerance)
+    while active.any():
+        rows = np.flatnonzero(active)
+        trial = fail[rows, None] + (succeed[rows, None] - fail[rows, None]) * fractions
+        if integer:
+            trial = np.round(trial)
+        good = succeeds(rows, trial)
+        evaluations += trial.size
+        rounds += 1
+
+        # First succeeding candidate walking from the failing end toward the succeeding end
+        first = np.where(good.any(axis=1), good.argmax(axis=1), candidates)
+        has_good = first < candidates
+        has_bad = first > 0
+        succeed[rows[has_good]] = trial[has_good, first[has_good]]
+        fail[rows[has_bad]] = trial[has_bad, first[has_bad] - 1]
+        active[rows] = np.abs(succeed[rows] - fail[rows]) > tolerance
+
+    value = np.where(bracketed, succeed, np.nan)
+    failing = np.where(bracketed, fail, np.nan)
+    return {
+        'value': value.reshape(shape),
+        'failing': failing.reshape(shape),
+        'bracketed': bracketed.reshape(shape),
+        'rounds': rounds,
+        'evaluations': evaluations,
+    }
+
+def main():
+    """Command-line entry point that solves for the liftoff boundary."""
+    parser = argparse.ArgumentParser(description='Solve for the parameter value where liftoff starts or stops.')
+    parser.add_argument('parameter', choices=sorted(SEARCH_BRACKETS), help='parameter to search over')
+    parser.add_argument('--astronauts', default=str(DEFAULT_ASTRONAUTS), help="list 'a,b,c' or range 'start:stop:count'")
+    parser.add_argument('--thrust', default=str(DEFAULT_THRUST), help='thrust values in Newtons')
+    parser.add_argument('--fuel-burn', default=str(DEFAULT_FUEL_BURN), help='fuel burn rates in kg/s')
+    parser.add_argument('--time-step', type=float, default=DEFAULT_TIME_STEP)
+    parser.add_argument('--duration', type=float, default=DEFAULT_SIM_DURATION)
+    parser.add_argument('--low', type=float, default=None, help='lower end of the search bracket')
+    parser.add_argument('--high', type=float, default=None, help='upper end of the search bracket')
+    parser.add_argument('--tolerance', type=float, default=1e-3)
+    parser.add_argument('--method', default='euler', choices=METHODS, help='integration method (default euler)')
+    args = parser.parse_args()
+
+    axes = {
+        'astronauts': parse_values(args.astronauts, int),
+        'thrust': parse_values(args.thrust),
+        'fuel_burn': parse_values(args.fuel_burn),
+    }
+    axes[args.parameter] = np.zeros(1)
+    mesh = dict(zip(axes, np.meshgrid(*axes.values(), indexing='ij')))
+    mesh.pop(args.parameter)
+    solution = find_liftoff_boundary(args.parameter, time_step=args.time_step, duration=args.duration,
+                                     low=args.low, high=args.high, tolerance=args.tolerance, method=args.method,
+                                     **{name: values.ravel() for name, values in mesh.items()})
+
+    for index in range(solution['value'].size):
+        fixed = ', '.join(f'{name}={values.ravel()[index]:g}' for name, values in mesh.items())
+        if solution['bracketed'][index]:
+            print(f'{fixed}: liftoff at {args.parameter}={solution["value"][index]:.6g} '
+                  f'(fails at {solution["failing"][index]:.6g})')
+        else:
+            print(f'{fixed}: no liftoff boundary inside the search bracket')
+    print(f'{solution["evaluations"]:,} simulations in {solution["rounds"]} rounds')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+import argparse
+import sys
+
+import numpy as np
+
+from app import DEFAULT_TIME_STEP, DEFAULT_SIM_DURATION
+from flight import METHODS, simulate_batch
+from sweep import parse_values
+
+# Grid axes, in storage order, and the outcome fields interpolated over them
+AXES = ('astronauts', 'thrust', 'fuel_burn')
+VALUE_FIELDS = ('altitude', 'velocity', 'liftoff_time')
+
+# Offsets of the 8 corners of a grid cell along each axis
+CORNERS = np.array([[(corner >> axis) & 1 for axis in range(len(AXES))] for corner in range(8)])
+
+def build_surrogate(astronauts, thrust, fuel_burn, time_step=DEFAULT_TIME_STEP, duration=DEFAULT_SIM_DURATION,
+                    method='rk45', coast=False):
+    """Precomputes flight outcomes at every point of an astronauts x thrust x fuel burn grid.
+
+    The default rk45 model varies smoothly between grid points, which is what makes
+    interpolation trustworthy; Euler outcomes jump with the step grid and round-off.
+    """
+    axes = [np.unique(np.asarray(values, dtype=np.float64)) for values in (astronauts, thrust, fuel_burn)]
+    mesh = np.meshgrid(*axes, indexing='ij')
+    result = simulate_batch(*mesh, time_step, duration, method=method, coast=coast)
+
+    grid = {name: axis for name, axis in zip(AXES, axes)}
+    grid.update({name: result[name].astype(np.float32) for name in VALUE_FIELDS})
+    grid['success'] = result['success']
+    grid.update(time_step=np.float64(time_step), duration=np.float64(duration),
+                method=np.str_(method), coast=np.bool_(coast))
+    return grid
+
+def save_surrogate(path, grid):
+    """Writes a surrogate grid to a compact binary .npz file."""
+    np.savez_compressed(path, **grid)
+
+def load_surrogate(path):
+    """Loads a surrogate grid written by save_surrogate."""
+    with np.load(path) as data:
+        grid = {name: data[name] for name in data.files}
+    for name in ('time_step', 'duration'):
+        grid[name] = float(grid[name])
+    grid['method'] = str(grid['method'])
+    grid['coast'] = bool(grid['coast'])
+    return grid
+
+def query_surrogate(grid, astronauts, thrust, fuel_burn, fallback=False):
+    """Answers flight outcomes by multilinear interpolation over the grid.
+
+    Besides the outcome fields the answer carries 'in_grid', false for queries
+    outside the grid, and 'boundary', true when the surrounding cell straddles
+    the liftoff boundary; 'needs_full_run' combines the two. With fallback=True
+    those queries are re-run through simulate_batch and marked 'exact'.
+    """
+    queries = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in (astronauts, thrust, fuel_burn)))
+    shape = queries[0].shape
+    queries = [query.ravel() for query in queries]
+    count = queries[0].size
+
+    # Lower cell corner and fractional position of every query along each axis
+    in_grid = np.ones(count, dtype=bool)
+    corner_index = []
+    corner_weight = np.ones((8, count))
+    for axis_number, (name, query) in enumerate(zip(AXES, queries)):
+        axis = grid[name]
+        in_grid &= (query >= axis[0]) & (query <= axis[-1])
+        upper = CORNERS[:, axis_number, None]
+        if axis.size == 1:
+            corner_index.append(np.zeros((8, count), dtype=np.intp))
+            corner_weight *= 1 - upper
+            continue
+        index = np.clip(np.searchsorted(axis, query, side='right') - 1, 0, axis.size - 2)
+        fraction = np.clip((query - axis[index]) / (axis[index + 1] - axis[index]), 0.0, 1.0)
+        corner_index.append(index + upper)
+        corner_weight *= np.where(upper, fraction, 1.0 - fraction)
+
+    # Blend the 8 corners of each query's cell
+    flat_index = np.ravel_multi_index(corner_index, grid['success'].shape)
+    used = corner_weight > 0
+    answer = {}
+    for name in VALUE_FIELDS:
+        values = np.nan_to_num(grid[name].ravel()[flat_index].astype(np.float64))
+        answer[name] = (corner_weight * values).sum(axis=0)
+    corner_success = grid['success'].ravel()[flat_index]
+    succeeded = (used & corner_success).any(axis=0)
+    failed = (used & ~corner_success).any(axis=0)
+
+    answer['success'] = succeeded
+    answer['in_grid'] = in_grid
+    answer['boundary'] = succeeded & failed
+    answer['liftoff_time'][~answer['success'] | answer['boundary']] = np.nan
+    answer['needs_full_run'] = ~in_grid | answer['boundary']
+    answer['exact'] = np.zeros(count, dtype=bool)
+
+    if fallback and answer['needs_full_run'].any():
+        rerun = answer['needs_full_run']
+        result = simulate_batch(*(query[rerun] for query in queries), grid['time_step'], grid['duration'],
+                                method=grid['method'], coast=grid['coast'])
+        for name in VALUE_FIELDS + ('success',):
+            answer[name][rerun] = result[name]
+        answer['exact'] = rerun
+
+    return {name: values.reshape(shape) for name, values in answer.items()}
+
+def main():
+    """Command-line entry point to build or query a surrogate grid."""
+    parser = argparse.ArgumentParser(description='Precompute and query interpolated flight outcomes.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='precompute a grid and save it')
+    build.add_argument('--astronauts', default='0:20:21', help="list 'a,b,c' or range 'start:stop:count'")
+    build.add_argument('--thrust', default='10000:100000:181', help='thrust values in Newtons')
+    build.add_argument('--fuel-burn', default='5:200:196', help='fuel burn rates in kg/s')
+    build.add_argument('--time-step', type=float, default=DEFAULT_TIME_STEP, help='time step in seconds')
+    build.add_argument('--duration', type=float, default=DEFAULT_SIM_DURATION, help='max simulation duration in seconds')
+    build.add_argument('--method', default='rk45', choices=METHODS, help='integration method (default rk45)')
+    build.add_argument('--coast', action='store_true', help='keep flying after burnout until the duration')
+    build.add_argument('--output', default='surrogate.npz', help='grid file to write')
+
+    query = commands.add_parser('query', help='answer one configuration from a saved grid')
+    query.add_argument('grid', help='grid file written by build')
+    query.add_argument('astronauts', type=float)
+    query.add_argument('thrust', type=float)
+    query.add_argument('fuel_burn', type=float)
+    query.add_argument('--fallback', action='store_true', help='run the full simulation when the grid cannot answer')
+
+    args = parser.parse_args()
+    if args.command == 'build':
+        grid = build_surrogate(parse_values(args.astronauts, int), parse_values(args.thrust),
+                               parse_values(args.fuel_burn), args.time_step, args.duration, args.method, args.coast)
+        save_surrogate(args.output, grid)
+        points = grid['success'].size
+        print(f'Saved {points:,} grid points to {args.output}')
+        return
+
+    answer = query_surrogate(load_surrogate(args.grid), args.astronauts, args.thrust, args.fuel_burn, args.fallback)
+    for name, value in answer.items():
+        print(f'{name}: {value.item()}')
+    if answer['needs_full_run'] and not answer['exact']:
+        sys.exit(2)
+
+if __name__ == '__main__':
+    main()
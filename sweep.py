@@ -0,0 +1,155 @@
+import argparse
+import csv
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from app import (
+    DEFAULT_ASTRONAUTS, DEFAULT_THRUST, DEFAULT_FUEL_BURN,
+    DEFAULT_TIME_STEP, DEFAULT_SIM_DURATION,
+)
+from flight import simulate_batch
+
+# Columns of the sweep result table, inputs first, with their storage types
+INPUT_COLUMNS = ('astronauts', 'thrust', 'fuel_burn', 'time_step', 'duration')
+TABLE_COLUMNS = {
+    'astronauts': np.int64,
+    'thrust': np.float64,
+    'fuel_burn': np.float64,
+    'time_step': np.float64,
+    'duration': np.float64,
+    'time': np.float64,
+    'altitude': np.float64,
+    'velocity': np.float64,
+    'mass': np.float64,
+    'fuel': np.float64,
+    'thrust_final': np.float64,
+    'liftoff': np.bool_,
+    'liftoff_time': np.float64,
+    'success': np.bool_,
+    'steps': np.int64,
+}
+
+# Shared-memory views attached once per worker process
+_worker_table = {}
+_worker_blocks = []
+
+def parse_values(spec, value_type=float):
+    """Parses 'a,b,c' as a list of values or 'start:stop:count' as an inclusive range."""
+    if ':' in spec:
+        start, stop, count = spec.split(':')
+        values = np.linspace(float(start), float(stop), int(count))
+    else:
+        values = np.array([float(part) for part in spec.split(',')])
+    if value_type is int:
+        values = np.unique(np.round(values).astype(np.int64))
+    return values
+
+def build_grid(astronauts, thrust, fuel_burn, time_step, duration=DEFAULT_SIM_DURATION):
+    """Expands the parameter axes into the flat configuration list of their full grid."""
+    axes = np.meshgrid(np.atleast_1d(astronauts), np.atleast_1d(thrust), np.atleast_1d(fuel_burn),
+                       np.atleast_1d(time_step), np.atleast_1d(duration), indexing='ij')
+    return {name: axis.ravel() for name, axis in zip(INPUT_COLUMNS, axes)}
+
+def _attach_table(block_names, count):
+    """Maps every shared-memory column block into this process as a NumPy array."""
+    table = {}
+    blocks = []
+    for name, block_name in block_names.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        table[name] = np.ndarray((count,), dtype=TABLE_COLUMNS[name], buffer=block.buf)
+    return table, blocks
+
+def _init_worker(block_names, count):
+    """Pool initializer; attaches the shared result table once per worker."""
+    global _worker_table, _worker_blocks
+    _worker_table, _worker_blocks = _attach_table(block_names, count)
+
+def _run_chunk(bounds):
+    """Simulates one slice of the sweep and writes it straight into the shared table."""
+    start, stop = bounds
+    table = _worker_table
+    result = simulate_batch(*(table[name][start:stop] for name in INPUT_COLUMNS))
+    for name, values in result.items():
+        table['thrust_final' if name == 'thrust' else name][start:stop] = values
+    return stop - start
+
+def run_sweep(configs, workers=None, chunk_size=None):
+    """Runs every configuration across a process pool and returns (table, elapsed seconds).
+
+    configs maps each name in INPUT_COLUMNS to an equal-length array. Workers write
+    their results into shared-memory columns, so only slice bounds cross the pool.
+    """
+    global _worker_table
+    count = len(configs['astronauts'])
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(256, -(-count // (workers * 4)))
+
+    blocks = []
+    try:
+        block_names = {}
+        for name, dtype in TABLE_COLUMNS.items():
+            block = shared_memory.SharedMemory(create=True, size=max(1, count * np.dtype(dtype).itemsize))
+            blocks.append(block)
+            block_names[name] = block.name
+        table = {name: np.ndarray((count,), dtype=dtype, buffer=block.buf)
+                 for (name, dtype), block in zip(TABLE_COLUMNS.items(), blocks)}
+        for name in INPUT_COLUMNS:
+            table[name][:] = np.broadcast_to(configs[name], (count,))
+
+        chunks = [(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+        start_time = time.perf_counter()
+        if workers == 1:
+            _worker_table = table
+            for chunk in chunks:
+                _run_chunk(chunk)
+        else:
+            with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(block_names, count)) as pool:
+                for _ in pool.imap_unordered(_run_chunk, chunks):
+                    pass
+        elapsed = time.perf_counter() - start_time
+
+        return {name: values.copy() for name, values in table.items()}, elapsed
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+def write_table(path, table):
+    """Writes the result table as compressed .npz, or as CSV for any other extension."""
+    if path.endswith('.npz'):
+        np.savez_compressed(path, **table)
+        return
+    with open(path, 'w', newline='') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(table.keys())
+        writer.writerows(zip(*(values.tolist() for values in table.values())))
+
+def main():
+    """Command-line entry point for parameter sweeps."""
+    parser = argparse.ArgumentParser(description='Sweep rocket configurations across all CPU cores.')
+    parser.add_argument('--astronauts', default=str(DEFAULT_ASTRONAUTS), help="list 'a,b,c' or range 'start:stop:count'")
+    parser.add_argument('--thrust', default=str(DEFAULT_THRUST), help='thrust values in Newtons')
+    parser.add_argument('--fuel-burn', default=str(DEFAULT_FUEL_BURN), help='fuel burn rates in kg/s')
+    parser.add_argument('--time-step', default=str(DEFAULT_TIME_STEP), help='time steps in seconds')
+    parser.add_argument('--duration', type=float, default=DEFAULT_SIM_DURATION, help='max simulation duration in seconds')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--output', default='sweep_results.npz', help='result table path (.npz or .csv)')
+    args = parser.parse_args()
+
+    configs = build_grid(parse_values(args.astronauts, int), parse_values(args.thrust),
+                         parse_values(args.fuel_burn), parse_values(args.time_step), args.duration)
+    table, elapsed = run_sweep(configs, workers=args.workers)
+    write_table(args.output, table)
+
+    runs = len(table['astronauts'])
+    print(f'Swept {runs:,} runs in {elapsed:.3f} s ({runs / elapsed:,.0f} runs/s), '
+          f'{int(table["success"].sum()):,} successful')
+    print(f'Results written to {args.output}')
+
+if __name__ == '__main__':
+    main()
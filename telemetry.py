@@ -0,0 +1,174 @@
+import argparse
+import json
+import math
+import struct
+import sys
+
+from app import (
+    DEFAULT_ASTRONAUTS, DEFAULT_THRUST, DEFAULT_FUEL_BURN,
+    DEFAULT_TIME_STEP, DEFAULT_SIM_DURATION,
+)
+from flight import TELEMETRY_FIELDS, flight_steps
+
+# Packed binary layout: magic, field count, field names, then one little-endian
+# float64 per field for every record
+BINARY_MAGIC = b'RKTL1\n'
+DEFAULT_BATCH_SIZE = 4096
+
+class TelemetrySink:
+    """Base sink that buffers records and writes them to a file in batches."""
+
+    binary = False
+
+    def __init__(self, target, fields=TELEMETRY_FIELDS, batch_size=DEFAULT_BATCH_SIZE):
+        if isinstance(target, str):
+            self.file = open(target, 'wb') if self.binary else open(target, 'w', newline='')
+            self.owns_file = True
+        else:
+            self.file = target.buffer if self.binary and hasattr(target, 'buffer') else target
+            self.owns_file = False
+        self.fields = tuple(fields)
+        self.batch_size = batch_size
+        self.pending = []
+        self.count = 0
+        self.write_header()
+
+    def write_header(self):
+        """Writes anything that must precede the first record."""
+
+    def encode(self, records):
+        """Turns a batch of records into one string (or bytes) chunk."""
+        raise NotImplementedError
+
+    def write(self, record):
+        """Queues one record, flushing once a full batch is pending."""
+        self.pending.append(record)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Writes every pending record in a single call."""
+        if self.pending:
+            self.file.write(self.encode(self.pending))
+            self.count += len(self.pending)
+            self.pending = []
+        self.file.flush()
+
+    def close(self):
+        """Flushes pending records and closes the file if the sink opened it."""
+        self.flush()
+        if self.owns_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class NDJSONSink(TelemetrySink):
+    """Writes one JSON object per line."""
+
+    def encode(self, records):
+        return ''.join(json.dumps({name: _json_value(record[name]) for name in self.fields}) + '\n'
+                       for record in records)
+
+class CSVSink(TelemetrySink):
+    """Writes a header row followed by one comma-separated row per record."""
+
+    def write_header(self):
+        self.file.write(','.join(self.fields) + '\n')
+
+    def encode(self, records):
+        return ''.join(','.join(_csv_value(record[name]) for name in self.fields) + '\n' for record in records)
+
+class BinarySink(TelemetrySink):
+    """Writes fixed-size packed float64 records after a short self-describing header."""
+
+    binary = True
+
+    def write_header(self):
+        names = ','.join(self.fields).encode('ascii')
+        self.file.write(BINARY_MAGIC + struct.pack('<HI', len(self.fields), len(names)) + names)
+        self.packer = struct.Struct('<' + 'd' * len(self.fields))
+
+    def encode(self, records):
+        pack = self.packer.pack
+        return b''.join(pack(*(float(record[name]) for name in self.fields)) for record in records)
+
+SINKS = {'ndjson': NDJSONSink, 'csv': CSVSink, 'binary': BinarySink}
+
+def _json_value(value):
+    """Maps NaN to null so every line stays strict JSON."""
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+def _csv_value(value):
+    """Formats a record value for CSV, leaving NaN cells empty."""
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, float) and math.isnan(value):
+        return ''
+    return repr(value)
+
+def read_binary(path):
+    """Yields the records of a file written by BinarySink as dicts."""
+    with open(path, 'rb') as handle:
+        if handle.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f'{path} is not a binary telemetry file.')
+        field_count, names_length = struct.unpack('<HI', handle.read(6))
+        fields = handle.read(names_length).decode('ascii').split(',')
+        packer = struct.Struct('<' + 'd' * field_count)
+        while True:
+            chunk = handle.read(packer.size * DEFAULT_BATCH_SIZE)
+            if not chunk:
+                return
+            for values in packer.iter_unpack(chunk):
+                yield dict(zip(fields, values))
+
+def stream(records, *sinks):
+    """Feeds every record to every sink, closes the sinks and returns the record count."""
+    count = 0
+    try:
+        for record in records:
+            for sink in sinks:
+                sink.write(record)
+            count += 1
+    finally:
+        for sink in sinks:
+            sink.close()
+    return count
+
+def positive(value_type):
+    """argparse type that accepts only values of value_type above zero."""
+    def parse(text):
+        value = value_type(text)
+        if not value > 0:
+            raise argparse.ArgumentTypeError(f'must be positive, got {text}')
+        return value
+    parse.__name__ = value_type.__name__
+    return parse
+
+def main():
+    """Command-line entry point that streams one flight's telemetry."""
+    parser = argparse.ArgumentParser(description='Stream per-step flight telemetry.')
+    parser.add_argument('--astronauts', type=int, default=DEFAULT_ASTRONAUTS)
+    parser.add_argument('--thrust', type=float, default=DEFAULT_THRUST)
+    parser.add_argument('--fuel-burn', type=float, default=DEFAULT_FUEL_BURN)
+    parser.add_argument('--time-step', type=float, default=DEFAULT_TIME_STEP)
+    parser.add_argument('--duration', type=float, default=DEFAULT_SIM_DURATION)
+    parser.add_argument('--every', type=positive(int), default=1, help='keep every n-th step')
+    parser.add_argument('--interval', type=positive(float), default=None, help='keep at most one record per interval seconds')
+    parser.add_argument('--coast', action='store_true', help='keep flying after burnout until the duration')
+    parser.add_argument('--format', choices=sorted(SINKS), default='ndjson')
+    parser.add_argument('--output', default='-', help="output path, '-' for stdout")
+    args = parser.parse_args()
+
+    records = flight_steps(args.astronauts, args.thrust, args.fuel_burn, args.time_step, args.duration,
+                           every=args.every, interval=args.interval, coast=args.coast)
+    sink = SINKS[args.format](sys.stdout if args.output == '-' else args.output)
+    stream(records, sink)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+import functools
+import io
+import json
+import shutil
+import sys
+import time
+import unicodedata
+
+CLEAR_SCREEN = '\033[2J\033[H'
+CLEAR_TO_END = '\033[K'
+HIDE_CURSOR = '\033[?25l'
+SHOW_CURSOR = '\033[?25h'
+RESET = '\033[0m'
+
+# Characters that glue onto the previous one to form a single on-screen glyph
+ZERO_WIDTH_JOINER = '\u200d'
+VARIATION_SELECTORS = ('\ufe0e', '\ufe0f')
+SKIN_TONES = range(0x1f3fb, 0x1f400)
+
+@functools.lru_cache(maxsize=4096)
+def split_cells(line):
+    """Splits a line into (style, glyph, width, exact) cells, one per grapheme cluster.
+
+    style is the SGR escape sequence in effect for the cell. exact is false for
+    emoji sequences (joiners, variation selectors) whose width terminals disagree
+    on, so cursor positions computed past them cannot be trusted. Lines are
+    cached, so static frame lines are parsed only once.
+    """
+    cells = []
+    style = ''
+    index = 0
+    while index < len(line):
+        char = line[index]
+        if char == '\033':
+            end = line.find('m', index)
+            if end < 0:
+                end = len(line) - 1
+            code = line[index:end + 1]
+            style = '' if code == RESET else style + code
+            index = end + 1
+            continue
+
+        glyph = char
+        index += 1
+        while index < len(line):
+            char = line[index]
+            if char == ZERO_WIDTH_JOINER and index + 1 < len(line):
+                glyph += line[index:index + 2]
+                index += 2
+            elif char in VARIATION_SELECTORS or ord(char) in SKIN_TONES or unicodedata.combining(char):
+                glyph += char
+                index += 1
+            else:
+                break
+        wide = unicodedata.east_asian_width(glyph[0]) in 'WF' or '\ufe0f' in glyph
+        exact = len(glyph) == 1 or all(unicodedata.combining(mark) for mark in glyph[1:])
+        cells.append((style, glyph, 2 if wide else 1, exact))
+    return tuple(cells)
+
+def encode_cells(cells, style=''):
+    """Turns cells back into text, emitting a style escape only where the style changes."""
+    parts = []
+    for cell_style, glyph, _, _ in cells:
+        if cell_style != style:
+            parts.append(RESET + cell_style)
+            style = cell_style
+        parts.append(glyph)
+    if style:
+        parts.append(RESET)
+    return ''.join(parts)
+
+class FrameBuffer:
+    """Double-buffered terminal screen that redraws only what changed between frames.
+
+    Each frame is a list of lines, composed in memory and compared cell by cell
+    with the frame already on screen. Changed spans are written with cursor
+    addressing, all in a single write, and the cursor is left on the line below
+    the frame, where print() would have left it.
+    """
+
+    def __init__(self, stream=None, height=None):
+        self.stream = stream or sys.stdout
+        self.height = height or shutil.get_terminal_size().lines
+        self.rows = None
+        self.bytes_written = 0
+
+    def compose(self, lines):
+        """Parses a frame into rows of cells, keeping the rows a scrolling terminal would show."""
+        rows = [split_cells(line) for line in lines]
+        return rows[-(self.height - 1):] if self.height > 1 else rows[-1:]
+
+    def render(self, lines):
+        """Draws a frame, sending only the changed cells; returns the text written."""
+        rows = self.compose(lines)
+        if self.rows is None:
+            output = CLEAR_SCREEN + ''.join(encode_cells(row) + '\n' for row in rows)
+        else:
+            parts = []
+            for number, row in enumerate(rows, 1):
+                old = self.rows[number - 1] if number <= len(self.rows) else ()
+                if row != old:
+                    parts.append(self._update_row(number, old, row))
+            for number in range(len(rows) + 1, len(self.rows) + 1):
+                if self.rows[number - 1]:
+                    parts.append(f'\033[{number};1H{CLEAR_TO_END}')
+            if parts:
+                parts.append(f'\033[{len(rows) + 1};1H')
+            output = ''.join(parts)
+        self.rows = rows
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
+            self.bytes_written += len(output.encode('utf-8'))
+        return output
+
+    def _update_row(self, number, old, new):
+        """Cursor-addressed update turning row `number` from old cells into new ones."""
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+        if not all(cell[3] for cell in new[:start]):
+            start = 0
+        column = 1 + sum(cell[2] for cell in new[:start])
+
+        # Stop before an unchanged tail when the changed span keeps its width
+        end_old, end_new = len(old), len(new)
+        while end_old > start and end_new > start and old[end_old - 1] == new[end_new - 1]:
+            end_old -= 1
+            end_new -= 1
+        same_width = sum(cell[2] for cell in old[start:end_old]) == sum(cell[2] for cell in new[start:end_new])
+        exact = all(cell[3] for cell in old[start:end_old] + new[start:end_new])
+        if same_width and exact and end_new < len(new):
+            return f'\033[{number};{column}H' + encode_cells(new[start:end_new])
+        return f'\033[{number};{column}H' + encode_cells(new[start:]) + CLEAR_TO_END
+
+class Timeline:
+    """Paces (frame, seconds) pairs against time.monotonic() instead of chained sleeps.
+
+    Every frame gets a target timestamp, the sum of the holds before it, scaled by
+    time_scale, so rendering cost never accumulates into drift. A frame whose
+    whole slot has already passed is dropped rather than shown late, except the
+    last one. A time_scale of 0 yields every frame without waiting.
+    """
+
+    def __init__(self, frames, time_scale=1.0, clock=None, sleep=None):
+        if time_scale < 0:
+            raise ValueError('The time scale must not be negative.')
+        self.frames = frames
+        self.time_scale = time_scale
+        self.clock = clock or time.monotonic
+        self.sleep = sleep or time.sleep
+        self.shown = 0
+        self.dropped = 0
+
+    def elapsed(self, start):
+        """Timeline seconds since start, in unscaled animation time."""
+        return (self.clock() - start) / self.time_scale
+
+    def __iter__(self):
+        start = self.clock()
+        offset = 0.0
+        frames = iter(self.frames)
+        current = next(frames, None)
+        while current is not None:
+            frame, seconds = current
+            end = offset + seconds
+            offset = end
+            if self.time_scale and self.elapsed(start) >= end:
+                # Behind schedule: skip this frame unless it is the last one
+                current = next(frames, None)
+                if current is not None:
+                    self.dropped += 1
+                    continue
+            self.shown += 1
+            yield frame
+            if self.time_scale:
+                remaining = end - self.elapsed(start)
+                if remaining > 0:
+                    self.sleep(remaining * self.time_scale)
+            current = next(frames, None)
+
+def line_width(line):
+    """Display width of a line, ignoring style escapes."""
+    return sum(cell[2] for cell in split_cells(line))
+
+def write_asciicast(target, frames, width=None, height=None, title=None, time_scale=1.0):
+    """Renders (frame, seconds) pairs to an asciinema v2 recording without waiting.
+
+    target is a path or a text stream. Event timestamps come from the frame holds,
+    so a minute-long animation is written as fast as it can be diffed; the size
+    defaults to the smallest terminal of at least 80x24 that fits every frame.
+    Returns the recording's duration in seconds.
+    """
+    frames = [(tuple(lines), seconds) for lines, seconds in frames]
+    if width is None:
+        width = max([80] + [line_width(line) for lines, _ in frames for line in lines])
+    if height is None:
+        height = max([24] + [len(lines) + 1 for lines, _ in frames])
+
+    header = {'version': 2, 'width': width, 'height': height, 'timestamp': int(time.time()),
+              'env': {'TERM': 'xterm-256color'}}
+    if title:
+        header['title'] = title
+    events = [json.dumps(header, ensure_ascii=False)]
+
+    def event(timestamp, data):
+        # Recordings hold what the terminal received, where output newlines are CR LF
+        events.append(json.dumps([round(timestamp, 6), 'o', data.replace('\n', '\r\n')], ensure_ascii=False))
+
+    screen = FrameBuffer(io.StringIO(), height)
+    timestamp = 0.0
+    event(timestamp, HIDE_CURSOR)
+    for lines, seconds in frames:
+        output = screen.render(lines)
+        if output:
+            event(timestamp, output)
+        timestamp += seconds * time_scale
+    event(timestamp, SHOW_CURSOR)
+
+    text = '\n'.join(events) + '\n'
+    if isinstance(target, str):
+        with open(target, 'w', encoding='utf-8') as handle:
+            handle.write(text)
+    else:
+        target.write(text)
+    return timestamp
@@ -0,0 +1,70 @@
+import functools
+import http.server
+import threading
+
+import pytest
+from PIL import Image
+
+from assets import AssetLoader
+
+@pytest.fixture
+def image(tmp_path):
+    """A small two-colour PNG in its own directory."""
+    directory = tmp_path / 'www'
+    directory.mkdir()
+    picture = Image.new('RGBA', (8, 6), (200, 40, 10, 255))
+    picture.paste((0, 90, 250, 255), (0, 0, 4, 6))
+    picture.save(directory / 'rocket.png')
+    return directory / 'rocket.png'
+
+@pytest.fixture
+def server(image):
+    """Serves the image's directory over HTTP; yields the image URL and the request log."""
+    requests = []
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            requests.append(args[1])
+
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(Handler, directory=image.parent))
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{httpd.server_port}/{image.name}', requests
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+def test_file_urls_and_paths_load_and_hit_the_disk_cache(image, tmp_path):
+    loader = AssetLoader(tmp_path / 'cache')
+    surface = loader.load(image.as_uri())
+    assert surface.get_size() == (8, 6)
+    assert tuple(surface.get_at((1, 1))) == (0, 90, 250, 255)
+    assert tuple(surface.get_at((6, 1))) == (200, 40, 10, 255)
+    assert loader.load(image.as_uri()) is surface
+    assert loader.counters['decodes'] == 1
+
+    fresh = AssetLoader(tmp_path / 'cache')
+    assert fresh.load(image.as_uri()).get_size() == (8, 6)
+    assert fresh.counters == {'downloads': 0, 'revalidated': 0, 'disk_hits': 1, 'decodes': 0}
+    assert fresh.load(str(image), (4, 3)).get_size() == (4, 3)
+
+def test_http_download_is_revalidated_from_the_disk_cache(server, tmp_path):
+    url, requests = server
+    loader = AssetLoader(tmp_path / 'cache')
+    loader.prefetch([url])
+    assert loader.load(url).get_size() == (8, 6)
+    assert loader.counters['downloads'] == 1 and requests == ['200']
+    loader.close()
+
+    fresh = AssetLoader(tmp_path / 'cache')
+    surface = fresh.load(url)
+    assert tuple(surface.get_at((1, 1))) == (0, 90, 250, 255)
+    assert requests == ['200', '304']
+    assert fresh.counters == {'downloads': 0, 'revalidated': 1, 'disk_hits': 1, 'decodes': 0}
+    fresh.close()
+
+def test_failed_fetch_returns_none(tmp_path):
+    loader = AssetLoader(tmp_path / 'cache', timeout=1)
+    assert loader.load('http://127.0.0.1:1/missing.png') is None
+    assert loader.load(str(tmp_path / 'missing.png')) is None
+    loader.close()
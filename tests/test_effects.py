@@ -0,0 +1,43 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+from effects import TrackedCanvas, blit_batch
+
+@pytest.fixture
+def canvas():
+    pygame.display.init()
+    yield TrackedCanvas((40, 30))
+    pygame.display.quit()
+
+def sprite(color):
+    surface = pygame.Surface((3, 3))
+    surface.fill(color)
+    return surface
+
+@pytest.mark.parametrize('draw', [
+    lambda canvas, sprites, positions: blit_batch(canvas, sprites, positions),
+    lambda canvas, sprites, positions: canvas.fblits(zip(sprites, positions)),
+    lambda canvas, sprites, positions: canvas.blits(list(zip(sprites, positions)), doreturn=False),
+])
+def test_batched_blits_are_tracked_and_erased_next_frame(canvas, draw):
+    canvas.fill((0, 0, 0))
+    canvas.end_frame()
+
+    canvas.fill((0, 0, 0))
+    draw(canvas, [sprite((255, 0, 0))] * 2, [(1, 1), (30, 20)])
+    assert canvas.end_frame() == [pygame.Rect(1, 1, 3, 3), pygame.Rect(30, 20, 3, 3)]
+
+    canvas.fill((0, 0, 0))
+    assert canvas.end_frame() == [pygame.Rect(1, 1, 3, 3), pygame.Rect(30, 20, 3, 3)]
+    assert canvas.get_at((2, 2)) == canvas.get_at((31, 21)) == (0, 0, 0, 255)
+
+def test_new_backdrop_updates_the_whole_frame(canvas):
+    canvas.fill((0, 0, 0))
+    canvas.end_frame()
+    canvas.fill((0, 0, 80))
+    assert canvas.end_frame() == [canvas.get_rect()]
+    assert canvas.get_at((20, 15)) == (0, 0, 80, 255)
@@ -0,0 +1,81 @@
+import math
+
+import numpy as np
+import pytest
+
+from flight import (
+    FIXED_INITIAL_FUEL_MASS_KG, FIXED_ROCKET_DRY_MASS_KG, MASS_PER_ASTRONAUT_KG,
+    flight_steps, simulate_batch,
+)
+
+def scalar_flight(astronauts, thrust, fuel_burn, time_step, sim_dur):
+    """The original app.run_simulation loop, kept as the reference the batch engine must reproduce."""
+    astronaut_mass = astronauts * MASS_PER_ASTRONAUT_KG
+    current_mass = FIXED_ROCKET_DRY_MASS_KG + FIXED_INITIAL_FUEL_MASS_KG + astronaut_mass
+    velocity = 0.0
+    altitude = 0.0
+    sim_time = 0.0
+    steps = 0
+    liftoff_achieved = False
+    liftoff_time = math.nan
+    initial_fuel = FIXED_INITIAL_FUEL_MASS_KG
+    while sim_time < sim_dur and current_mass > (FIXED_ROCKET_DRY_MASS_KG + astronaut_mass):
+        net_force = thrust - current_mass * 9.81 - 0.05 * velocity**2
+        velocity += net_force / current_mass * time_step
+        if velocity < 0:
+            velocity = 0
+        altitude += velocity * time_step
+
+        fuel_burned_in_step = fuel_burn * time_step
+        if initial_fuel >= fuel_burned_in_step:
+            current_mass -= fuel_burned_in_step
+            initial_fuel -= fuel_burned_in_step
+            thrust *= (1 - (fuel_burned_in_step / FIXED_INITIAL_FUEL_MASS_KG) * 0.1)
+        else:
+            current_mass -= initial_fuel
+            initial_fuel = 0
+            thrust = 0
+
+        if altitude >= 10.0 and not liftoff_achieved:
+            liftoff_achieved = True
+            liftoff_time = sim_time
+        sim_time += time_step
+        steps += 1
+    return {'time': sim_time, 'altitude': altitude, 'velocity': velocity, 'mass': current_mass,
+            'fuel': initial_fuel, 'thrust': thrust, 'liftoff': liftoff_achieved, 'liftoff_time': liftoff_time,
+            'steps': steps, 'success': liftoff_achieved and altitude > 0}
+
+def test_euler_batch_matches_scalar_loop_exactly():
+    grid = np.array(np.meshgrid([0, 3, 12], [20000.0, 50000.0, 90000.0], [7.0, 50.0, 300.0], [0.01, 0.5, 0.7],
+                                [1.0, 120.0], indexing='ij')).reshape(5, -1)
+    batch = simulate_batch(*grid)
+    for index, config in enumerate(grid.T):
+        expected = scalar_flight(int(config[0]), *config[1:])
+        for name, value in expected.items():
+            actual = batch[name][index].item()
+            if isinstance(value, float) and math.isnan(value):
+                assert math.isnan(actual), (config, name)
+            else:
+                assert actual == value, (config, name, actual, value)
+
+@pytest.mark.parametrize('method', ['euler', 'rk4', 'rk45'])
+@pytest.mark.parametrize('bad', [math.nan, math.inf, None])
+def test_non_finite_inputs_are_rejected(method, bad):
+    with pytest.raises(ValueError):
+        simulate_batch(3, 50000.0, 50.0, bad, 120.0, method=method)
+
+@pytest.mark.parametrize('method', ['euler', 'rk4', 'rk45'])
+def test_empty_batch_returns_empty_results(method):
+    results = simulate_batch([], [], [], [], [], method=method)
+    assert all(values.shape == (0,) for values in results.values())
+
+@pytest.mark.parametrize('method', ['rk4', 'rk45'])
+def test_runge_kutta_converges_to_euler_at_small_steps(method):
+    fine = simulate_batch(3, 50000.0, 50.0, 0.001, 30.0)
+    result = simulate_batch(3, 50000.0, 50.0, 0.01, 30.0, method=method)
+    assert result['altitude'] == pytest.approx(fine['altitude'], rel=1e-2)
+
+@pytest.mark.parametrize('every, interval', [(0, None), (-1, None), (1, 0.0), (1, -2.0), (1, math.nan)])
+def test_flight_steps_rejects_non_positive_sampling(every, interval):
+    with pytest.raises(ValueError):
+        next(flight_steps(3, 50000.0, 50.0, 0.5, 120.0, every=every, interval=interval))
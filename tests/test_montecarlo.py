@@ -0,0 +1,37 @@
+import math
+
+import numpy as np
+import pytest
+
+from montecarlo import StreamingHistogram, run_dispersion
+
+def test_quantiles_track_numpy_within_one_bin():
+    values = np.random.default_rng(1).lognormal(3.0, 1.0, 50_000)
+    histogram = StreamingHistogram(bins=1024)
+    for batch in np.array_split(values, 7):
+        histogram.add(batch)
+    width = histogram.upper / histogram.counts.size
+    for q in (0.01, 0.25, 0.5, 0.9, 0.99):
+        assert histogram.quantile(q) == pytest.approx(np.quantile(values, q), abs=width)
+    assert histogram.quantile(0.0) == values.min() and histogram.quantile(1.0) == values.max()
+
+def test_quantile_survives_range_doubling_and_skips_nans():
+    histogram = StreamingHistogram(bins=8, upper=1.0)
+    histogram.add(np.array([0.1, 0.2, math.nan]))
+    histogram.add(np.array([100.0]))
+    assert histogram.upper == 128.0 and histogram.count == 3
+    assert histogram.counts.sum() == 3
+    assert histogram.quantile(1.0) == 100.0
+
+def test_empty_histogram_quantile_is_nan():
+    assert math.isnan(StreamingHistogram().quantile(0.5))
+
+def test_batches_cover_every_sample():
+    report = run_dispersion(10, seed=0, batch_size=3)
+    assert report['samples'] == 10 and report['altitude'].count == 10
+    assert report['liftoff_time'].count == report['successes']
+
+@pytest.mark.parametrize('samples, batch_size', [(10, 0), (10, -1), (-1, 10)])
+def test_bad_sample_counts_are_rejected(samples, batch_size):
+    with pytest.raises(ValueError):
+        run_dispersion(samples, batch_size=batch_size)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from flight import flight_steps
+from recorder import TRAJECTORY_COLUMNS, TrajectoryRecorder, open_trajectory, record_flight
+
+def test_growing_past_capacity_keeps_every_column_in_place(tmp_path):
+    path = tmp_path / 'grow.trj'
+    samples = np.arange(1000, dtype=np.float64)
+    expected = {name: samples + 10_000 * column for column, name in enumerate(TRAJECTORY_COLUMNS)}
+    with TrajectoryRecorder(path, capacity=3, chunk_size=7) as recorder:
+        for index in range(samples.size):
+            recorder.append({name: values[index] for name, values in expected.items()})
+    assert recorder.capacity == 3 * 512 # doubled nine times
+    trajectory = open_trajectory(path)
+    assert list(trajectory) == list(TRAJECTORY_COLUMNS)
+    for name, values in expected.items():
+        np.testing.assert_array_equal(trajectory[name], values)
+
+def test_recorded_flight_matches_the_step_stream(tmp_path):
+    path = tmp_path / 'flight.trj'
+    count = record_flight(path, 3, 50000.0, 50.0, 0.5, 120.0, every=3, chunk_size=16)
+    records = list(flight_steps(3, 50000.0, 50.0, 0.5, 120.0, every=3))
+    trajectory = open_trajectory(path)
+    assert count == len(records) == len(trajectory['time'])
+    for name in TRAJECTORY_COLUMNS:
+        np.testing.assert_array_equal(trajectory[name], [record[name] for record in records])
+
+@pytest.mark.parametrize('time_step, every', [(0.0, 1), (float('nan'), 1), (0.5, 0)])
+def test_bad_sampling_is_rejected_before_the_file_is_created(tmp_path, time_step, every):
+    path = tmp_path / 'bad.trj'
+    with pytest.raises(ValueError):
+        record_flight(path, 3, 50000.0, 50.0, time_step, 120.0, every=every)
+    assert not path.exists()
@@ -0,0 +1,42 @@
+import asyncio
+import json
+
+import server
+from app import run_batch
+from server import BatchingSimulator, route
+
+def simulate(*bodies):
+    """Routes POST /simulate bodies through one live batcher; returns their (status, payload) pairs."""
+    async def run():
+        simulator = BatchingSimulator(window=0.001)
+        batcher = asyncio.create_task(simulator.run())
+        try:
+            return [await asyncio.wait_for(route(simulator, 'POST', '/simulate', json.dumps(body).encode()), 10)
+                    for body in bodies]
+        finally:
+            batcher.cancel()
+    return asyncio.run(run())
+
+def test_overflowing_config_fails_alone_and_the_service_keeps_running():
+    (status, payload), (next_status, next_payload) = simulate({'astronauts': 10 ** 400}, {'astronauts': 3})
+    assert status == 200 and 'error' in payload['results'][0]
+    assert next_status == 200 and next_payload['results'][0]['success']
+
+def test_bad_config_in_a_batch_does_not_fail_its_neighbours():
+    status, payload = simulate({'runs': [{'astronauts': 3}, {'time_step': None}, {'thrust': 'fast'}]})[0]
+    assert status == 200
+    good, null_step, text_thrust = payload['results']
+    assert good['success'] and 'error' in null_step and 'error' in text_thrust
+
+def test_malformed_runs_are_rejected_with_400():
+    for body in ({'runs': 5}, {'runs': [1]}, [1, 2]):
+        status, payload = simulate(body)[0]
+        assert status == 400 and 'error' in payload
+
+def test_bad_config_is_dropped_before_the_shared_batch(monkeypatch):
+    calls = []
+    monkeypatch.setattr(server, 'run_batch', lambda configs: calls.append(len(configs)) or run_batch(configs))
+    status, payload = simulate({'runs': [{'astronauts': 3}] * 200 + [{'thrust': 'x'}]})[0]
+    assert status == 200 and calls == [200]
+    assert all(result['success'] for result in payload['results'][:200])
+    assert 'error' in payload['results'][200]
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from app import DEFAULT_SIM_DURATION, DEFAULT_TIME_STEP
+from flight import simulate_batch
+from solver import find_liftoff_boundary
+
+def succeeds(astronauts, thrust, fuel_burn=50.0):
+    """Whether one configuration lifts off at the solver's default step and duration."""
+    return bool(simulate_batch(astronauts, thrust, fuel_burn, DEFAULT_TIME_STEP, DEFAULT_SIM_DURATION)['success'])
+
+def test_thrust_boundary_brackets_the_flip_within_tolerance():
+    result = find_liftoff_boundary('thrust', astronauts=[0, 3, 12], fuel_burn=50.0, tolerance=0.5)
+    assert result['value'].shape == (3,) and result['bracketed'].all()
+    for astronauts, value, failing in zip([0, 3, 12], result['value'], result['failing']):
+        assert value - failing <= 0.5
+        assert succeeds(astronauts, value) and not succeeds(astronauts, failing)
+
+def test_astronaut_boundary_is_a_whole_number():
+    result = find_liftoff_boundary('astronauts', thrust=50000.0, fuel_burn=50.0)
+    value, failing = int(result['value']), int(result['failing'])
+    assert (value, failing) == (result['value'], result['failing']) and failing == value + 1
+    assert succeeds(value, 50000.0) and not succeeds(failing, 50000.0)
+
+def test_unbracketed_search_reports_nan():
+    result = find_liftoff_boundary('thrust', low=1e6, high=2e6)
+    assert not result['bracketed'] and np.isnan(result['value']) and np.isnan(result['failing'])
+    assert result['rounds'] == 0 and result['evaluations'] == 2
+
+def test_unknown_parameter_is_rejected():
+    with pytest.raises(ValueError):
+        find_liftoff_boundary('drag')
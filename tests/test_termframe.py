@@ -0,0 +1,133 @@
+import io
+import json
+import re
+import unicodedata
+
+import pytest
+
+from termframe import FrameBuffer, Timeline, write_asciicast
+
+CONTROL = re.compile(r'\033\[([0-9;?]*)([A-Za-z])')
+
+def replay(output, screen=None):
+    """Applies terminal output to a {(row, column): (style, glyph)} screen, like a minimal terminal would."""
+    screen = {} if screen is None else screen
+    row = column = 1
+    style = ''
+    index = 0
+    while index < len(output):
+        control = CONTROL.match(output, index)
+        if control:
+            arguments, command = control.groups()
+            if command == 'J':
+                screen.clear()
+            elif command == 'H':
+                row, column = (int(value) for value in arguments.split(';')) if arguments else (1, 1)
+            elif command == 'K':
+                for key in [key for key in screen if key[0] == row and key[1] >= column]:
+                    del screen[key]
+            elif command == 'm':
+                style = '' if arguments == '0' else style + control.group(0)
+            index = control.end()
+            continue
+        char = output[index]
+        index += 1
+        if char == '\n':
+            row, column = row + 1, 1
+            continue
+        screen[row, column] = (style, char)
+        if unicodedata.east_asian_width(char) in 'WF':
+            screen[row, column + 1] = (style, '')
+            column += 1
+        column += 1
+    return screen
+
+FRAMES = [
+    ['Mission control', '  altitude: 0 m', '\033[31mWARNING\033[0m fuel low', 'rocket 火箭 ready'],
+    ['Mission control', '  altitude: 7 m', '\033[31mWARNING\033[0m fuel low', 'rocket 火箭 ready'],
+    ['Mission control', '  altitude: 1234 m', '\033[32mNOMINAL\033[0m fuel ok', 'rocket 火星 away!'],
+    ['Mission control', '  altitude: 9 m', 'done'],
+    ['Mission complete', '', 'done', 'extra line', '\033[1m火\033[0m'],
+]
+
+def test_diffed_frames_leave_the_same_screen_as_full_redraws():
+    buffer = FrameBuffer(io.StringIO(), height=40)
+    screen = {}
+    for lines in FRAMES:
+        replay(buffer.render(lines), screen)
+        assert screen == replay(FrameBuffer(io.StringIO(), height=40).render(lines))
+
+def test_small_change_sends_only_the_changed_cells():
+    buffer = FrameBuffer(io.StringIO(), height=40)
+    full = buffer.render(FRAMES[0])
+    update = buffer.render(FRAMES[1])
+    assert update == '\033[2;13H7\033[5;1H'
+    assert buffer.render(FRAMES[1]) == ''
+    assert buffer.bytes_written == len(full.encode('utf-8')) + len(update)
+
+def fake_time(costs=()):
+    """A clock, a sleep and a log of sleeps; sleeping and each cost in costs advance the clock."""
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    def spend(frame):
+        now[0] += dict(costs).get(frame, 0.0)
+
+    return (lambda: now[0]), sleep, sleeps, spend
+
+def test_timeline_sleeps_to_each_slot_without_drift():
+    clock, sleep, sleeps, spend = fake_time([('a', 0.25), ('b', 0.25)])
+    timeline = Timeline([('a', 1.0), ('b', 1.0), ('c', 0.5)], time_scale=2.0, clock=clock, sleep=sleep)
+    for frame in timeline:
+        spend(frame)
+    assert sleeps == [1.75, 1.75, 1.0]
+    assert (timeline.shown, timeline.dropped) == (3, 0)
+
+def test_timeline_drops_frames_whose_slot_passed_but_keeps_the_last():
+    clock, sleep, sleeps, spend = fake_time([('a', 3.5)])
+    timeline = Timeline([('a', 1.0), ('b', 1.0), ('c', 1.0), ('d', 1.0), ('e', 0.1)], clock=clock, sleep=sleep)
+    shown = []
+    for frame in timeline:
+        shown.append(frame)
+        spend(frame)
+    assert shown == ['a', 'd', 'e'] and timeline.dropped == 2
+
+    clock, sleep, sleeps, spend = fake_time([('a', 10.0)])
+    timeline = Timeline([('a', 1.0), ('b', 1.0), ('c', 1.0)], clock=clock, sleep=sleep)
+    shown = []
+    for frame in timeline:
+        shown.append(frame)
+        spend(frame)
+    assert shown == ['a', 'c'] and sleeps == []
+
+def test_timeline_scale_zero_shows_every_frame_without_waiting():
+    clock, sleep, sleeps, spend = fake_time([('a', 5.0), ('b', 5.0)])
+    timeline = Timeline([('a', 1.0), ('b', 1.0), ('c', 1.0)], time_scale=0, clock=clock, sleep=sleep)
+    shown = []
+    for frame in timeline:
+        shown.append(frame)
+        spend(frame)
+    assert shown == ['a', 'b', 'c'] and sleeps == [] and timeline.dropped == 0
+
+def test_timeline_rejects_negative_scale():
+    with pytest.raises(ValueError):
+        Timeline([], time_scale=-1)
+
+def test_asciicast_events_follow_the_frame_holds():
+    stream = io.StringIO()
+    duration = write_asciicast(stream, [(lines, 0.5) for lines in FRAMES], title='demo', time_scale=2.0)
+    header, *events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert header['version'] == 2 and header['title'] == 'demo'
+    assert (header['width'], header['height']) == (80, 24)
+    assert duration == 5.0 and events[-1][0] == 5.0
+    frame_events = events[1:-1]
+    assert [event[0] for event in frame_events] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    screen = {}
+    for timestamp, kind, data in frame_events:
+        assert kind == 'o' and '\n' not in data.replace('\r\n', '')
+        replay(data.replace('\r\n', '\n'), screen)
+    assert screen == replay(FrameBuffer(io.StringIO(), height=24).render(FRAMES[-1]))